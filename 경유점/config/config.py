@@ -3,10 +3,25 @@ TOLERANCE = 0.5
 LOOKAHEAD_MIN = 1.0
 LOOKAHEAD_MAX = 5.0
 GOAL_WEIGHT = 1.0
+# 장애물 반경 (m): 장애물 표면까지 거리(거리장 범위 밖에서는 가장 가까운 클러스터 중심점까지 거리)가
+# 이보다 작으면 STOP, 1.5배보다 작으면 SLOW_DOWN. 경로 간섭 판정과 격자 팽창의 기준이기도 함
 OBSTACLE_RADIUS = 0.5
 SPEED_FACTOR = 0.3
 STEERING_SMOOTHING = 0.7
 HEADING_SMOOTHING = 0.8
+GRID_RESOLUTION = 0.5  # 점유 격자 셀 크기 (m)
+GRID_INFLATION = 1.0  # 격자 팽창 반경 = OBSTACLE_RADIUS * GRID_INFLATION
+GRID_SIZE = 500.0  # 경로 계획 격자 한 변 (m)
+FIELD_MAX_DISTANCE = 5.0  # 거리장 계산 범위 (m), 이보다 먼 거리는 이 값으로 자름
+PATH_CACHE_SIZE = 64  # 대체 경로 LRU 캐시 최대 항목 수
+TURN_RADIUS = 5.0  # Hybrid A* 최소 회전 반경 (m)
+LATTICE_HEADINGS = 16  # Hybrid A* 방위 분할 수
+HYBRID_TIME_BUDGET = 0.05  # Hybrid A* 탐색 시간 상한 (초), 넘으면 격자 경로로 대신함
+ROLLOUT_SAMPLES = 2048  # 명령 선택 롤아웃 후보 수
+ROLLOUT_HORIZON = 8  # 롤아웃 길이 (걸음)
+ROLLOUT_SEED = 0  # 롤아웃 난수 seed (같은 seed, 같은 틱 순번, 같은 입력이면 같은 명령)
+CONTROL_RATE_HZ = 20.0  # 제어 루프 주기 (Hz)
+TELEMETRY_CAPACITY = 72000  # 속도/위치 기록 링 버퍼 용량 (20 Hz 기준 1시간)
 
 WEIGHT_FACTORS = {
     "D": 0.4,  # 오른쪽
@@ -0,0 +1,87 @@
+import math
+from typing import Any, Dict, Mapping
+
+# CONFIG_PARAMS 키별 (타입, 최솟값, 최댓값). 범위를 벗어난 값은 대시보드 설정 패널(update_config_values)처럼
+# 경계로 잘라서 쓰고, 타입이 다른 값은 거부한다. dict 값(WEIGHT_FACTORS)은 각 항목에 같은 범위를 적용한다.
+CONFIG_RANGES = {
+    'MOVE_STEP': (float, 0.01, None),
+    'TOLERANCE': (float, 0.1, None),
+    'OBSTACLE_RADIUS': (float, 0.1, None),
+    'LOOKAHEAD_MIN': (float, 0.1, None),
+    'LOOKAHEAD_MAX': (float, 1.0, None),
+    'GOAL_WEIGHT': (float, 0.0, None),
+    'SPEED_FACTOR': (float, 0.0, None),
+    'STEERING_SMOOTHING': (float, 0.0, 1.0),
+    'HEADING_SMOOTHING': (float, 0.0, 1.0),
+    'WEIGHT_FACTORS': (float, 0.0, None),
+    'DBSCAN_EPS': (float, 0.1, None),
+    'DBSCAN_MIN_SAMPLES': (int, 1, None),
+    'GRID_RESOLUTION': (float, 0.05, None),
+    'GRID_INFLATION': (float, 0.0, None),
+    'GRID_SIZE': (float, 1.0, None),
+    'FIELD_MAX_DISTANCE': (float, 0.1, None),
+    'PATH_CACHE_SIZE': (int, 1, None),
+    'TURN_RADIUS': (float, 0.1, None),
+    'LATTICE_HEADINGS': (int, 4, 360),
+    'HYBRID_TIME_BUDGET': (float, 0.001, None),
+    'ROLLOUT_SAMPLES': (int, 1, None),
+    'ROLLOUT_HORIZON': (int, 1, None),
+    'ROLLOUT_SEED': (int, 0, None),
+    'CONTROL_RATE_HZ': (float, 0.1, None)
+}
+
+# 정해진 값 중 하나만 받는 키
+CONFIG_CHOICES = {
+    'CLUSTER_BACKEND': ('dbscan', 'grid'),
+    'PATH_PLANNER': ('jps', 'dstar', 'hybrid')
+}
+
+
+def _check_value(name: str, value: Any, kind: type, lo, hi):
+    """값 하나의 타입 확인 후 [lo, hi]로 잘라서 반환. 타입이 다르거나 유한한 수가 아니면 ValueError."""
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        raise ValueError(f"{name} must be a number, got {type(value).__name__}")
+    if kind is int:
+        if isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"{name} must be an integer, got {value}")
+        value = int(value)
+    else:
+        value = float(value)
+        if not math.isfinite(value):
+            raise ValueError(f"{name} must be finite, got {value}")
+    if lo is not None:
+        value = max(lo, value)
+    if hi is not None:
+        value = min(hi, value)
+    return value
+
+
+def validate_config(current: Mapping[str, Any], updates: Mapping[str, Any]) -> Dict[str, Any]:
+    """/config 요청 값(updates)을 현재 CONFIG_PARAMS(current) 기준으로 검사해서 반영할 값 dict 반환.
+
+    모르는 키, 타입이 다른 값, 허용하지 않는 선택값은 ValueError(400 응답).
+    dict 값은 바꾸려는 항목만 담아도 되며(나머지는 StateStore.update_config가 유지), 모르는 항목은 거부한다.
+    """
+    unknown = sorted(set(updates) - set(current))
+    if unknown:
+        raise ValueError(f"Unknown config keys: {unknown}")
+
+    checked: Dict[str, Any] = {}
+    for name, value in updates.items():
+        if name in CONFIG_CHOICES:
+            if value not in CONFIG_CHOICES[name]:
+                raise ValueError(f"{name} must be one of {list(CONFIG_CHOICES[name])}, got {value!r}")
+            checked[name] = value
+        elif isinstance(current[name], Mapping):
+            if not isinstance(value, Mapping):
+                raise ValueError(f"{name} must be an object, got {type(value).__name__}")
+            unknown = sorted(set(value) - set(current[name]))
+            if unknown:
+                raise ValueError(f"Unknown {name} keys: {unknown}")
+            kind, lo, hi = CONFIG_RANGES[name]
+            checked[name] = {k: _check_value(f"{name}.{k}", v, kind, lo, hi) for k, v in value.items()}
+        elif name in CONFIG_RANGES:
+            checked[name] = _check_value(name, value, *CONFIG_RANGES[name])
+        else:
+            checked[name] = value
+    return checked
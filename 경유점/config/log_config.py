@@ -0,0 +1,137 @@
+import sys
+import json
+import time
+import queue
+import atexit
+import logging
+import threading
+import logging.handlers
+from typing import Any, Dict, Optional, Tuple
+
+# LogRecord 기본 속성 (JSON 형식에서 extra 필드만 골라낼 때 씀)
+_RECORD_FIELDS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime"}
+
+_listener: Optional[logging.handlers.QueueListener] = None
+_setup_lock = threading.Lock()
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 JSON 객체 하나 (ts, level, logger, thread, msg + extra 필드)."""
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": round(record.created, 6),
+            "level": record.levelname,
+            "logger": record.name,
+            "thread": record.threadName,
+            "msg": record.getMessage()
+        }
+        entry.update({k: v for k, v in vars(record).items() if k not in _RECORD_FIELDS})
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐가 가득 차면 기다리지 않고 버리는 QueueHandler (버린 수는 dropped)."""
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class RateLimitedLogger:
+    """틱마다 호출되는 로그용: 같은 메시지 템플릿은 interval초에 한 번만 남기고, 건너뛴 수를 붙인다.
+
+    수준이 꺼져 있으면 isEnabledFor() 한 번으로 끝나서 인자 포맷 비용이 없다.
+    """
+    def __init__(self, logger: logging.Logger, interval: Optional[float] = None):
+        self.logger = logger
+        self.interval = interval
+        self._last: Dict[str, Tuple[float, int]] = {}
+
+    def _interval(self) -> float:
+        if self.interval is not None:
+            return self.interval
+        from config.shared_config import LOG_CONFIG
+        return LOG_CONFIG.get('tick_log_interval', 1.0)
+
+    def log(self, level: int, msg: str, *args: Any):
+        if not self.logger.isEnabledFor(level):
+            return
+        now = time.monotonic()
+        last, suppressed = self._last.get(msg, (0.0, 0))
+        if now - last < self._interval():
+            self._last[msg] = (last, suppressed + 1)
+            return
+        self._last[msg] = (now, 0)
+        if suppressed:
+            self.logger.log(level, msg + " (+%d suppressed)", *args, suppressed)
+        else:
+            self.logger.log(level, msg, *args)
+
+    def debug(self, msg: str, *args: Any):
+        self.log(logging.DEBUG, msg, *args)
+
+    def info(self, msg: str, *args: Any):
+        self.log(logging.INFO, msg, *args)
+
+    def warning(self, msg: str, *args: Any):
+        self.log(logging.WARNING, msg, *args)
+
+
+def tick_logger(name: str) -> RateLimitedLogger:
+    """모듈 로거를 감싼 틱 로그용 RateLimitedLogger (간격은 LOG_CONFIG['tick_log_interval'])."""
+    return RateLimitedLogger(logging.getLogger(name))
+
+
+def setup_logging(config: Optional[Dict[str, Any]] = None) -> logging.handlers.QueueListener:
+    """루트 로거를 큐 + 백그라운드 기록 스레드로 설정 (프로세스마다 한 번, 다시 부르면 기존 것 반환).
+
+    로그를 남기는 스레드는 레코드를 큐에 넣기만 하고, 포맷과 stdout/파일 출력은 QueueListener
+    스레드가 한다. 모듈별 수준은 config['levels'] (로거 이름 = 모듈 경로).
+    """
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            return _listener
+        if config is None:
+            from config.shared_config import LOG_CONFIG
+            config = LOG_CONFIG
+
+        if config.get('format') == 'json':
+            formatter: logging.Formatter = JsonFormatter()
+        else:
+            formatter = logging.Formatter("%(asctime)s %(levelname)s %(name)s [%(threadName)s] %(message)s")
+        handlers = [logging.StreamHandler(sys.stdout)]
+        if config.get('file'):
+            handlers.append(logging.FileHandler(config['file'], encoding="utf-8"))
+        for handler in handlers:
+            handler.setFormatter(formatter)
+
+        log_queue: queue.Queue = queue.Queue(config.get('queue_size', 10000))
+        root = logging.getLogger()
+        for handler in list(root.handlers):
+            root.removeHandler(handler)
+        root.addHandler(DroppingQueueHandler(log_queue))
+        root.setLevel(config.get('level', 'INFO'))
+        for name, level in config.get('levels', {}).items():
+            logging.getLogger(name).setLevel(level)
+
+        _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(stop_logging)
+        return _listener
+
+
+def stop_logging():
+    """큐에 남은 레코드를 모두 쓰고 기록 스레드 종료."""
+    global _listener
+    with _setup_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
@@ -0,0 +1,235 @@
+import time
+import bisect
+import threading
+from functools import wraps
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 처리 시간 히스토그램 버킷 상한 (초): 5 µs ~ 10 s, 1-2-5 간격
+LATENCY_BUCKETS = (5e-6, 1e-5, 2e-5, 5e-5, 1e-4, 2e-4, 5e-4, 1e-3, 2e-3, 5e-3,
+                   1e-2, 2e-2, 5e-2, 0.1, 0.2, 0.5, 1.0, 2.0, 5.0, 10.0)
+
+_Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: _Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    items = list(labels) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+
+class Counter:
+    """단조 증가 값 (프레임 수, 버린 수, 락 대기 시간 합 등)."""
+    __slots__ = ('value', '_lock')
+
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+
+class Histogram:
+    """고정 버킷 히스토그램. observe()는 이분 탐색 한 번 + 카운트 증가라서 틱마다 불러도 싸다.
+
+    분위수(p50/p95/p99)는 Prometheus histogram_quantile과 같은 방식(버킷 안 선형 보간)으로 추정한다.
+    """
+    __slots__ = ('buckets', 'counts', 'count', 'sum', '_lock')
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막 칸은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        i = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[i] += 1
+            self.count += 1
+            self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """q 분위수 추정값 (관측이 없으면 None)."""
+        with self._lock:
+            counts = list(self.counts)
+            total = self.count
+        if not total:
+            return None
+        rank = q * total
+        cumulative = 0
+        for i, n in enumerate(counts):
+            if n and cumulative + n >= rank:
+                if i == len(self.buckets):
+                    return self.buckets[-1]
+                lower = self.buckets[i - 1] if i > 0 else 0.0
+                return lower + (self.buckets[i] - lower) * (rank - cumulative) / n
+            cumulative += n
+        return self.buckets[-1]
+
+
+class Timer:
+    """with 블록 하나의 시간을 히스토그램에 기록 (time.perf_counter)."""
+    __slots__ = ('histogram', 'started')
+
+    def __init__(self, histogram: Histogram):
+        self.histogram = histogram
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.started)
+        return False
+
+
+class TimedLock:
+    """threading.Lock 대신 쓰는 락: 얻기까지 기다린 시간을 카운터(초 합)와 히스토그램에 더한다."""
+    __slots__ = ('_lock', 'wait_seconds', 'wait_histogram', 'acquisitions')
+
+    def __init__(self, name: str, registry: Optional['MetricsRegistry'] = None):
+        registry = registry or METRICS
+        self._lock = threading.Lock()
+        self.wait_seconds = registry.counter("tank_lock_wait_seconds_total", "Time spent waiting for locks", lock=name)
+        self.acquisitions = registry.counter("tank_lock_acquisitions_total", "Lock acquisitions", lock=name)
+        self.wait_histogram = registry.histogram("tank_lock_wait_seconds", "Lock wait time", lock=name)
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(False):
+            waited = 0.0
+        else:
+            started = time.perf_counter()
+            if not self._lock.acquire(blocking, timeout):
+                return False
+            waited = time.perf_counter() - started
+        self.acquisitions.inc()
+        if waited:
+            self.wait_seconds.inc(waited)
+        self.wait_histogram.observe(waited)
+        return True
+
+    def release(self):
+        self._lock.release()
+
+    def locked(self) -> bool:
+        return self._lock.locked()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+
+class MetricsRegistry:
+    """프로세스 전체 지표 모음. 이름 + 레이블 조합마다 Counter/Histogram 하나 (처음 요청할 때 생성).
+
+    레이블 값은 단계/락/종류 이름처럼 개수가 정해진 것만 쓴다 (세션 ID 등은 넣지 않음).
+    """
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._help: Dict[str, Tuple[str, str]] = {}  # 이름 -> (type, help)
+        self._counters: Dict[Tuple[str, _Labels], Counter] = {}
+        self._histograms: Dict[Tuple[str, _Labels], Histogram] = {}
+
+    def counter(self, name: str, help_text: str = "", **labels: str) -> Counter:
+        key = (name, tuple(sorted(labels.items())))
+        counter = self._counters.get(key)
+        if counter is None:
+            with self._lock:
+                counter = self._counters.setdefault(key, Counter())
+                self._help.setdefault(name, ("counter", help_text))
+        return counter
+
+    def histogram(self, name: str, help_text: str = "", buckets: Tuple[float, ...] = LATENCY_BUCKETS,
+                  **labels: str) -> Histogram:
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.setdefault(key, Histogram(buckets))
+                self._help.setdefault(name, ("histogram", help_text))
+        return histogram
+
+    def stage(self, stage: str) -> Histogram:
+        """단계 처리 시간 히스토그램 (tank_stage_seconds{stage=...})."""
+        return self.histogram("tank_stage_seconds", "Processing time per stage", stage=stage)
+
+    def timer(self, stage: str) -> Timer:
+        """with METRICS.timer("stage"): ... 로 블록 시간 기록."""
+        return Timer(self.stage(stage))
+
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (0.0.4)."""
+        lines: List[str] = []
+        with self._lock:
+            counters = sorted(self._counters.items())
+            histograms = sorted(self._histograms.items(), key=lambda item: item[0])
+            help_map = dict(self._help)
+        described = set()
+
+        def describe(name: str):
+            if name not in described:
+                kind, help_text = help_map[name]
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} {kind}")
+                described.add(name)
+
+        for (name, labels), counter in counters:
+            describe(name)
+            lines.append(f"{name}{_format_labels(labels)} {counter.value:.9g}")
+        for (name, labels), histogram in histograms:
+            describe(name)
+            with histogram._lock:
+                counts = list(histogram.counts)
+                total, value_sum = histogram.count, histogram.sum
+            cumulative = 0
+            for bound, n in zip(histogram.buckets, counts):
+                cumulative += n
+                lines.append(f"{name}_bucket{_format_labels(labels, ('le', f'{bound:g}'))} {cumulative}")
+            lines.append(f"{name}_bucket{_format_labels(labels, ('le', '+Inf'))} {total}")
+            lines.append(f"{name}_sum{_format_labels(labels)} {value_sum:.9g}")
+            lines.append(f"{name}_count{_format_labels(labels)} {total}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> Dict[str, Dict[str, Dict[str, Optional[float]]]]:
+        """대시보드용 요약: 단계별 count/p50/p95/p99(ms)와 카운터 값 (레이블 값 기준)."""
+        with self._lock:
+            histograms = list(self._histograms.items())
+            counters = list(self._counters.items())
+        stages = {}
+        for (name, labels), histogram in histograms:
+            if name != "tank_stage_seconds":
+                continue
+            ms = lambda q: round(histogram.quantile(q) * 1000.0, 3) if histogram.count else None
+            stages[dict(labels)["stage"]] = {"count": histogram.count, "p50": ms(0.5), "p95": ms(0.95), "p99": ms(0.99)}
+        totals: Dict[str, Dict[str, float]] = {}
+        for (name, labels), counter in counters:
+            label = ",".join(v for _, v in labels) or "total"
+            totals.setdefault(name, {})[label] = round(counter.value, 6)
+        return {"stages": dict(sorted(stages.items())), "counters": totals}
+
+
+METRICS = MetricsRegistry()
+
+
+def timed(stage: str) -> Callable:
+    """함수/메서드 호출 시간을 tank_stage_seconds{stage=...}에 기록하는 데코레이터."""
+    def decorator(fn: Callable) -> Callable:
+        histogram = METRICS.stage(stage)
+
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                histogram.observe(time.perf_counter() - started)
+        return wrapper
+    return decorator
@@ -0,0 +1,136 @@
+import threading
+import numpy as np
+from typing import Optional, Sequence, Tuple, Union
+
+
+class RingBuffer:
+    """고정 용량 NumPy 링 버퍼 (텔레메트리 기록용).
+
+    저장 공간은 처음에 한 번만 (2 * capacity, columns) 크기로 잡고, 각 행을 i와 i + capacity
+    두 곳에 쓴다(거울 쓰기). 따라서
+    - append(): 복사나 재할당 없이 O(1)
+    - last(n): 최근 n개가 항상 연속 구간이라서 복사 없는 읽기 전용 뷰
+    가 된다. count(지금까지 넣은 총 개수)는 행을 다 쓴 다음에 올리므로 읽는 쪽은 락 없이
+    count를 한 번 읽고 그 앞까지만 보면 된다. 뷰를 오래 들고 있으면 가장 오래된 행은 이후
+    append로 덮어써질 수 있으니, 오래 보관할 값은 np.array(view)로 복사한다.
+    storage/counter를 넘기면 외부 메모리(예: 공유 메모리)를 그대로 저장 공간으로 쓴다.
+    """
+    def __init__(self, capacity: int, columns: int = 1, dtype=np.float64,
+                 storage: Optional[np.ndarray] = None, counter: Optional[np.ndarray] = None):
+        if capacity < 1:
+            raise ValueError("RingBuffer capacity must be >= 1")
+        self.capacity = int(capacity)
+        self.columns = int(columns)
+        shape = (2 * self.capacity, self.columns)
+        if storage is None:
+            storage = np.zeros(shape, dtype=dtype)
+        elif storage.shape != shape:
+            raise ValueError(f"RingBuffer storage shape {storage.shape} != {shape}")
+        self._data = storage
+        self._count = counter if counter is not None else np.zeros(1, dtype=np.int64)
+        self._write_lock = threading.Lock()  # 쓰는 쪽끼리만 (읽기는 락 없음)
+
+    @classmethod
+    def nbytes_for(cls, capacity: int, columns: int = 1, dtype=np.float64) -> int:
+        """storage에 필요한 바이트 수."""
+        return 2 * int(capacity) * int(columns) * np.dtype(dtype).itemsize
+
+    @property
+    def count(self) -> int:
+        """지금까지 넣은 총 개수 (용량을 넘어도 계속 증가, 변경 여부 확인용 버전으로 씀)."""
+        return int(self._count[0])
+
+    @property
+    def nbytes(self) -> int:
+        return self._data.nbytes
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, value: Union[float, Sequence[float]]):
+        """한 행 추가 (O(1))."""
+        with self._write_lock:
+            count = int(self._count[0])
+            i = count % self.capacity
+            self._data[i] = value
+            self._data[i + self.capacity] = value
+            self._count[0] = count + 1
+
+    def extend(self, values: Union[np.ndarray, Sequence]):
+        """여러 행을 한 번에 추가. 용량보다 많으면 마지막 capacity개만 남는다."""
+        values = np.asarray(values, dtype=self._data.dtype).reshape(-1, self.columns)
+        if not len(values):
+            return
+        with self._write_lock:
+            count = int(self._count[0])
+            total = count + len(values)
+            values = values[-self.capacity:]
+            idx = np.arange(total - len(values), total) % self.capacity
+            self._data[idx] = values
+            self._data[idx + self.capacity] = values
+            self._count[0] = total
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        """최근 n개(기본: 전부)의 읽기 전용 뷰, 오래된 것부터. columns == 1이면 1차원."""
+        count = int(self._count[0])
+        size = min(count, self.capacity)
+        n = size if n is None else max(0, min(int(n), size))
+        end = count % self.capacity + self.capacity
+        view = self._data[end - n:end]
+        if self.columns == 1:
+            view = view[:, 0]
+        view.flags.writeable = False
+        return view
+
+    def latest(self, default=None) -> Union[float, Tuple[float, ...], None]:
+        """가장 최근 행 (columns == 1이면 float, 아니면 튜플). 비어 있으면 default."""
+        count = int(self._count[0])
+        if count == 0:
+            return default
+        row = self._data[(count - 1) % self.capacity]
+        return float(row[0]) if self.columns == 1 else tuple(float(v) for v in row)
+
+    def clear(self):
+        with self._write_lock:
+            self._count[0] = 0
+
+    def view(self) -> 'RingView':
+        """쓰기 메서드가 없는 읽기 전용 핸들 (StateStore 스냅샷에 들어가는 값)."""
+        return RingView(self)
+
+
+class RingView:
+    """RingBuffer의 읽기 전용 핸들.
+
+    저장 공간을 복사하지 않고 공유하므로 스냅샷 안의 값이라도 이후 append가 보인다(추가만 되는 기록).
+    한 시점의 값이 필요하면 count를 같이 읽거나 np.array(last())로 복사한다.
+    """
+    __slots__ = ('_ring',)
+
+    def __init__(self, ring: RingBuffer):
+        self._ring = ring
+
+    @property
+    def capacity(self) -> int:
+        return self._ring.capacity
+
+    @property
+    def columns(self) -> int:
+        return self._ring.columns
+
+    @property
+    def count(self) -> int:
+        return self._ring.count
+
+    @property
+    def nbytes(self) -> int:
+        return self._ring.nbytes
+
+    def __len__(self) -> int:
+        return len(self._ring)
+
+    def last(self, n: Optional[int] = None) -> np.ndarray:
+        return self._ring.last(n)
+
+    def latest(self, default=None) -> Union[float, Tuple[float, ...], None]:
+        return self._ring.latest(default)
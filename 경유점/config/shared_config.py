@@ -1,62 +1,106 @@
-import threading
+from typing import Any, Dict
+from config.state_store import StateStore
+from config.ring_buffer import RingBuffer
 from config.config import (
     MOVE_STEP, TOLERANCE, LOOKAHEAD_MIN, LOOKAHEAD_MAX, GOAL_WEIGHT,
-    OBSTACLE_RADIUS, SPEED_FACTOR, STEERING_SMOOTHING, HEADING_SMOOTHING, WEIGHT_FACTORS
+    OBSTACLE_RADIUS, SPEED_FACTOR, STEERING_SMOOTHING, HEADING_SMOOTHING, WEIGHT_FACTORS,
+    GRID_RESOLUTION, GRID_INFLATION, GRID_SIZE, FIELD_MAX_DISTANCE, PATH_CACHE_SIZE,
+    TURN_RADIUS, LATTICE_HEADINGS, HYBRID_TIME_BUDGET, ROLLOUT_SAMPLES, ROLLOUT_HORIZON,
+    ROLLOUT_SEED, CONTROL_RATE_HZ, TELEMETRY_CAPACITY
 )
 
-# 로깅 설정
-import logging
-logging.basicConfig(level=logging.DEBUG)
 
-# 전역 상태
-SHARED = {
-    'speed_data': [],
-    'del_playerPos_x': [],
-    'del_playerPos_z': [],
-    'player_pos': [],
-    # 방향 좌표 구하기기  물론 위의 player x,z도 사용할 것
-    'enemy_pos': [], # 이중 x,z만 사용 예정
-    'player_turret_x': [],
-    'enemy_turret_x': [], # 포신 각도로 방향벡터 설정/ 참고로 각도임임
-    
-    'lidar_points': [],  # 필터링된 LiDAR 포인트
-    'obstacle_clusters': [],  # DBSCAN 클러스터
-    'tank_tar_val_kh': 0.0,
-    'pid': {
-        'kp': 0.5,
-        'ki': 0.0,
-        'kd': 0.0,
-        'integral': 0.0,
-        'prev_error': 0.0
-    },
-    'CONFIG_PARAMS': {
-        'MOVE_STEP': MOVE_STEP,
-        'TOLERANCE': TOLERANCE,
-        'LOOKAHEAD_MIN': LOOKAHEAD_MIN,
-        'LOOKAHEAD_MAX': LOOKAHEAD_MAX,
-        'GOAL_WEIGHT': GOAL_WEIGHT,
-        'OBSTACLE_RADIUS': OBSTACLE_RADIUS,
-        'SPEED_FACTOR': SPEED_FACTOR,
-        'STEERING_SMOOTHING': STEERING_SMOOTHING,
-        'HEADING_SMOOTHING': HEADING_SMOOTHING,
-        'WEIGHT_FACTORS': WEIGHT_FACTORS.copy(),
-        'DBSCAN_EPS': 1.0,  # layout.py에서 기본값
-        'DBSCAN_MIN_SAMPLES': 3  # layout.py에서 기본값
+def initial_state() -> Dict[str, Any]:
+    """새 상태 저장소의 초기값 (기록 버퍼는 매번 새로 할당). 세션마다 한 벌씩 만든다."""
+    return {
+        # 텔레메트리 기록: 고정 용량 링 버퍼 (제자리에 append, 읽기는 last(n) 뷰)
+        'speed_data': RingBuffer(TELEMETRY_CAPACITY),  # km/h
+        'del_playerPos': RingBuffer(TELEMETRY_CAPACITY, columns=2),  # (ΔX, ΔZ)
+        'player_pos': RingBuffer(TELEMETRY_CAPACITY, columns=2),  # (x, z)
+        # 방향 좌표 구하기기  물론 위의 player x,z도 사용할 것
+        'enemy_pos': [], # 이중 x,z만 사용 예정
+        'player_turret_x': [],
+        'enemy_turret_x': [], # 포신 각도로 방향벡터 설정/ 참고로 각도임임
+
+        'lidar_points': [],  # 필터링된 LiDAR 포인트
+        'obstacle_clusters': [],  # ClusterStore (첫 프레임 전에는 빈 리스트)
+        'spatial_index': None,  # 현재 프레임의 FrameSpatialIndex (버전 포함)
+        'distance_field': None,  # 현재 맵의 DistanceField (부호 있는 거리장 스냅샷)
+        'tank_tar_val_kh': 0.0,
+        'pid': {
+            'kp': 0.5,
+            'ki': 0.0,
+            'kd': 0.0,
+            'integral': 0.0,
+            'prev_error': 0.0
+        },
+        'CONFIG_PARAMS': {
+            'MOVE_STEP': MOVE_STEP,
+            'TOLERANCE': TOLERANCE,
+            'LOOKAHEAD_MIN': LOOKAHEAD_MIN,
+            'LOOKAHEAD_MAX': LOOKAHEAD_MAX,
+            'GOAL_WEIGHT': GOAL_WEIGHT,
+            'OBSTACLE_RADIUS': OBSTACLE_RADIUS,
+            'SPEED_FACTOR': SPEED_FACTOR,
+            'STEERING_SMOOTHING': STEERING_SMOOTHING,
+            'HEADING_SMOOTHING': HEADING_SMOOTHING,
+            'WEIGHT_FACTORS': WEIGHT_FACTORS.copy(),
+            'DBSCAN_EPS': 1.0,  # layout.py에서 기본값
+            'DBSCAN_MIN_SAMPLES': 3,  # layout.py에서 기본값
+            'CLUSTER_BACKEND': 'dbscan',  # 'dbscan' 또는 'grid' (공간 해시 연결 요소)
+            'GRID_RESOLUTION': GRID_RESOLUTION,
+            'GRID_INFLATION': GRID_INFLATION,
+            'GRID_SIZE': GRID_SIZE,
+            'FIELD_MAX_DISTANCE': FIELD_MAX_DISTANCE,
+            'PATH_CACHE_SIZE': PATH_CACHE_SIZE,
+            'TURN_RADIUS': TURN_RADIUS,
+            'LATTICE_HEADINGS': LATTICE_HEADINGS,
+            'HYBRID_TIME_BUDGET': HYBRID_TIME_BUDGET,
+            'ROLLOUT_SAMPLES': ROLLOUT_SAMPLES,
+            'ROLLOUT_HORIZON': ROLLOUT_HORIZON,
+            'ROLLOUT_SEED': ROLLOUT_SEED,
+            'CONTROL_RATE_HZ': CONTROL_RATE_HZ,
+            # 'jps' (매번 새로 탐색), 'dstar' (맵 변경분만 증분 재계획), 'hybrid' (회전 반경을 지키는 Hybrid A*)
+            'PATH_PLANNER': 'jps'
+        }
     }
-}
 
-# 스레드 안전성을 위한 락
-SHARED_LOCK = threading.Lock()
+
+# 전역 상태(기본 세션): 불변 스냅샷을 교체하는 저장소 (읽기는 SHARED[key] 또는 SHARED.snapshot(),
+# 쓰기는 SHARED.publish(...) / SHARED.update(...) / SHARED.update_config(...))
+SHARED = StateStore(initial_state())
 
 # 서버 설정
 SERVER_CONFIG = {
     'flask_host': '0.0.0.0',
     'flask_port': 5050,
-    'dash_port': 8050
+    'dash_port': 8050,
+    'session_idle_timeout': 300.0,  # 이 시간(초) 동안 요청이 없는 전차 세션은 정리 (기본 세션 제외)
+    'session_shards': 16,  # 세션 테이블 락 분할 수
+    'max_sessions': 64,  # 동시에 유지할 최대 세션 수
+    'asgi_workers': 4,  # ASGI 서버에서 인지/계획을 돌리는 작업 스레드 수
+    'stream_port': 5060,  # 스트리밍 제어 채널(길이 접두 TCP) 포트
+    'stream_max_frame': 16 * 1024 * 1024  # 스트리밍 채널 메시지 최대 크기 (바이트)
 }
 
 # 그래프 설정
 GRAPH_CONFIG = {
     'max_points': 100,
     'max_speed': 80
-}
\ No newline at end of file
+}
+# 로깅 설정 (config/log_config.py의 setup_logging()이 읽음)
+LOG_CONFIG = {
+    'level': 'INFO',  # 루트 로거 수준
+    'levels': {  # 모듈별 수준 (로거 이름 = 모듈 경로), 틱마다 도는 모듈의 DEBUG는 필요할 때만 켠다
+        'navigation.position_handler': 'INFO',
+        'navigation.purepursuit': 'INFO',
+        'navigation.pid_controller': 'INFO',
+        'navigation.navigation': 'INFO',
+        'navigation.obstacle': 'INFO',
+        'werkzeug': 'WARNING'  # 요청마다 찍히는 Flask 접근 로그
+    },
+    'format': 'text',  # 'text' 또는 'json' (한 줄에 JSON 객체 하나)
+    'file': None,  # 경로를 주면 파일에도 기록 (예: 'logs/navigation.log')
+    'queue_size': 10000,  # 기록 스레드 큐 크기 (가득 차면 버림)
+    'tick_log_interval': 1.0  # 틱마다 나오는 메시지는 같은 메시지당 이 간격(초)에 한 번만
+}
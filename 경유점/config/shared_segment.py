@@ -0,0 +1,142 @@
+import json
+import time
+import numpy as np
+from multiprocessing import shared_memory
+from typing import Any, Dict, Optional, Tuple
+from config.ring_buffer import RingBuffer
+
+# 헤더 (int64) 칸 번호
+_MAGIC, _SEQ, _CAPACITY, _MAX_POINTS, _MAX_CLUSTERS, _STATE_BYTES, \
+    _N_POINTS, _N_CLUSTERS, _STATE_LEN, _CLUSTER_VERSION = range(10)
+_HEADER_SLOTS = 16
+_MAGIC_VALUE = 0x54414E4B  # 'TANK'
+
+# 링 버퍼 이름과 열 수 (shared_config.initial_state()의 텔레메트리 키와 같음)
+RINGS = (("speed_data", 1), ("del_playerPos", 2), ("player_pos", 2))
+
+
+def _layout(capacity: int, max_points: int, max_clusters: int, state_bytes: int) -> Tuple[Dict[str, Tuple[int, tuple, Any]], int]:
+    """영역 이름 -> (바이트 오프셋, shape, dtype), 전체 크기."""
+    regions = [("header", (_HEADER_SLOTS,), np.int64), ("counters", (len(RINGS),), np.int64)]
+    regions += [(name, (2 * capacity, columns), np.float64) for name, columns in RINGS]
+    regions += [("points", (max_points, 2), np.float64), ("offsets", (max_clusters + 1,), np.int64),
+                ("state", (state_bytes,), np.uint8)]
+    layout = {}
+    offset = 0
+    for name, shape, dtype in regions:
+        layout[name] = (offset, shape, dtype)
+        offset += int(np.prod(shape)) * np.dtype(dtype).itemsize
+        offset = (offset + 63) // 64 * 64  # 캐시 라인 정렬
+    return layout, offset
+
+
+class SharedSegment:
+    """내비게이션 프로세스와 대시보드 프로세스가 함께 보는 공유 메모리 상태 구역.
+
+    - 텔레메트리 링 버퍼(RINGS): 저장 공간과 count가 구역 안에 있어서 쓰는 쪽 append가 그대로 보인다.
+    - 장애물 클러스터(포인트 + 오프셋)와 상태 JSON(CONFIG_PARAMS, pid, 목표 속도): seqlock으로 보호.
+      쓰는 쪽은 seq를 홀수로 올리고 쓴 뒤 다시 짝수로 올리며, 읽는 쪽은 seq가 짝수이고 읽기 전후로
+      같을 때만 결과를 받아들인다 (쓰는 쪽은 하나, 읽는 쪽은 락 없이 재시도).
+    """
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self.shm = shm
+        self.owner = owner
+        header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        if header[_MAGIC] != _MAGIC_VALUE:
+            raise ValueError(f"Shared segment {shm.name} is not a state segment")
+        self.capacity = int(header[_CAPACITY])
+        self.max_points = int(header[_MAX_POINTS])
+        self.max_clusters = int(header[_MAX_CLUSTERS])
+        self.state_bytes = int(header[_STATE_BYTES])
+        layout, _ = _layout(self.capacity, self.max_points, self.max_clusters, self.state_bytes)
+        self._arrays = {name: np.ndarray(shape, dtype=dtype, buffer=shm.buf, offset=offset)
+                        for name, (offset, shape, dtype) in layout.items()}
+        self.header = self._arrays["header"]
+
+    @property
+    def name(self) -> str:
+        return self.shm.name
+
+    @classmethod
+    def create(cls, capacity: int, max_points: int = 16384, max_clusters: int = 1024,
+               state_bytes: int = 16384) -> 'SharedSegment':
+        _, size = _layout(capacity, max_points, max_clusters, state_bytes)
+        shm = shared_memory.SharedMemory(create=True, size=size)
+        header = np.ndarray((_HEADER_SLOTS,), dtype=np.int64, buffer=shm.buf)
+        header[:] = 0
+        header[_CAPACITY] = capacity
+        header[_MAX_POINTS] = max_points
+        header[_MAX_CLUSTERS] = max_clusters
+        header[_STATE_BYTES] = state_bytes
+        header[_MAGIC] = _MAGIC_VALUE
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> 'SharedSegment':
+        """만든 프로세스의 자식 프로세스에서 붙음 (resource tracker를 공유하므로 정리는 만든 쪽 unlink 한 번)."""
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    def ring(self, name: str) -> RingBuffer:
+        """구역 안의 저장 공간과 count를 쓰는 RingBuffer."""
+        index = [ring for ring, _ in RINGS].index(name)
+        storage = self._arrays[name]
+        return RingBuffer(self.capacity, storage.shape[1], storage=storage,
+                          counter=self._arrays["counters"][index:index + 1])
+
+    @property
+    def seq(self) -> int:
+        return int(self.header[_SEQ])
+
+    def write(self, points: np.ndarray, offsets: np.ndarray, cluster_version: int, state: Dict[str, Any]):
+        """클러스터와 상태를 seqlock 안에서 기록 (쓰는 쪽은 한 스레드만)."""
+        payload = json.dumps(state).encode("utf-8")
+        if len(payload) > self.state_bytes:
+            raise ValueError(f"State payload {len(payload)} bytes exceeds {self.state_bytes}")
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        if len(points) > self.max_points or len(offsets) - 1 > self.max_clusters:
+            # 너무 큰 프레임은 앞쪽 클러스터만 싣는다 (대시보드 표시용)
+            keep = int(np.searchsorted(offsets, self.max_points, side="right")) - 1
+            keep = max(0, min(keep, self.max_clusters))
+            offsets = offsets[:keep + 1]
+            points = points[:offsets[-1]]
+        seq = int(self.header[_SEQ])
+        self.header[_SEQ] = seq + 1
+        self._arrays["points"][:len(points)] = points
+        self._arrays["offsets"][:len(offsets)] = offsets
+        self._arrays["state"][:len(payload)] = np.frombuffer(payload, dtype=np.uint8)
+        self.header[_N_POINTS] = len(points)
+        self.header[_N_CLUSTERS] = len(offsets) - 1
+        self.header[_STATE_LEN] = len(payload)
+        self.header[_CLUSTER_VERSION] = cluster_version
+        self.header[_SEQ] = seq + 2
+
+    def read(self, since: int = -1, retries: int = 100) -> Optional[Tuple[int, np.ndarray, np.ndarray, int, Dict[str, Any]]]:
+        """since 이후 기록이 있으면 (seq, points, offsets, cluster_version, state) 복사본, 없으면 None."""
+        for _ in range(retries):
+            seq = int(self.header[_SEQ])
+            if seq == since or seq == 0:
+                return None
+            if seq & 1:
+                time.sleep(0)
+                continue
+            n_points = int(self.header[_N_POINTS])
+            n_clusters = int(self.header[_N_CLUSTERS])
+            state_len = int(self.header[_STATE_LEN])
+            cluster_version = int(self.header[_CLUSTER_VERSION])
+            points = self._arrays["points"][:n_points].copy()
+            offsets = self._arrays["offsets"][:n_clusters + 1].copy()
+            payload = self._arrays["state"][:state_len].tobytes()
+            if int(self.header[_SEQ]) == seq:
+                return seq, points, offsets, cluster_version, json.loads(payload.decode("utf-8"))
+        return None
+
+    def close(self):
+        self._arrays = {}
+        self.header = None
+        try:
+            self.shm.close()
+        except BufferError:
+            pass  # 링 버퍼 뷰가 아직 남아 있으면 매핑은 프로세스 종료 때 해제됨
+        if self.owner:
+            self.shm.unlink()
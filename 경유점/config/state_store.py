@@ -0,0 +1,177 @@
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import Any, Callable, Deque, Dict, Iterator, List, Mapping, Optional
+from config.metrics import TimedLock
+from config.ring_buffer import RingBuffer
+
+
+def freeze(value: Any) -> Any:
+    """스냅샷에 넣을 값을 읽기 전용으로 변환: dict -> MappingProxyType(복사본), list -> tuple,
+    RingBuffer -> RingView.
+
+    RingView는 저장 공간을 공유하는 추가 전용 기록이라 스냅샷 뒤의 append도 보인다 (RingView 참고).
+    numpy 배열, ClusterStore, DistanceField 같은 객체는 만든 뒤 고치지 않는다는 약속으로 그대로 둔다.
+    """
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(value)
+    if isinstance(value, RingBuffer):
+        return value.view()
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """freeze의 반대: 수정해서 다시 publish할 dict 사본."""
+    if isinstance(value, Mapping):
+        return {k: thaw(v) for k, v in value.items()}
+    return value
+
+
+class StateSnapshot(Mapping):
+    """한 시점의 공유 상태 (불변, version 포함).
+
+    version은 publish마다 1씩 증가하고, key_versions[key]는 그 키가 마지막으로 바뀐 version이다.
+    읽는 쪽은 참조 하나만 잡고 여러 키를 읽어도 같은 시점의 값을 보며(찢어진 읽기 없음),
+    changed(key, since)로 관심 있는 키가 바뀌었는지 바로 확인할 수 있다.
+    """
+    __slots__ = ('_data', 'version', 'key_versions')
+
+    def __init__(self, data: Dict[str, Any], version: int = 0,
+                 key_versions: Optional[Dict[str, int]] = None):
+        self._data = data
+        self.version = version
+        self.key_versions = key_versions if key_versions is not None else dict.fromkeys(data, version)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def changed(self, key: str, since: int) -> bool:
+        """since version 이후 key가 바뀌었는지."""
+        return self.key_versions.get(key, -1) > since
+
+    def evolve(self, changes: Mapping[str, Any]) -> 'StateSnapshot':
+        """changes를 반영한 다음 version 스냅샷 (바뀌지 않은 값은 그대로 공유)."""
+        version = self.version + 1
+        data = dict(self._data)
+        key_versions = dict(self.key_versions)
+        for key, value in changes.items():
+            data[key] = freeze(value)
+            key_versions[key] = version
+        return StateSnapshot(data, version, key_versions)
+
+
+class StateStore:
+    """복사 후 교체(copy-on-write) 방식의 공유 상태 저장소.
+
+    읽기: snapshot()이 현재 스냅샷 참조를 락 없이 돌려준다. store[key]는 snapshot()[key]의 줄임이다.
+    쓰기: publish()/update()가 새 스냅샷을 만들어 참조를 한 번에 교체한다. 쓰는 쪽끼리만 락으로
+    순서를 맞추므로 읽는 쪽(Flask, Dash, 제어 루프)은 서로 기다리지 않는다.
+    저장소는 주입 가능한 객체라서 세션마다 별도 인스턴스를 둘 수 있다.
+    subscribe()로 등록한 함수는 게시마다 바뀐 값(changes)을 version 순서대로 받는다 (다른 프로세스로 전달 등).
+    텔레메트리 기록(RingBuffer)은 스냅샷에 읽기 전용 RingView로 들어가고, 쓰는 쪽은 buffer(key)로 받은
+    RingBuffer에 append한다.
+    """
+    def __init__(self, initial: Mapping[str, Any]):
+        self._snapshot = StateSnapshot({k: freeze(v) for k, v in initial.items()})
+        self._buffers: Dict[str, RingBuffer] = {k: v for k, v in initial.items() if isinstance(v, RingBuffer)}
+        self._write_lock = TimedLock("state_store")
+        self._listeners: List[Callable[[Mapping[str, Any]], None]] = []
+        self._pending: Deque[Mapping[str, Any]] = deque()  # 아직 전달하지 않은 changes (version 순)
+        self._notify_lock = threading.Lock()
+        self._delivering: Optional[int] = None  # 지금 알림을 전달 중인 스레드 ID
+
+    def subscribe(self, listener: Callable[[Mapping[str, Any]], None]):
+        """게시 후 호출할 함수 등록. 쓰기 락 밖에서 호출된다.
+
+        changes는 쓰기 락 안에서 대기열에 넣고 알림 락을 잡은 스레드 하나가 순서대로 전달하므로, 여러 스레드가
+        동시에 게시해도 version 순서대로 도착한다 (publish는 자기 알림이 전달된 뒤에 반환).
+        """
+        self._listeners = self._listeners + [listener]
+
+    def _notify(self):
+        """대기 중인 changes를 version 순서대로 전달."""
+        if self._delivering == threading.get_ident():
+            return  # 리스너 안에서 다시 게시한 경우: 바깥 전달 루프가 이어서 전달
+        with self._notify_lock:
+            self._delivering = threading.get_ident()
+            try:
+                while self._pending:
+                    changes = self._pending.popleft()
+                    for listener in self._listeners:
+                        listener(changes)
+            finally:
+                self._delivering = None
+
+    def snapshot(self) -> StateSnapshot:
+        return self._snapshot
+
+    @property
+    def version(self) -> int:
+        return self._snapshot.version
+
+    def __getitem__(self, key: str) -> Any:
+        return self._snapshot[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._snapshot.get(key, default)
+
+    def buffer(self, key: str) -> RingBuffer:
+        """key로 게시된 쓰기 가능한 RingBuffer (스냅샷에는 읽기 전용 뷰만 있다)."""
+        return self._buffers[key]
+
+    def _track(self, changes: Mapping[str, Any]):
+        """게시하는 RingBuffer를 buffer()용으로 기억 (쓰기 락 안에서 호출)."""
+        for key, value in changes.items():
+            if isinstance(value, RingBuffer):
+                self._buffers[key] = value
+
+    def publish(self, **changes: Any) -> StateSnapshot:
+        """키 값을 교체한 새 스냅샷을 게시."""
+        with self._write_lock:
+            self._snapshot = snapshot = self._snapshot.evolve(changes)
+            self._track(changes)
+            if self._listeners:
+                self._pending.append(changes)
+        self._notify()
+        return snapshot
+
+    def update(self, fn: Callable[[StateSnapshot], Mapping[str, Any]]) -> StateSnapshot:
+        """현재 스냅샷으로 바꿀 값을 계산해서 게시 (읽고-고쳐-쓰기를 다른 쓰기와 섞이지 않게 처리).
+
+        fn은 짧아야 한다: 쓰기 락을 잡은 채로 호출된다.
+        """
+        with self._write_lock:
+            changes = fn(self._snapshot)
+            if changes:
+                self._snapshot = self._snapshot.evolve(changes)
+                self._track(changes)
+                if self._listeners:
+                    self._pending.append(changes)
+            snapshot = self._snapshot
+        self._notify()
+        return snapshot
+
+    def update_config(self, **params: Any) -> StateSnapshot:
+        """CONFIG_PARAMS 일부 값을 바꾼 새 설정 dict를 게시.
+
+        dict 값(WEIGHT_FACTORS 등)은 통째로 바꾸지 않고 준 항목만 기존 dict에 덮어쓴다.
+        """
+        def apply(state: StateSnapshot):
+            config = thaw(state['CONFIG_PARAMS'])
+            for name, value in params.items():
+                if isinstance(value, Mapping) and isinstance(config.get(name), dict):
+                    config[name].update(thaw(value))
+                else:
+                    config[name] = thaw(value)
+            return {'CONFIG_PARAMS': config}
+        return self.update(apply)
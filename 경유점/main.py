@@ -1,6 +1,11 @@
+import sys
 import threading
+from config.log_config import setup_logging
 from web.app import run_flask
 from web.dash_app import run_dash
+from web.dash_process import start_dash_process
+from web.asgi_app import run_asgi
+from web.stream_server import start_stream_server
 
 def run_multithread(flask_func, dash_func):
     t1 = threading.Thread(target=flask_func)
@@ -10,5 +15,24 @@ def run_multithread(flask_func, dash_func):
     t1.join()
     t2.join()
 
+def run_dash_in_process(flask_func):
+    """Dash를 별도 프로세스로 띄우고(공유 메모리로 상태 전달) 이 프로세스는 Flask만 실행."""
+    process, publisher = start_dash_process()
+    try:
+        flask_func()
+    finally:
+        publisher.stop(timeout=1.0)
+        process.terminate()
+        publisher.segment.close()
+
 if __name__ == "__main__":
-    run_multithread(run_flask, run_dash)
\ No newline at end of file
+    setup_logging()
+    # --asgi: Flask 대신 ASGI 서버(uvicorn)로 제어 서버 실행
+    server_func = run_asgi if "--asgi" in sys.argv else run_flask
+    # --stream: 텔레메트리/명령 스트리밍 채널(길이 접두 TCP, SERVER_CONFIG['stream_port'])도 같이 실행
+    if "--stream" in sys.argv:
+        start_stream_server()
+    if "--dash-process" in sys.argv:
+        run_dash_in_process(server_func)
+    else:
+        run_multithread(server_func, run_dash)
@@ -0,0 +1,113 @@
+import time
+import logging
+import threading
+from typing import Callable, Dict, List, Optional, Union
+from config.metrics import TimedLock
+
+logger = logging.getLogger(__name__)
+
+
+class ControlLoop:
+    """고정 주기 제어 루프 스레드.
+
+    매 틱마다 navigator.get_move()로 다음 명령을 계산해서 seq, timestamp와 함께 게시하고,
+    HTTP 핸들러는 latest()로 마지막 게시 명령만 읽는다. 따라서 /get_move 응답 시간은
+    인지/계획 비용과 무관하고, 같은 명령을 연달아 조회해도 다시 계산하지 않는다.
+    주기는 CONFIG_PARAMS['CONTROL_RATE_HZ']를 틱마다 읽어서 대시보드 변경이 바로 반영된다.
+    subscribe()로 등록한 함수는 새 명령이 게시될 때마다 그 명령을 받는다 (스트리밍 연결로 밀어 주기 등).
+    lock을 주면 get_move()를 그 락 안에서 부른다 (Session은 텔레메트리 반영과 같은 session.lock을 넘김).
+    """
+    def __init__(self, navigator, rate_hz: Optional[float] = None, lock=None):
+        self.navigator = navigator
+        self.rate_hz = rate_hz  # None이면 CONFIG_PARAMS['CONTROL_RATE_HZ']
+        self.lock = lock if lock is not None else threading.Lock()
+        self._latest = {"move": "STOP", "weight": 1.0, "seq": 0, "timestamp": time.time()}
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._tick_lock = TimedLock("control_tick")  # 루프 스레드와 요청 처리(/tick)의 tick()이 겹치지 않게
+        self._listeners: List[Callable[[Dict[str, Union[str, float, int]]], None]] = []
+        self.ticks = 0
+        self.overruns = 0  # 계산이 주기보다 길어서 건너뛴 틱 수
+        self.last_tick_duration = 0.0
+        # 명령 계산에 쓰인 입력(게시된 맵)의 수신 시각(time.monotonic)을 알려 주는 함수. Pipeline이 연결함
+        self.input_time: Optional[Callable[[], Optional[float]]] = None
+        self.last_input_age: Optional[float] = None
+
+    def _period(self) -> float:
+        rate = self.rate_hz or self.navigator.store['CONFIG_PARAMS'].get('CONTROL_RATE_HZ', 20.0)
+        return 1.0 / max(float(rate), 1e-3)
+
+    def start(self):
+        """루프 스레드 시작 (이미 돌고 있으면 무시)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="control-loop", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def subscribe(self, listener: Callable[[Dict[str, Union[str, float, int]]], None]):
+        """새 명령 게시 후 호출할 함수 등록. 틱 락 밖에서, 틱을 돌린 스레드에서 호출되므로 오래 막지 않아야 한다."""
+        self._listeners = self._listeners + [listener]
+
+    def unsubscribe(self, listener: Callable[[Dict[str, Union[str, float, int]]], None]):
+        self._listeners = [f for f in self._listeners if f != listener]
+
+    def tick(self) -> Dict[str, Union[str, float, int]]:
+        """명령 하나를 계산해서 게시. 계산 중 오류가 나면 STOP을 게시한다."""
+        with self._tick_lock:
+            command = self._tick()
+        for listener in self._listeners:
+            try:
+                listener(dict(command))
+            except Exception as e:
+                logger.error("Control loop listener failed: %s", e)
+        return command
+
+    def _tick(self) -> Dict[str, Union[str, float, int]]:
+        started = time.perf_counter()
+        if self.input_time is not None:
+            input_time = self.input_time()
+            self.last_input_age = time.monotonic() - input_time if input_time is not None else None
+        try:
+            with self.lock:
+                command = dict(self.navigator.get_move())
+        except Exception as e:
+            logger.error("Control loop tick failed: %s", e)
+            command = {"move": "STOP", "weight": 1.0, "message": str(e)}
+        self.last_tick_duration = time.perf_counter() - started
+        self.ticks += 1
+        command["seq"] = self.ticks
+        command["timestamp"] = time.time()
+        self._latest = command  # 참조 교체 한 번이라서 읽는 쪽에 락이 필요 없음
+        return command
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            self.tick()
+            period = self._period()
+            next_tick += period
+            now = time.monotonic()
+            if now > next_tick:
+                # 밀린 틱은 몰아서 돌리지 않고 건너뜀
+                missed = int((now - next_tick) / period) + 1
+                self.overruns += missed
+                next_tick += missed * period
+            self._stop.wait(next_tick - now)
+
+    def latest(self) -> Dict[str, Union[str, float, int]]:
+        """마지막으로 게시된 명령 (seq, timestamp 포함)."""
+        return dict(self._latest)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "ticks": self.ticks,
+            "overruns": self.overruns,
+            "last_tick_ms": round(self.last_tick_duration * 1000.0, 3),
+            "input_age_ms": round(self.last_input_age * 1000.0, 3) if self.last_input_age is not None else None
+        }
@@ -1,86 +1,178 @@
 import math
+import logging
+from typing import List, Optional
+from config.shared_config import SHARED
+from config.state_store import StateStore
 from navigation.position_handler import PositionHandler
 from navigation.pid_controller import PIDController
-from navigation.purepursuit import PurePursuit
+from navigation.purepursuit import PurePursuit, BLOCKED_MESSAGE
 from navigation.obstacle_handler import ObstacleHandler  # 수정됨
+from navigation.telemetry import TelemetryFrame, Vec3, parse_telemetry, parse_batch
+from config.log_config import tick_logger
+from config.metrics import timed
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
 
 class Navigation:
-    def __init__(self):
-        self.position_handler = PositionHandler()
-        self.controller = PIDController()
-        self.pure_pursuit = PurePursuit()
-        self.obstacle_handler = ObstacleHandler()  # 수정됨
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or SHARED  # 하위 모듈이 함께 쓰는 상태 저장소
+        self.position_handler = PositionHandler(self.store)
+        self.controller = PIDController(self.store)
+        self.pure_pursuit = PurePursuit(self.store)
+        self.obstacle_handler = ObstacleHandler(self.store)  # 수정됨
         self.enemyPos = None                       # 추가
+        self.enemyTurretX = None
         self.destination = None
         self.start_mode = "start"
 
     def init_simulation(self):
         """시뮬레이션 초기화."""
-        self.position_handler = PositionHandler()
-        self.controller = PIDController()
-        self.pure_pursuit = PurePursuit()
-        self.obstacle_handler = ObstacleHandler()
+        self.position_handler = PositionHandler(self.store)
+        self.controller = PIDController(self.store)
+        self.pure_pursuit = PurePursuit(self.store)
+        self.obstacle_handler = ObstacleHandler(self.store)
         self.destination = None
         self.start_mode = "start"
         return {"status": "OK", "message": "Simulation initialized"}
 
+    @staticmethod
+    def _parse_waypoint(waypoint):
+        """"x,y,z" 문자열, {"x", "y", "z"} dict, (x, z) 또는 (x, y, z) -> (x, y, z)."""
+        if isinstance(waypoint, str):
+            x, y, z = map(float, waypoint.split(","))
+        elif isinstance(waypoint, dict):
+            x, y, z = float(waypoint["x"]), float(waypoint.get("y", 0.0)), float(waypoint["z"])
+        elif len(waypoint) == 2:
+            x, z = map(float, waypoint)
+            y = 0.0
+        else:
+            x, y, z = map(float, waypoint)
+        return x, y, z
+
     def set_destination(self, destination_str):
-        """목적지를 설정하고 초기 거리를 계산."""
+        """목적지를 설정하고 초기 거리를 계산.
+
+        "x,y,z" 하나면 기존처럼 직선 추종하고, 경유점 목록(리스트 또는 ';'로 이은 문자열)이면
+        현재 위치부터 경유점을 잇는 폴리라인을 PurePursuit 경로 추종 모드로 넘긴다.
+        """
         try:
-            x, y, z = map(float, destination_str.split(","))
+            if isinstance(destination_str, str):
+                waypoints = [self._parse_waypoint(w) for w in destination_str.split(";") if w.strip()]
+            elif isinstance(destination_str, dict):
+                waypoints = [self._parse_waypoint(destination_str)]
+            else:
+                waypoints = [self._parse_waypoint(w) for w in destination_str]
+            if not waypoints:
+                raise ValueError("No destination given")
+
+            x, y, z = waypoints[-1]
             self.destination = (x, z)
             self.controller.reset_integral()
             self.pure_pursuit.initial_distance = None
 
-            if self.position_handler.current_position:
-                curr_x, curr_z = self.position_handler.current_position
-                self.pure_pursuit.initial_distance = math.sqrt((x - curr_x) ** 2 + (z - curr_z) ** 2)
+            if len(waypoints) > 1:
+                route = [(wx, wz) for wx, _, wz in waypoints]
+                if self.position_handler.current_position:
+                    route.insert(0, tuple(self.position_handler.current_position))
+                self.pure_pursuit.initial_distance = self.pure_pursuit.set_path(route).length
+            else:
+                self.pure_pursuit.set_path(None)
+                if self.position_handler.current_position:
+                    curr_x, curr_z = self.position_handler.current_position
+                    self.pure_pursuit.initial_distance = math.sqrt((x - curr_x) ** 2 + (z - curr_z) ** 2)
 
             return {
                 "status": "OK",
                 "destination": {"x": x, "y": y, "z": z},
+                "waypoints": len(waypoints),
                 "initial_distance": self.pure_pursuit.initial_distance
             }
         except Exception as e:
             return {"status": "ERROR", "message": str(e)}
         
     def update_info(self, data):
-        """LiDAR 데이터와 플레이어 위치 데이터를 처리."""
+        """LiDAR 데이터와 플레이어 위치 데이터를 처리 (/info dict 입력용 어댑터)."""
         try:
-            # print(f"Received /info data: {data}")
-            # if "lidarPoints" not in data:
-            #     return {"status": "ERROR", "message": "No lidarPoints in data"}
-            
-            # # LiDAR 데이터 처리
-            # obstacle_result = self.obstacle_handler.update_obstacle({"lidarPoints": data["lidarPoints"]})
-            # if obstacle_result["status"] == "ERROR":
-            #     return obstacle_result
+            frame = parse_telemetry(data)
+        except ValueError as e:
+            logger.warning("Error in update_info: %s", e)
+            return {"status": "ERROR", "message": f"Failed to update info: {str(e)}"}
+        return self.update_telemetry(frame)
+
+    def update_telemetry(self, frame: TelemetryFrame):
+        """파싱된 텔레메트리 프레임 하나 처리: LiDAR(있으면) -> 플레이어 위치 -> 적 사선 경유점."""
+        try:
+            # LiDAR 데이터 처리 (함께 온 경우에만)
+            if frame.lidar_points:
+                obstacle_result = self.obstacle_handler.update_obstacle({"lidarPoints": frame.lidar_points})
+                if obstacle_result["status"] == "ERROR":
+                    return obstacle_result
 
             # 플레이어 위치 데이터 처리 _ 지혁 사용
-            if "playerPos" in data and isinstance(data["playerPos"], dict):
-                position_str = f"{data['playerPos']['x']},{data['playerPos']['y']},{data['playerPos']['z']}"
-                position_result = self.position_handler.update_position(position_str)
+            if frame.player_pos is not None:
+                position_result = self.position_handler.update_vec(frame.player_pos, frame.timestamp)
                 if position_result["status"] == "ERROR":
                     return position_result
-            # print("지혁지혁혁- 우리좌표-str",position_str)    
-            
-            # 2. 적 위치 -- 위와 동시에 경로 짜기기 
-            if "enemyPos" in data and isinstance(data["enemyPos"], dict):
-                self.enemyPos = (
-                    data["enemyPos"]["x"],
-                    # data["enemyPos"]["y"], 
-                    data["enemyPos"]["z"]
-                )
-            # print('~적좌표 ~ 적좌표 ~',data["enemyPos"]["x"], data["enemyPos"]["z"])
 
-            # 3. 플레이어 터렛 방향
-            # if "player_turret_x" in data:
-            #     self.player_turret_x = data["player_turret_x"]
+            return self._update_enemy(frame)
+
+        except Exception as e:
+            logger.error("Error in update_info: %s", e)
+            return {"status": "ERROR", "message": f"Failed to update info: {str(e)}"}
 
-            # 4. 적 터렛 방향
-            if "enemyTurretX" in data:
-                self.enemyTurretX = data["enemyTurretX"]
+    def update_info_batch(self, frames):
+        """시뮬레이터 시각("timestamp")이 붙은 /info 프레임 묶음 처리 (dict 목록 입력용 어댑터)."""
+        try:
+            parsed = parse_batch(frames)
+        except ValueError as e:
+            logger.warning("Error in update_info_batch: %s", e)
+            return {"status": "ERROR", "message": f"Failed to update info batch: {str(e)}"}
+        return self.update_telemetry_batch(parsed)
 
+    def update_telemetry_batch(self, frames: List[TelemetryFrame]):
+        """시각 순으로 정렬된 텔레메트리 프레임 여러 개를 한 번에 처리.
+
+        위치는 PositionHandler.update_positions()로 한 번에 계산하고(dt = 샘플 시각 차),
+        적 위치/포신 방향과 LiDAR는 가장 최근 프레임(LiDAR는 lidarPoints가 있는 가장 최근 프레임) 것만 반영한다.
+        LiDAR는 위치를 반영한 뒤에 처리하므로 맵 중심은 이번 묶음의 마지막 위치다.
+        세션 서버(Session.ingest_batch)는 LiDAR를 뺀 프레임만 넘기고 스캔은 파이프라인으로 보낸다.
+        """
+        try:
+            located = [f for f in frames if f.player_pos is not None]
+            samples = 0
+            if located:
+                position_result = self.position_handler.update_positions(
+                    [f.timestamp for f in located], [f.player_pos for f in located])
+                if position_result["status"] == "ERROR":
+                    return position_result
+                samples = position_result["samples"]
+
+            scans = [f for f in frames if f.lidar_points]
+            if scans:
+                obstacle_result = self.obstacle_handler.update_obstacle({"lidarPoints": scans[-1].lidar_points})
+                if obstacle_result["status"] == "ERROR":
+                    return obstacle_result
+
+            result = self._update_enemy(frames[-1])
+            result.update({"frames": len(frames), "samples": samples})
+            return result
+        except Exception as e:
+            logger.error("Error in update_info_batch: %s", e)
+            return {"status": "ERROR", "message": f"Failed to update info batch: {str(e)}"}
+
+    def _update_enemy(self, frame: TelemetryFrame):
+        """적 위치/포신 방향으로 적 사선 위 수선의 발(x2, z2)과 100m 지점(x3, z3) 계산."""
+        try:
+            # 2. 적 위치 -- 위와 동시에 경로 짜기기 
+            if frame.enemy_pos is not None:
+                self.enemyPos = frame.enemy_pos.xz
+
+            # 4. 적 터렛 방향 (이번 프레임에 없으면 마지막 값)
+            if frame.enemy_turret_x is not None:
+                self.enemyTurretX = frame.enemy_turret_x
+            if frame.enemy_pos is None or self.enemyTurretX is None or frame.player_pos is None:
+                raise ValueError("enemyPos, enemyTurretX and playerPos are required")
 
             # # 5. 플레이어 몸체 자세 (IMU-like 값)
             # self.player_body_attitude = {
@@ -99,13 +191,11 @@ class Navigation:
             # print(f"[DEBUG2] 적의 방향벡터: dx = {dx:.4f}, dz = {dz:.4f}")
 
             # 3. 직선 위의 점 (적 위치)
-            x0 = data['enemyPos']['x']
-            z0 = data['enemyPos']['z']
+            x0, z0 = frame.enemy_pos.xz
             # print(f"[DEBUG3] 적 위치: x0 = {x0}, z0 = {z0}")
 
             # 4. 외부 점 (플레이어 위치)
-            x1 = data['playerPos']['x']
-            z1 = data['playerPos']['z']
+            x1, z1 = frame.player_pos.xz
             # print(f"[DEBUG4] 플레이어 위치: x1 = {x1}, z1 = {z1}")
 
             # 수선의 발 : 최단거리로 가기위한 경유점
@@ -116,7 +206,7 @@ class Navigation:
             self.x2 = (dx**2 * x0 + dz**2 * x1 + dx * dz * (z0 - z1)) / denominator
             self.z2 = (dz**2 * z0 + dx**2 * z1 + dx * dz * (x0 - x1)) / denominator
 
-            print("수선의 발발발5~~",self.x2, self.z2)
+            tick_log.debug("수선의 발: (%s, %s)", self.x2, self.z2)
             
             # 최종 지점 : 100m 지점
             d = math.sqrt((self.x2 - x0)**2 + (self.z2 - z0)**2)
@@ -125,43 +215,61 @@ class Navigation:
             
             self.x3 = x0 + (100 / d) * (self.x2 - x0)
             self.z3 = z0 + (100 / d) * (self.z2 - z0)
-            print("100m 지점점점점~~", self.x3, self.z3)
+            tick_log.debug("100m 지점: (%s, %s)", self.x3, self.z3)
 
             return {"status": "OK"}
 
         except Exception as e:
-            print(f"Error in update_info: {str(e)}")
+            # 적 정보가 없는 프레임마다 나오므로 간격 제한
+            tick_log.warning("Error in update_info: %s", e)
             return {"status": "ERROR", "message": f"Failed to update info: {str(e)}"}
  
-    # def update_obstacle(self, obstacle_data):
-    #     """장애물 데이터 업데이트."""
-    #     return self.obstacle_handler.update_obstacle(obstacle_data)
+    def update_obstacle(self, obstacle_data):
+        """장애물 데이터 업데이트."""
+        return self.obstacle_handler.update_obstacle(obstacle_data)
+
+    def update_lidar_frame(self, frame):
+        """바이너리 LiDAR 프레임(LidarFrame) 처리: 헤더 pose로 위치 갱신 후 포인트를 바로 장애물 파이프라인에 전달."""
+        position_result = self.position_handler.update_vec(Vec3(*frame.position), frame.timestamp)
+        if position_result["status"] == "ERROR":
+            return position_result
+
+        obstacle_result = self.obstacle_handler.update_obstacle({
+            "lidarPoints": frame.points,
+            "pose": frame.pose if frame.local else None
+        })
+        if obstacle_result["status"] == "ERROR":
+            return obstacle_result
+        return {"status": "OK", "timestamp": frame.timestamp, "points": len(frame.points)}
     
 
+    @timed("get_move")
     def get_move(self):
-        """장애물 회피 여부를 먼저 판단하고, Pure Pursuit로 이동 명령 계산."""
+        """장애물 회피 여부를 먼저 판단하고, Pure Pursuit로 이동 명령 계산.
+
+        장애물이 정지/감속 범위 안이면 회피 명령이 우선이다. 그보다 먼 장애물은 PurePursuit가 주시점까지
+        막혔을 때 대체 경로를 계획해서 피하고, 장애물 때문에 멈춰야 할 때(우회 경로 없음)만 회피 방향 명령을 쓴다.
+        (TURN_* 회피 명령은 장애물이 하나라도 보이면 나오므로, 이를 먼저 쓰면 우회 경로 추종에 닿지 못한다.)
+        제어 루프가 주기마다 부르므로 위치/방위/속도는 호출 시점 값 하나로 계산하고, compute_move의
+        추측 항법 위치는 PositionHandler에 되쓰지 않는다 (위치는 텔레메트리로만 갱신).
+        """
         if self.start_mode == "pause":
             return {"move": "STOP", "weight": 1.0}
 
-        # --- 장애물 회피 우선 판단 ---
-        avoidance_command = self.obstacle_handler.get_avoidance_command(
-            self.position_handler.current_position,
-            self.position_handler.current_heading
-        )
-        if avoidance_command:
+        handler = self.position_handler
+        position, heading, speed_kh = handler.current_position, handler.current_heading, handler.current_speed_kh
+
+        # --- 가까운 장애물 회피 우선 판단 ---
+        avoidance_command = self.obstacle_handler.get_avoidance_command(position, heading)
+        if avoidance_command and avoidance_command["move"] in ("STOP", "SLOW_DOWN"):
             return avoidance_command
 
-        # --- 장애물 없으면 순수 주행 ---
-        command, new_position = self.pure_pursuit.compute_move(
-            self.position_handler.current_position,
-            self.position_handler.current_heading,
-            self.position_handler.current_speed_kh,
-            self.destination,
-            self.controller,
-            self.obstacle_handler
+        # --- 순수 주행 (막히면 우회 경로 추종) ---
+        result = self.pure_pursuit.compute_move(
+            position, heading, speed_kh, self.destination, self.controller, self.obstacle_handler
         )
-
-        if new_position:
-            self.position_handler.current_position = new_position
-
+        # compute_move는 정지/장애물 등 조기 반환에서 명령 dict만 돌려줌
+        command = result[0] if isinstance(result, tuple) else result
+        if command.get("message") == BLOCKED_MESSAGE and avoidance_command:
+            return avoidance_command
         return command
@@ -1,8 +1,11 @@
 import numpy as np
-import logging
 from typing import List, Dict, Union, Optional, Tuple
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.distance_field import DistanceField
+from config.log_config import tick_logger
+from config.metrics import timed
 
-logging.basicConfig(level=logging.DEBUG)
+tick_log = tick_logger(__name__)
 
 class AvoidanceCommander:
     """장애물 회피 명령 생성."""
@@ -10,34 +13,68 @@ class AvoidanceCommander:
         self.obstacle_radius = obstacle_radius
         self.current_target = None  # ([x, z], index)
 
-    def get_avoidance_command(self, current_position: Union[List, Tuple], 
-                            current_heading: float, 
-                            clusters: List[List[List[float]]]) -> Optional[Dict[str, Union[str, float]]]:
-        """장애물 회피 명령 생성."""
+    @timed("avoidance")
+    def get_avoidance_command(self, current_position: Union[List, Tuple],
+                            current_heading: float,
+                            clusters: ClusterStore,
+                            field: Optional[DistanceField] = None) -> Optional[Dict[str, Union[str, float]]]:
+        """장애물 회피 명령 생성.
+
+        거리장 범위(max_distance) 안에 장애물이 있으면 장애물 표면까지 거리와 방향을
+        거리장 조회 한 번으로 얻고, 없으면 가장 가까운 클러스터 중심점을 기준으로 한다.
+        그 거리가 obstacle_radius 미만이면 STOP, 1.5배 미만이면 SLOW_DOWN이다. 거리장 범위 안에서는
+        중심점이 아니라 표면 거리라서 큰 클러스터(벽 등)는 중심점이 멀어도 표면에 가까워지면 멈춘다.
+        """
         if not isinstance(current_position, (list, tuple)) or len(current_position) != 2:
-            logging.debug("Invalid position")
+            tick_log.debug("Invalid position")
             self.current_target = None
             return None
 
         if not clusters:
-            logging.debug("No obstacle clusters")
+            tick_log.debug("No obstacle clusters")
             self.current_target = None
             return None
 
-        current_pos = np.array(current_position)
-        min_distance = float('inf')
-        nearest_point = None
-        nearest_cluster_idx = None
+        current_pos = np.array(current_position, dtype=np.float64)
+        nearest_point = self._nearest_from_field(current_pos, field)
+        if nearest_point is not None:
+            min_distance = float(np.linalg.norm(nearest_point - current_pos))
+            self.current_target = None
+        else:
+            min_distance, nearest_point = self._nearest_centroid(current_pos, clusters)
+
+        if min_distance < self.obstacle_radius:
+            return {"move": "STOP", "weight": 1.0}
+        elif min_distance < self.obstacle_radius * 1.5:
+            return {"move": "SLOW_DOWN", "weight": min_distance / (self.obstacle_radius * 1.5)}
+
+        rel_x = nearest_point[0] - current_pos[0]
+        rel_z = nearest_point[1] - current_pos[1]
+        angle_to_point = np.arctan2(rel_z, rel_x) - np.radians(current_heading)
+        angle_to_point = ((angle_to_point + np.pi) % (2 * np.pi) - np.pi)
+        weight = min(1.0, min_distance / (self.obstacle_radius * 3.0))
+        move = "TURN_LEFT" if 0 <= angle_to_point < np.pi else "TURN_RIGHT"
+
+        tick_log.debug("Avoidance: move=%s, weight=%.2f, distance=%.2f", move, weight, min_distance)
+        return {"move": move, "weight": weight}
 
-        # 가장 가까운 클러스터 포인트 찾기
-        for i, cluster in enumerate(clusters):
-            cluster_points = np.array(cluster)
-            centroid = np.mean(cluster_points, axis=0)
-            distance = np.linalg.norm(centroid - current_pos)
-            if distance < min_distance:
-                min_distance = distance
-                nearest_point = centroid
-                nearest_cluster_idx = i
+    @staticmethod
+    def _nearest_from_field(current_pos: np.ndarray,
+                            field: Optional[DistanceField]) -> Optional[np.ndarray]:
+        """거리장으로 구한 가장 가까운 장애물 지점 (기울기 반대 방향). 범위 밖이거나 주변에 장애물이 없으면 None."""
+        if field is None or not field.covers(current_pos)[0]:
+            return None
+        clearance, gradient = field.clearance_and_gradient(current_pos)
+        norm = np.linalg.norm(gradient[0])
+        if clearance[0] >= field.max_distance or norm == 0:
+            return None
+        return current_pos - gradient[0] / norm * max(clearance[0], 0.0)
+
+    def _nearest_centroid(self, current_pos: np.ndarray,
+                          clusters: ClusterStore) -> Tuple[float, np.ndarray]:
+        """가장 가까운 클러스터 중심점 (미리 계산된 중심점 KD-tree). 가까운 기존 타겟은 유지."""
+        min_distance, nearest_cluster_idx = clusters.nearest(current_pos)
+        nearest_point = clusters.centroids[nearest_cluster_idx]
 
         # 현재 타겟 유지 여부
         if self.current_target:
@@ -50,18 +87,4 @@ class AvoidanceCommander:
                     nearest_cluster_idx = target_idx
 
         self.current_target = (nearest_point, nearest_cluster_idx) if nearest_point is not None else None
-
-        if min_distance < self.obstacle_radius:
-            return {"move": "STOP", "weight": 1.0}
-        elif min_distance < self.obstacle_radius * 1.5:
-            return {"move": "SLOW_DOWN", "weight": min_distance / (self.obstacle_radius * 1.5)}
-
-        rel_x = nearest_point[0] - current_pos[0]
-        rel_z = nearest_point[1] - current_pos[1]
-        angle_to_point = np.arctan2(rel_z, rel_x) - np.radians(current_heading)
-        angle_to_point = ((angle_to_point + np.pi) % (2 * np.pi) - np.pi)
-        weight = min(1.0, min_distance / (self.obstacle_radius * 3.0))
-        move = "TURN_LEFT" if 0 <= angle_to_point < np.pi else "TURN_RIGHT"
-        
-        logging.debug(f"Avoidance: move={move}, weight={weight:.2f}, distance={min_distance:.2f}")
-        return {"move": move, "weight": weight}
\ No newline at end of file
+        return min_distance, nearest_point
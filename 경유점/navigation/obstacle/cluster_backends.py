@@ -0,0 +1,144 @@
+"""
+클러스터링 백엔드.
+
+모든 백엔드는 labels(포인트별, 노이즈 -1)를 계산하고,
+group_labels()가 이를 한 번의 argsort로 (order, offsets) 형태의 인덱스 범위로 바꾼다.
+cluster i의 포인트 = coords[order[offsets[i]:offsets[i + 1]]]
+"""
+
+import numpy as np
+from typing import Dict, Optional, Tuple, Type
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from sklearn.cluster import DBSCAN
+from navigation.obstacle.spatial_index import FrameSpatialIndex
+
+# 3x3 이웃 셀 오프셋
+_NEIGHBOR_OFFSETS = np.array([(dx, dz) for dx in (-1, 0, 1) for dz in (-1, 0, 1)], dtype=np.int64)
+
+
+def group_labels(labels: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """라벨을 (order, offsets)로 변환. 노이즈 포인트는 order에 포함되지 않음."""
+    order = np.argsort(labels, kind='stable')
+    order = order[labels[order] >= 0]
+    counts = np.bincount(labels[order]) if len(order) else np.zeros(0, dtype=np.int64)
+    offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    return order, offsets
+
+
+class ClusterBackend:
+    """클러스터링 백엔드 인터페이스."""
+    name = None
+
+    def labels(self, coords: np.ndarray, eps: float, min_samples: int,
+               index: Optional[FrameSpatialIndex] = None) -> np.ndarray:
+        raise NotImplementedError
+
+    def cluster(self, coords: np.ndarray, eps: float, min_samples: int,
+                index: Optional[FrameSpatialIndex] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """(order, offsets) 반환."""
+        return group_labels(self.labels(coords, eps, min_samples, index))
+
+
+class DBSCANBackend(ClusterBackend):
+    """scikit-learn DBSCAN. 프레임 인덱스가 있으면 그 반경 이웃 그래프를 precomputed 거리로 넘김 (트리 재생성 없음)."""
+    name = 'dbscan'
+
+    def labels(self, coords: np.ndarray, eps: float, min_samples: int,
+               index: Optional[FrameSpatialIndex] = None) -> np.ndarray:
+        if index is not None and index.tree is not None:
+            graph = index.radius_neighbors_graph(eps)
+            return DBSCAN(eps=eps, min_samples=min_samples, metric='precomputed').fit(graph).labels_
+        return DBSCAN(eps=eps, min_samples=min_samples).fit(coords).labels_
+
+
+class GridHashBackend(ClusterBackend):
+    """eps 크기 공간 해시 + 연결 요소 라벨링 (평균 O(n), DBSCAN과 같은 결과).
+
+    셀 크기가 eps라서 반경 eps 이웃은 모두 3x3 이웃 셀 안에 있다.
+    - 3x3 이웃 셀의 포인트 쌍만 만들어 실제 거리(<= eps)로 걸러서 이웃 그래프를 만듦
+    - 코어 판정: 이웃 수(자기 자신 포함) >= min_samples
+    - 코어끼리 이웃이면 같은 클러스터 (번호는 sklearn처럼 가장 앞선 코어 포인트 순)
+    - 비코어 포인트는 이웃 코어가 있으면 그중 가장 작은 클러스터 번호의 경계점, 없으면 노이즈
+    """
+    name = 'grid'
+
+    @staticmethod
+    def _neighbor_pairs(coords: np.ndarray, eps: float) -> Tuple[np.ndarray, np.ndarray]:
+        """거리 eps 이내인 포인트 쌍 (i, j) (자기 자신, 양방향 포함)."""
+        cells = np.floor(coords / eps).astype(np.int64)
+        cells -= cells.min(axis=0) - 1  # 이웃 셀 좌표가 음수가 되지 않도록
+        width = cells[:, 1].max() + 2
+        keys = cells[:, 0] * width + cells[:, 1]
+
+        # 셀 순서로 정렬한 포인트와 셀별 [start, start + count) 범위
+        order = np.argsort(keys, kind='stable')
+        cell_keys, starts, counts = np.unique(keys[order], return_index=True, return_counts=True)
+        num_cells = len(cell_keys)
+
+        # 셀별 3x3 이웃 셀 인덱스
+        neighbor_keys = cell_keys[:, None] + (_NEIGHBOR_OFFSETS[:, 0] * width + _NEIGHBOR_OFFSETS[:, 1])[None, :]
+        pos = np.minimum(np.searchsorted(cell_keys, neighbor_keys), num_cells - 1)
+        src_cell, nb_slot = np.nonzero(cell_keys[pos] == neighbor_keys)
+        dst_cell = pos[src_cell, nb_slot]
+
+        # (셀, 이웃 셀) 블록마다 count_src x count_dst 후보 쌍
+        sizes = counts[src_cell] * counts[dst_cell]
+        block = np.repeat(np.arange(len(sizes)), sizes)
+        t = np.arange(len(block)) - np.repeat(np.cumsum(sizes) - sizes, sizes)
+        dst_counts = counts[dst_cell][block]
+        i = order[starts[src_cell][block] + t // dst_counts]
+        j = order[starts[dst_cell][block] + t % dst_counts]
+
+        diff = coords[i] - coords[j]
+        close = np.einsum('ij,ij->i', diff, diff) <= eps * eps
+        return i[close], j[close]
+
+    def labels(self, coords: np.ndarray, eps: float, min_samples: int,
+               index: Optional[FrameSpatialIndex] = None) -> np.ndarray:
+        n = len(coords)
+        if n == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        coords = np.asarray(coords, dtype=np.float64)
+        i, j = self._neighbor_pairs(coords, eps)
+        core = np.bincount(i, minlength=n) >= min_samples
+
+        # 코어 포인트 간 연결 요소
+        edges = core[i] & core[j]
+        graph = coo_matrix((np.ones(edges.sum(), dtype=np.int8), (i[edges], j[edges])), shape=(n, n))
+        _, components = connected_components(graph, directed=False)
+
+        labels = np.full(n, -1, dtype=np.int64)
+        core_idx = np.flatnonzero(core)
+        if not len(core_idx):
+            return labels
+        # 클러스터 번호: 첫 코어 포인트 인덱스 순 (sklearn DBSCAN과 같은 번호)
+        component_ids, first = np.unique(components[core_idx], return_index=True)
+        rank = np.empty(components.max() + 1, dtype=np.int64)
+        rank[component_ids[np.argsort(first)]] = np.arange(len(component_ids))
+        labels[core_idx] = rank[components[core_idx]]
+
+        # 경계점: 이웃 코어 중 가장 작은 클러스터 번호 (DBSCAN이 번호 순으로 확장하며 먼저 닿는 클러스터)
+        border = ~core[i] & core[j]
+        if border.any():
+            nearest = np.full(n, np.iinfo(np.int64).max, dtype=np.int64)
+            np.minimum.at(nearest, i[border], labels[j[border]])
+            reached = nearest < np.iinfo(np.int64).max
+            labels[reached] = nearest[reached]
+        return labels
+
+
+CLUSTER_BACKENDS: Dict[str, Type[ClusterBackend]] = {
+    DBSCANBackend.name: DBSCANBackend,
+    GridHashBackend.name: GridHashBackend
+}
+
+
+def get_backend(name: str) -> ClusterBackend:
+    """CONFIG_PARAMS['CLUSTER_BACKEND'] 값으로 백엔드 생성."""
+    try:
+        return CLUSTER_BACKENDS[name]()
+    except KeyError:
+        raise ValueError(f"Unknown cluster backend: {name} (available: {', '.join(CLUSTER_BACKENDS)})")
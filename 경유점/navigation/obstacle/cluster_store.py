@@ -0,0 +1,82 @@
+import numpy as np
+from typing import Iterator, List, Tuple
+from scipy.spatial import ConvexHull, QhullError, cKDTree
+
+
+class ClusterStore:
+    """장애물 클러스터 저장소: 연속된 포인트 배열 + 오프셋.
+
+    cluster i의 포인트 = points[offsets[i]:offsets[i + 1]]
+    중심점, 바운딩 박스, 외접 반경, 볼록 껍질은 게시 시점에 한 번만 계산하고
+    중심점 KD-tree로 최근접 장애물을 O(log k)에 찾는다.
+    """
+    def __init__(self, points: np.ndarray, offsets: np.ndarray, version: int = 0):
+        self.points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 2)
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.version = version
+
+        counts = np.diff(self.offsets)
+        self.counts = counts
+        self.labels = np.repeat(np.arange(len(counts)), counts)
+        if len(counts):
+            starts = self.offsets[:-1]
+            self.centroids = np.add.reduceat(self.points, starts, axis=0) / counts[:, None]
+            self.bbox_min = np.minimum.reduceat(self.points, starts, axis=0)
+            self.bbox_max = np.maximum.reduceat(self.points, starts, axis=0)
+            spread = np.linalg.norm(self.points - self.centroids[self.labels], axis=1)
+            self.radii = np.maximum.reduceat(spread, starts)
+            self.hulls = [self._hull(self.points[s:e]) for s, e in zip(starts, self.offsets[1:])]
+            self._tree = cKDTree(self.centroids)
+        else:
+            self.centroids = np.empty((0, 2))
+            self.bbox_min = np.empty((0, 2))
+            self.bbox_max = np.empty((0, 2))
+            self.radii = np.empty(0)
+            self.hulls = []
+            self._tree = None
+
+    @staticmethod
+    def _hull(cluster: np.ndarray) -> np.ndarray:
+        """볼록 껍질 꼭짓점 (반시계 방향). 포인트가 부족하거나 일직선이면 원본 포인트."""
+        if len(cluster) < 3:
+            return cluster
+        try:
+            return cluster[ConvexHull(cluster).vertices]
+        except QhullError:
+            return cluster
+
+    @classmethod
+    def empty(cls, version: int = 0) -> 'ClusterStore':
+        return cls(np.empty((0, 2)), np.zeros(1, dtype=np.int64), version)
+
+    @classmethod
+    def from_clusters(cls, clusters: List[np.ndarray], version: int = 0) -> 'ClusterStore':
+        """클러스터별 (k, 2) 배열 리스트로부터 생성."""
+        if not len(clusters):
+            return cls.empty(version)
+        counts = [len(c) for c in clusters]
+        offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+        np.cumsum(counts, out=offsets[1:])
+        return cls(np.concatenate([np.asarray(c, dtype=np.float64).reshape(-1, 2) for c in clusters]),
+                   offsets, version)
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __getitem__(self, i: int) -> np.ndarray:
+        return self.points[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self) -> Iterator[np.ndarray]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def nearest(self, position) -> Tuple[float, int]:
+        """position에서 가장 가까운 클러스터 중심점까지 거리와 인덱스."""
+        if self._tree is None:
+            return float('inf'), -1
+        dist, idx = self._tree.query(np.asarray(position, dtype=np.float64))
+        return float(dist), int(idx)
+
+    def centroid_distances(self, position) -> np.ndarray:
+        """모든 클러스터 중심점까지 거리."""
+        return np.linalg.norm(self.centroids - np.asarray(position, dtype=np.float64), axis=1)
@@ -0,0 +1,118 @@
+import numpy as np
+from typing import Optional, Sequence, Tuple
+from scipy import ndimage
+
+
+class DistanceField:
+    """점유 격자의 부호 있는 유클리드 거리장 (m, 셀 중심 기준).
+
+    장애물 밖은 가장 가까운 장애물 셀까지 거리(양수), 장애물 안은 가장 가까운 빈 셀까지 거리(음수)이며
+    ±max_distance로 자른다. 만들어진 뒤에는 바꾸지 않는 스냅샷이라서 여러 스레드가 그대로 읽어도 된다.
+    """
+    def __init__(self, distance: np.ndarray, origin: Sequence[float], resolution: float,
+                 max_distance: float, version: int = 0):
+        self.distance = distance
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.resolution = float(resolution)
+        self.max_distance = float(max_distance)
+        self.version = version
+
+    @property
+    def shape(self) -> Tuple[int, int]:
+        return self.distance.shape
+
+    @staticmethod
+    def _signed_distance(obstacles: np.ndarray, resolution: float, max_distance: float) -> np.ndarray:
+        """창 하나의 부호 있는 거리 (잘린 값, float32)."""
+        distance = np.full(obstacles.shape, max_distance, dtype=np.float32)
+        if obstacles.any():
+            distance[:] = np.minimum(ndimage.distance_transform_edt(~obstacles) * resolution, max_distance)
+            if not obstacles.all():
+                inside = ndimage.distance_transform_edt(obstacles) * resolution
+                distance[obstacles] = -np.minimum(inside[obstacles], max_distance)
+            else:
+                distance[:] = -max_distance
+        return distance
+
+    @classmethod
+    def compute(cls, obstacles: np.ndarray, origin: Sequence[float], resolution: float,
+                max_distance: float, version: int = 0) -> 'DistanceField':
+        """격자 전체에 대해 거리 변환."""
+        return cls(cls._signed_distance(obstacles, resolution, max_distance),
+                   origin, resolution, max_distance, version)
+
+    def updated(self, obstacles: np.ndarray, changed: np.ndarray, version: int) -> 'DistanceField':
+        """바뀐 셀(changed) 주변만 다시 계산한 새 거리장.
+
+        changed는 obstacles와 같은 모양의 bool 마스크 또는 바뀐 셀 인덱스 (K, 2).
+        거리를 max_distance(h)로 자르므로 값이 바뀔 수 있는 셀은 바뀐 셀에서 h 이내뿐이고,
+        그 셀들의 값은 다시 h 이내의 장애물로만 정해진다. 따라서 바뀐 영역을 2h 넓힌 창에서
+        거리 변환을 하고 h 넓힌 안쪽만 기존 값에 덮어쓴다. 창이 격자의 절반을 넘으면 전체를 다시 계산한다.
+        """
+        changed = np.asarray(changed)
+        if changed.dtype == bool:
+            changed = np.argwhere(changed)
+        if not len(changed):
+            return DistanceField(self.distance, self.origin, self.resolution, self.max_distance, version)
+        (r0, c0), (r1, c1) = changed.min(axis=0), changed.max(axis=0)
+        halo = int(np.ceil(self.max_distance / self.resolution))
+        n, m = obstacles.shape
+
+        inner = (max(0, r0 - halo), min(n, r1 + halo + 1),
+                 max(0, c0 - halo), min(m, c1 + halo + 1))
+        outer = (max(0, r0 - 2 * halo), min(n, r1 + 2 * halo + 1),
+                 max(0, c0 - 2 * halo), min(m, c1 + 2 * halo + 1))
+        if (outer[1] - outer[0]) * (outer[3] - outer[2]) * 2 > n * m:
+            return DistanceField.compute(obstacles, self.origin, self.resolution, self.max_distance, version)
+
+        window = self._signed_distance(obstacles[outer[0]:outer[1], outer[2]:outer[3]],
+                                       self.resolution, self.max_distance)
+        distance = self.distance.copy()
+        distance[inner[0]:inner[1], inner[2]:inner[3]] = \
+            window[inner[0] - outer[0]:inner[1] - outer[0], inner[2] - outer[2]:inner[3] - outer[2]]
+        return DistanceField(distance, self.origin, self.resolution, self.max_distance, version)
+
+    def covers(self, points: np.ndarray) -> np.ndarray:
+        """월드 좌표 (N, 2)가 거리장 범위 안에 있는지 (N,) bool."""
+        rel = (np.asarray(points, dtype=np.float64).reshape(-1, 2) - self.origin) / self.resolution
+        return np.all((rel >= 0) & (rel < np.array(self.shape)), axis=1)
+
+    def _bilinear(self, points: np.ndarray):
+        u = (np.asarray(points, dtype=np.float64).reshape(-1, 2) - self.origin) / self.resolution - 0.5
+        upper = np.array(self.shape) - 2
+        base = np.clip(np.floor(u).astype(np.int64), 0, np.maximum(upper, 0))
+        frac = np.clip(u - base, 0.0, 1.0)
+        i, j = base[:, 0], base[:, 1]
+        i1 = np.minimum(i + 1, self.shape[0] - 1)
+        j1 = np.minimum(j + 1, self.shape[1] - 1)
+        d = self.distance
+        return d[i, j], d[i1, j], d[i, j1], d[i1, j1], frac[:, 0], frac[:, 1]
+
+    def clearance(self, points: np.ndarray) -> np.ndarray:
+        """월드 좌표 (N, 2)의 장애물까지 거리 (쌍선형 보간, m)."""
+        v00, v10, v01, v11, fx, fz = self._bilinear(points)
+        return (v00 * (1 - fx) * (1 - fz) + v10 * fx * (1 - fz) +
+                v01 * (1 - fx) * fz + v11 * fx * fz).astype(np.float64)
+
+    def clearance_and_gradient(self, points: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """거리 (N,)와 기울기 (N, 2) [d/dx, d/dz]. 기울기는 장애물에서 멀어지는 방향."""
+        v00, v10, v01, v11, fx, fz = self._bilinear(points)
+        clearance = (v00 * (1 - fx) * (1 - fz) + v10 * fx * (1 - fz) +
+                     v01 * (1 - fx) * fz + v11 * fx * fz).astype(np.float64)
+        gx = ((v10 - v00) * (1 - fz) + (v11 - v01) * fz) / self.resolution
+        gz = ((v01 - v00) * (1 - fx) + (v11 - v10) * fx) / self.resolution
+        return clearance, np.column_stack((gx, gz)).astype(np.float64)
+
+    def min_clearance_along(self, starts: np.ndarray, ends: np.ndarray,
+                            step: Optional[float] = None) -> np.ndarray:
+        """선분별 (S,) 최소 거리. 셀 크기의 절반 간격(step)으로 샘플링한다."""
+        starts = np.atleast_2d(np.asarray(starts, dtype=np.float64))
+        ends = np.atleast_2d(np.asarray(ends, dtype=np.float64))
+        if not len(starts):
+            return np.zeros(0)
+        step = step or self.resolution * 0.5
+        longest = float(np.max(np.linalg.norm(ends - starts, axis=1)))
+        count = max(2, int(np.ceil(longest / step)) + 1)
+        t = np.linspace(0.0, 1.0, count)
+        samples = starts[:, None, :] + t[None, :, None] * (ends - starts)[:, None, :]
+        return self.clearance(samples.reshape(-1, 2)).reshape(len(starts), count).min(axis=1)
@@ -0,0 +1,197 @@
+import heapq
+import math
+import numpy as np
+from typing import List, Optional, Tuple
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+
+_SQRT2 = math.sqrt(2.0)
+_DIAG_EXTRA = _SQRT2 - 2.0
+_INF = math.inf
+
+
+class DStarLite:
+    """점유 격자 위 D* Lite 증분 경로 계획 (8-연결, 목표에서 출발점 방향으로 역탐색).
+
+    탐색 상태(g, rhs, 열린 집합)를 프레임 사이에 유지하고, 격자가 갱신되면
+    OccupancyGrid.changed_since()가 알려 주는 바뀐 셀 주변만 다시 계산한다.
+    격자 자체가 바뀌거나(재생성) 변경 기록이 끊기면 처음부터 다시 초기화한다.
+    셀 인덱스는 둘레에 점유 셀 한 줄을 덧댄 1차원 인덱스(idx = i * width + j)를 쓴다.
+    """
+    def __init__(self, grid: OccupancyGrid, goal: Tuple[int, int]):
+        self.grid = grid
+        self.goal_cell = (int(goal[0]), int(goal[1]))
+        self.width = grid.shape[1] + 2
+        self.goal = (self.goal_cell[0] + 1) * self.width + self.goal_cell[1] + 1
+        self.moves = [(di * self.width + dj, _SQRT2 if di and dj else 1.0)
+                      for di in (-1, 0, 1) for dj in (-1, 0, 1) if di or dj]
+        self._reset()
+
+    def _reset(self):
+        self.version = self.grid.version
+        self.blocked = bytearray(np.pad(self.grid.occupied, 1, constant_values=True).tobytes())
+        self.g = {}
+        self.rhs = {self.goal: 0.0}
+        self.km = 0.0
+        self.start = None
+        self.open_heap = []
+        self.open_keys = {}
+        self.expanded = 0  # 마지막 plan에서 확장한 노드 수
+
+    def _h(self, a: int, b: int) -> float:
+        ai, aj = divmod(a, self.width)
+        bi, bj = divmod(b, self.width)
+        di = abs(ai - bi)
+        dj = abs(aj - bj)
+        return di + dj + _DIAG_EXTRA * (di if di < dj else dj)
+
+    def _key(self, s: int) -> Tuple[float, float]:
+        m = min(self.g.get(s, _INF), self.rhs.get(s, _INF))
+        # 더하는 순서에 따른 부동소수 오차로 같은 키의 대소가 뒤집히지 않도록 반올림
+        return round(m + self._h(self.start, s) + self.km, 9), round(m, 9)
+
+    def _push(self, s: int):
+        key = self._key(s)
+        self.open_keys[s] = key
+        heapq.heappush(self.open_heap, (key, s))
+
+    def _update_vertex(self, s: int):
+        """rhs를 이웃에서 다시 계산하고 열린 집합 상태를 맞춤."""
+        if s != self.goal:
+            best = _INF
+            if not self.blocked[s]:
+                g = self.g
+                blocked = self.blocked
+                for delta, cost in self.moves:
+                    nb = s + delta
+                    if not blocked[nb]:
+                        value = cost + g.get(nb, _INF)
+                        if value < best:
+                            best = value
+            self.rhs[s] = best
+        self.open_keys.pop(s, None)
+        if self.g.get(s, _INF) != self.rhs.get(s, _INF):
+            self._push(s)
+
+    def _top_key(self) -> Tuple[float, float]:
+        heap = self.open_heap
+        while heap:
+            key, s = heap[0]
+            if self.open_keys.get(s) == key:
+                return key
+            heapq.heappop(heap)  # 갱신되거나 제거된 항목
+        return _INF, _INF
+
+    def _compute_shortest_path(self, max_expansions: int):
+        g = self.g
+        rhs = self.rhs
+        blocked = self.blocked
+        start = self.start
+        while True:
+            top = self._top_key()
+            start_rhs = rhs.get(start, _INF)
+            start_g = g.get(start, _INF)
+            if not (top < self._key(start) or start_rhs != start_g):
+                return
+            if top[0] == _INF or self.expanded >= max_expansions:
+                return
+            _, u = heapq.heappop(self.open_heap)
+            del self.open_keys[u]
+            self.expanded += 1
+            new_key = self._key(u)
+            if top < new_key:
+                self._push(u)
+                continue
+            g_u = g.get(u, _INF)
+            rhs_u = rhs.get(u, _INF)
+            if g_u > rhs_u:
+                # 과대 일관: g를 내리고 이웃 rhs를 그 값으로 완화
+                g[u] = rhs_u
+                if blocked[u]:
+                    continue
+                for delta, cost in self.moves:
+                    s = u + delta
+                    if s == self.goal or blocked[s]:
+                        continue
+                    value = cost + rhs_u
+                    if value < rhs.get(s, _INF):
+                        rhs[s] = value
+                        self.open_keys.pop(s, None)
+                        if g.get(s, _INF) != value:
+                            self._push(s)
+            else:
+                # 과소 일관: g를 무한대로 올리고 u와 이웃을 다시 계산
+                g[u] = _INF
+                self._update_vertex(u)
+                for delta, _ in self.moves:
+                    self._update_vertex(u + delta)
+
+    def _apply_changes(self, cells: np.ndarray):
+        """점유 상태가 바뀐 셀(격자 1차원 인덱스)을 반영하고 영향을 받는 정점을 다시 계산."""
+        if not len(cells):
+            return
+        nz = self.grid.shape[1]
+        padded = (cells // nz + 1) * self.width + cells % nz + 1
+        occupied = self.grid.occupied.ravel()[cells]
+        blocked = self.blocked
+        for idx, occ in zip(padded.tolist(), occupied.tolist()):
+            blocked[idx] = 1 if occ else 0
+        if self.start is None:
+            return  # 아직 탐색 전: 복구할 상태가 없음
+        touched = set(padded.tolist())
+        for idx in padded.tolist():
+            for delta, _ in self.moves:
+                touched.add(idx + delta)
+        for s in touched:
+            self._update_vertex(s)
+
+    def sync(self) -> bool:
+        """격자의 새 version을 반영. 변경 기록이 끊겨서 초기화했으면 True."""
+        if self.grid.version == self.version:
+            return False
+        cells = self.grid.changed_since(self.version)
+        if cells is None:
+            self._reset()
+            return True
+        self.version = self.grid.version
+        self._apply_changes(cells)
+        return False
+
+    def plan(self, start: Tuple[int, int], max_expansions: int = 2_000_000) -> Optional[List[Tuple[int, int]]]:
+        """start 셀에서 목표 셀까지 셀 경로. 경로가 없으면 None.
+
+        sync()로 바뀐 셀을 먼저 반영해 두어야 한다. 출발점이 움직이면 km으로 기존 키를 보정한다.
+        """
+        start_idx = (int(start[0]) + 1) * self.width + int(start[1]) + 1
+        if self.start is None:
+            self.start = start_idx
+            self._push(self.goal)
+        elif start_idx != self.start:
+            self.km += self._h(self.start, start_idx)
+            self.start = start_idx
+        self.expanded = 0
+        if self.blocked[start_idx] or self.blocked[self.goal]:
+            return None
+        self._compute_shortest_path(max_expansions)
+        if self.g.get(start_idx, _INF) == _INF and self.rhs.get(start_idx, _INF) == _INF:
+            return None
+        return self._extract_path(start_idx)
+
+    def _extract_path(self, node: int) -> Optional[List[Tuple[int, int]]]:
+        """g 값을 따라 내려가며 셀 경로 구성."""
+        g = self.g
+        blocked = self.blocked
+        path = [node]
+        limit = len(g) + 1
+        while node != self.goal:
+            best, best_value = -1, _INF
+            for delta, cost in self.moves:
+                nb = node + delta
+                if not blocked[nb]:
+                    value = cost + g.get(nb, _INF)
+                    if value < best_value:
+                        best, best_value = nb, value
+            if best < 0 or best_value == _INF or len(path) > limit:
+                return None
+            node = best
+            path.append(node)
+        return [((n // self.width) - 1, (n % self.width) - 1) for n in path]
@@ -0,0 +1,239 @@
+import heapq
+import math
+import numpy as np
+from typing import Callable, List, Optional, Tuple
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+
+_SQRT2 = math.sqrt(2.0)
+_DIAG_EXTRA = _SQRT2 - 2.0
+_ALL_DIRECTIONS = [(1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1)]
+
+
+class _JumpSearch:
+    """점유 격자 위 점프 포인트 탐색(JPS) 상태.
+
+    격자 둘레에 점유 셀 한 줄을 덧댄 1차원 인덱스(idx = i * width + j)를 쓰므로 경계 검사가 없다.
+    직진 점프는 OccupancyGrid.jump_tables()의 stop 테이블에서 bytes.find/rfind로 한 번에 찾는다.
+    """
+    def __init__(self, grid: OccupancyGrid, goal: int):
+        tables = grid.jump_tables()
+        self.blocked = tables['blocked']
+        self.stop_east = tables['stop_east']
+        self.stop_west = tables['stop_west']
+        self.stop_south = tables['stop_south']
+        self.stop_north = tables['stop_north']
+        self.width = grid.shape[1] + 2
+        self.height = grid.shape[0] + 2
+        self.goal = goal
+        self.goal_i, self.goal_j = divmod(goal, self.width)
+
+    def _jump_row(self, node: int, dj: int) -> int:
+        """같은 행에서 dj 방향 직진 점프. 점프 포인트 인덱스, 없으면 -1."""
+        if dj > 0:
+            k = self.stop_east.find(1, node + 1)
+            if self.goal_i == node // self.width and node < self.goal <= k:
+                return self.goal
+        else:
+            k = self.stop_west.rfind(1, 0, node)
+            if self.goal_i == node // self.width and k <= self.goal < node:
+                return self.goal
+        return -1 if self.blocked[k] else k
+
+    def _jump_col(self, node: int, di: int) -> int:
+        """같은 열에서 di 방향 직진 점프 (전치된 테이블 사용). 점프 포인트 인덱스, 없으면 -1."""
+        i, j = divmod(node, self.width)
+        t = j * self.height + i
+        if di > 0:
+            k = self.stop_south.find(1, t + 1) - j * self.height
+            if self.goal_j == j and i < self.goal_i <= k:
+                return self.goal
+        else:
+            k = self.stop_north.rfind(1, j * self.height, t) - j * self.height
+            if self.goal_j == j and k <= self.goal_i < i:
+                return self.goal
+        k = k * self.width + j
+        return -1 if self.blocked[k] else k
+
+    def jump(self, node: int, di: int, dj: int) -> int:
+        """node에서 (di, dj) 방향으로 다음 점프 포인트. 없으면 -1."""
+        if di == 0:
+            return self._jump_row(node, dj)
+        if dj == 0:
+            return self._jump_col(node, di)
+        blocked = self.blocked
+        step = di * self.width + dj
+        back_i = di * self.width
+        while True:
+            node += step
+            if blocked[node]:
+                return -1
+            if node == self.goal:
+                return node
+            # 대각 이동의 강제 이웃
+            if (blocked[node - back_i] and not blocked[node - back_i + dj]) or \
+                    (blocked[node - dj] and not blocked[node + back_i - dj]):
+                return node
+            if self._jump_row(node, dj) != -1 or self._jump_col(node, di) != -1:
+                return node
+
+    def directions(self, node: int, parent: int) -> List[Tuple[int, int]]:
+        """이동 방향에 따라 가지치기한 탐색 방향 (자연 이웃 + 강제 이웃)."""
+        if parent < 0:
+            return _ALL_DIRECTIONS
+        ni, nj = divmod(node, self.width)
+        pi, pj = divmod(parent, self.width)
+        di = (ni > pi) - (ni < pi)
+        dj = (nj > pj) - (nj < pj)
+        blocked = self.blocked
+        w = self.width
+        if di == 0:
+            dirs = [(0, dj)]
+            if blocked[node - w]:
+                dirs.append((-1, dj))
+            if blocked[node + w]:
+                dirs.append((1, dj))
+        elif dj == 0:
+            dirs = [(di, 0)]
+            if blocked[node - 1]:
+                dirs.append((di, -1))
+            if blocked[node + 1]:
+                dirs.append((di, 1))
+        else:
+            dirs = [(di, 0), (0, dj), (di, dj)]
+            if blocked[node - di * w]:
+                dirs.append((-di, dj))
+            if blocked[node - dj]:
+                dirs.append((di, -dj))
+        return dirs
+
+    def heuristic(self, node: int) -> float:
+        """옥타일 거리 (셀 단위)."""
+        i, j = divmod(node, self.width)
+        di = abs(i - self.goal_i)
+        dj = abs(j - self.goal_j)
+        return di + dj + _DIAG_EXTRA * (di if di < dj else dj)
+
+
+def jump_point_search(grid: OccupancyGrid, start: Tuple[int, int],
+                      goal: Tuple[int, int]) -> Optional[List[Tuple[int, int]]]:
+    """8-연결 점프 포인트 탐색 (열린 집합은 heapq 이진 힙).
+
+    점프 포인트(방향이 바뀌는 셀) 목록을 반환하고, 경로가 없으면 None.
+    start, goal은 빈 셀이어야 한다.
+    """
+    width = grid.shape[1] + 2
+    start_idx = (int(start[0]) + 1) * width + int(start[1]) + 1
+    goal_idx = (int(goal[0]) + 1) * width + int(goal[1]) + 1
+    search = _JumpSearch(grid, goal_idx)
+    if search.blocked[start_idx] or search.blocked[goal_idx]:
+        return None
+
+    g = {start_idx: 0.0}
+    parent = {start_idx: -1}
+    closed = set()
+    open_heap = [(search.heuristic(start_idx), 0.0, start_idx)]
+    while open_heap:
+        _, neg_g, node = heapq.heappop(open_heap)
+        if node == goal_idx:
+            break
+        if node in closed:
+            continue
+        closed.add(node)
+        node_g = -neg_g
+        ni, nj = divmod(node, width)
+        for di, dj in search.directions(node, parent[node]):
+            jp = search.jump(node, di, dj)
+            if jp < 0 or jp in closed:
+                continue
+            ji, jj = divmod(jp, width)
+            steps = max(abs(ji - ni), abs(jj - nj))
+            new_g = node_g + (steps * _SQRT2 if di and dj else steps)
+            if new_g < g.get(jp, math.inf):
+                g[jp] = new_g
+                parent[jp] = node
+                # 같은 f면 g가 큰(목표에 더 가까운) 노드 우선
+                heapq.heappush(open_heap, (new_g + search.heuristic(jp), -new_g, jp))
+    else:
+        return None
+
+    path = []
+    node = goal_idx
+    while node != -1:
+        i, j = divmod(node, width)
+        path.append((i - 1, j - 1))
+        node = parent[node]
+    path.reverse()
+    return path
+
+
+def smooth_path(grid: OccupancyGrid, waypoints: List[Tuple[float, float]],
+                window: int = 16) -> List[Tuple[float, float]]:
+    """시야선(line-of-sight) 단축: 기준점에서 직선으로 닿는 가장 먼 점으로 건너뛴다.
+
+    기준점 이후 window개 점까지의 선분을 한 번에 검사하고, 마지막 점까지 보이면 창을 넓힌다.
+    """
+    if len(waypoints) < 3:
+        return list(waypoints)
+    points = np.asarray(waypoints, dtype=np.float64)
+    smoothed = [waypoints[0]]
+    anchor = 0
+    while anchor < len(points) - 1:
+        nxt = anchor + 1
+        lo, size = anchor + 2, window
+        while lo < len(points):
+            hi = min(len(points), lo + size)
+            visible = np.flatnonzero(grid.segments_free(points[anchor], points[lo:hi]))
+            if len(visible):
+                nxt = lo + int(visible[-1])
+            if nxt != hi - 1:
+                break
+            lo, size = hi, size * 2
+        smoothed.append(waypoints[nxt])
+        anchor = nxt
+    return smoothed
+
+
+def corner_cells(cells: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """셀 경로에서 방향이 바뀌는 셀만 남김 (양 끝 포함)."""
+    if len(cells) < 3:
+        return list(cells)
+    c = np.asarray(cells, dtype=np.int64)
+    step = np.diff(c, axis=0)
+    turn = np.flatnonzero(np.any(step[1:] != step[:-1], axis=1)) + 1
+    return [cells[0]] + [cells[k] for k in turn.tolist()] + [cells[-1]]
+
+
+def plan_path(grid: OccupancyGrid, start: Tuple[float, float],
+              goal: Tuple[float, float],
+              search: Optional[Callable[[Tuple[int, int], Tuple[int, int]],
+                                        Optional[List[Tuple[int, int]]]]] = None
+              ) -> Optional[List[Tuple[float, float]]]:
+    """월드 좌표 start -> goal 경로 (평활화된 폴리라인, 양 끝점 포함). 경로가 없으면 None.
+
+    start가 팽창 영역 안이면 가장 가까운 빈 셀에서 출발하고,
+    goal이 팽창 영역 안이면 가장 가까운 빈 셀에서 끝낸다.
+    search(start_cell, goal_cell)는 셀 경로 탐색기이며 기본값은 jump_point_search.
+    """
+    start = (float(start[0]), float(start[1]))
+    goal = (float(goal[0]), float(goal[1]))
+    if grid.segment_free(start, goal):
+        return [start, goal]
+
+    start_cell = grid.nearest_free_cell(grid.world_to_cell(start))
+    goal_cell = grid.nearest_free_cell(grid.world_to_cell(goal))
+    if start_cell is None or goal_cell is None:
+        return None
+    if search is None:
+        cells = jump_point_search(grid, start_cell, goal_cell)
+    else:
+        cells = search(start_cell, goal_cell)
+    if cells is None:
+        return None
+    cells = corner_cells(cells)
+
+    corners = [(float(x), float(z)) for x, z in grid.cell_to_world(cells)]
+    end = goal if tuple(grid.world_to_cell(goal)) == goal_cell else corners[-1]
+    waypoints = [start] + corners[1:-1] + [end]
+    if tuple(grid.world_to_cell(start)) != start_cell:
+        waypoints.insert(1, corners[0])
+    return smooth_path(grid, waypoints)
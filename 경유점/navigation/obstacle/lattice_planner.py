@@ -0,0 +1,167 @@
+import heapq
+import math
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+
+# 한 모션 프리미티브를 따라 저장하는 중간 점 개수 (경로 출력용)
+_PATH_SAMPLES = 4
+
+
+class MotionPrimitives:
+    """방위별 모션 프리미티브 표 (직진, 좌회전 호, 우회전 호).
+
+    방위는 headings개로 나누고 (heading = atan2(dx, dz), 0이 +z 방향), 회전 호는 반경 turn_radius로
+    정확히 방위 한 칸(2π / headings)만큼 돈다. 모든 프리미티브는 같은 호 길이를 가진다.
+    각 프리미티브가 지나는 셀은 시작점을 셀 안 여러 위치에 두고 구한 합집합을 (di, dj) 오프셋 마스크로
+    미리 저장하므로, 탐색 중 충돌 검사는 오프셋을 더한 인덱스 조회 한 번이다.
+    """
+    def __init__(self, resolution: float, turn_radius: float = 5.0, headings: int = 16,
+                 turn_penalty: float = 1.1):
+        self.resolution = float(resolution)
+        self.turn_radius = float(turn_radius)
+        self.headings = int(headings)
+        self.turn_penalty = turn_penalty
+        self.step = max(self.turn_radius * 2.0 * math.pi / self.headings, 2.0 * self.resolution)
+        # table[h] = [(dx, dz, dh, cost, offsets (K, 2) int, samples (_PATH_SAMPLES, 2)), ...]
+        self.table = [self._build(h) for h in range(self.headings)]
+        self._flat: Dict[int, List[List[Tuple[int, ...]]]] = {}
+
+    def heading_index(self, heading: float) -> int:
+        """라디안 방위 -> 가장 가까운 방위 인덱스."""
+        return int(round(heading / (2.0 * math.pi) * self.headings)) % self.headings
+
+    def heading_angle(self, index: int) -> float:
+        return 2.0 * math.pi * index / self.headings
+
+    def _arc(self, heading: float, dh: int, t: np.ndarray) -> np.ndarray:
+        """원점에서 heading으로 출발해 호 길이 t * step만큼 간 위치 (len(t), 2)."""
+        s = t * self.step
+        if dh == 0:
+            return np.column_stack((s * math.sin(heading), s * math.cos(heading)))
+        # dh > 0: 방위 증가 방향(+x 쪽으로 도는 시계 방향)으로 회전
+        kappa = dh / self.turn_radius
+        theta = heading + kappa * s
+        return np.column_stack(((math.cos(heading) - np.cos(theta)) / kappa,
+                                (np.sin(theta) - math.sin(heading)) / kappa))
+
+    def _build(self, h: int) -> list:
+        heading = self.heading_angle(h)
+        count = max(2, int(math.ceil(self.step / (self.resolution * 0.5))) + 1)
+        t = np.linspace(0.0, 1.0, count)
+        # 셀 안 시작 위치 (셀 크기 기준 비율): 가운데와 네 모서리 근처
+        starts = (np.array([[0.5, 0.5], [0.05, 0.05], [0.05, 0.95], [0.95, 0.05], [0.95, 0.95]]) *
+                  self.resolution)
+        primitives = []
+        for dh in (0, -1, 1):
+            points = self._arc(heading, dh, t)
+            swept = (starts[:, None, :] + points[None, :, :]).reshape(-1, 2)
+            offsets = np.unique(np.floor(swept / self.resolution).astype(np.int64), axis=0)
+            end = points[-1]
+            cost = self.step * (self.turn_penalty if dh else 1.0)
+            samples = self._arc(heading, dh, np.linspace(0.0, 1.0, _PATH_SAMPLES + 1)[1:])
+            primitives.append((float(end[0]), float(end[1]), dh, cost, offsets, samples))
+        return primitives
+
+    def flat_offsets(self, width: int) -> List[List[Tuple[int, ...]]]:
+        """덧댄 격자 폭(width)에 맞춘 1차원 오프셋 마스크 [방위][프리미티브] (폭마다 한 번 계산)."""
+        if width not in self._flat:
+            self._flat[width] = [[tuple((offsets[:, 0] * width + offsets[:, 1]).tolist())
+                                  for *_, offsets, _ in row] for row in self.table]
+        return self._flat[width]
+
+    def reach(self) -> int:
+        """프리미티브가 시작 셀에서 벗어나는 최대 셀 수 (격자 덧대기 폭)."""
+        return int(max(np.abs(p[4]).max() for row in self.table for p in row)) + 1
+
+
+def hybrid_astar(grid: OccupancyGrid, primitives: MotionPrimitives,
+                 start: Tuple[float, float], heading: float, goal: Tuple[float, float],
+                 goal_tolerance: Optional[float] = None, heuristic_weight: float = 1.5,
+                 max_expansions: int = 20000, max_final_turn: float = math.pi / 4,
+                 time_budget: Optional[float] = None) -> Optional[List[Tuple[float, float]]]:
+    """연속 위치 + 이산 방위 상태로 Hybrid A* 탐색. 월드 좌표 경로(출발점 포함), 실패하면 None.
+
+    상태는 (셀, 방위 인덱스)로 닫힌 집합을 관리하고, 위치는 프리미티브 끝점을 그대로 누적한다.
+    goal_tolerance(기본값: 프리미티브 길이) 안에 들고, goal 방향이 현재 방위에서 max_final_turn(라디안) 이내이며
+    goal까지 직선이 비어 있으면 goal로 연결해 끝낸다.
+    휴리스틱은 유클리드 거리에 heuristic_weight를 곱한 값이다 (1보다 크면 최적성 대신 속도).
+    time_budget(초)을 주면 그 시간이 지나면 탐색을 멈추고 None을 반환한다 (제어 주기 안에 끝내기 위함).
+    """
+    deadline = time.perf_counter() + time_budget if time_budget is not None else None
+    start = (float(start[0]), float(start[1]))
+    goal = (float(goal[0]), float(goal[1]))
+    tolerance = primitives.step if goal_tolerance is None else goal_tolerance
+    pad = primitives.reach()
+    occupied = np.pad(grid.occupied, pad, constant_values=True).tobytes()
+    width = grid.shape[1] + 2 * pad
+    masks = primitives.flat_offsets(width)
+    headings = primitives.headings
+    origin_x, origin_z = float(grid.origin[0]), float(grid.origin[1])
+    inv_res = 1.0 / grid.resolution
+
+    def cell_of(x: float, z: float) -> int:
+        return (int(math.floor((x - origin_x) * inv_res)) + pad) * width + \
+            int(math.floor((z - origin_z) * inv_res)) + pad
+
+    def h(x: float, z: float) -> float:
+        return heuristic_weight * math.hypot(goal[0] - x, goal[1] - z)
+
+    start_cell = cell_of(*start)
+    if not 0 <= start_cell < len(occupied) or occupied[start_cell]:
+        return None
+    start_h = primitives.heading_index(heading)
+    start_key = start_cell * headings + start_h
+    nodes = {start_key: (start[0], start[1], start_h, 0.0, -1, -1)}  # x, z, 방위, g, 부모 키, 프리미티브
+    open_heap = [(h(*start), 0.0, start_key)]
+    closed = set()
+    expansions = 0
+    while open_heap and expansions < max_expansions:
+        _, neg_g, key = heapq.heappop(open_heap)
+        if key in closed:
+            continue
+        closed.add(key)
+        expansions += 1
+        if deadline is not None and not expansions % 256 and time.perf_counter() > deadline:
+            return None
+        x, z, hi, g, _, _ = nodes[key]
+        if math.hypot(goal[0] - x, goal[1] - z) <= tolerance:
+            turn = math.atan2(goal[0] - x, goal[1] - z) - primitives.heading_angle(hi)
+            if abs(math.atan2(math.sin(turn), math.cos(turn))) <= max_final_turn and \
+                    grid.segment_free((x, z), goal):
+                return _trace(nodes, key, primitives, goal)
+        base = cell_of(x, z)
+        for k, (dx, dz, dh, cost, _, _) in enumerate(primitives.table[hi]):
+            if any(occupied[base + offset] for offset in masks[hi][k]):
+                continue
+            # 마스크가 끝 셀까지 덮고 덧댄 테두리는 점유이므로 격자 밖으로 나가는 프리미티브는 여기서 걸러짐
+            nx, nz = x + dx, z + dz
+            cell = cell_of(nx, nz)
+            nh = (hi + dh) % headings
+            nkey = cell * headings + nh
+            if nkey in closed:
+                continue
+            ng = g + cost
+            if nkey not in nodes or ng < nodes[nkey][3]:
+                nodes[nkey] = (nx, nz, nh, ng, key, k)
+                heapq.heappush(open_heap, (ng + h(nx, nz), -ng, nkey))
+    return None
+
+
+def _trace(nodes: dict, key: int, primitives: MotionPrimitives,
+           goal: Tuple[float, float]) -> List[Tuple[float, float]]:
+    """부모를 따라가며 각 프리미티브의 중간 점까지 포함한 경로 구성."""
+    chain = []
+    while key != -1:
+        chain.append(nodes[key])
+        key = nodes[key][4]
+    chain.reverse()
+    path = [(chain[0][0], chain[0][1])]
+    for parent, node in zip(chain, chain[1:]):
+        samples = primitives.table[parent[2]][node[5]][5]
+        path.extend((parent[0] + float(sx), parent[1] + float(sz)) for sx, sz in samples[:-1])
+        path.append((node[0], node[1]))
+    if path[-1] != goal:
+        path.append(goal)
+    return path
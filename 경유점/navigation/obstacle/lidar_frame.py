@@ -0,0 +1,134 @@
+"""
+바이너리 LiDAR 프레임 포맷 (little-endian)
+
+  헤더 36 bytes: magic(4s) version(B) flags(B) reserved(H) timestamp(d)
+                 pose_x(f) pose_y(f) pose_z(f) heading_rad(f) point_count(I)
+  본문: point_count 개의 float32 레코드 (x, y, z) 또는 (x, y, z, intensity)
+
+flags
+  bit0     : intensity 포함 (레코드 16 bytes, 없으면 12 bytes)
+  bit1-2   : 본문 압축 (0 없음, 1 gzip, 2 zstd)
+  bit3     : 포인트가 차량 좌표계 (pose로 월드 변환 필요)
+"""
+
+import gzip
+import struct
+import zlib
+import numpy as np
+from typing import NamedTuple, Optional, Tuple
+from navigation.obstacle.point_cloud import POINT_DTYPE
+
+try:
+    import zstandard
+except ImportError:  # zstd 압축은 선택 사항
+    zstandard = None
+
+
+FRAME_MAGIC = b'LDR1'
+FRAME_VERSION = 1
+HEADER_FORMAT = '<4sBBHdffffI'
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+
+FLAG_INTENSITY = 0x01
+FLAG_LOCAL = 0x08
+COMPRESSION_MASK = 0x06
+COMPRESSION_NONE = 0x00
+COMPRESSION_GZIP = 0x02
+COMPRESSION_ZSTD = 0x04
+
+XYZ_DTYPE = np.dtype([('x', '<f4'), ('y', '<f4'), ('z', '<f4')])
+
+# 손상된 압축 본문에서 나는 예외 (ValueError로 바꿔서 400 응답)
+_DECOMPRESS_ERRORS = (zlib.error, EOFError) + ((zstandard.ZstdError,) if zstandard is not None else ())
+
+
+class LidarFrame(NamedTuple):
+    timestamp: float
+    position: Tuple[float, float, float]
+    heading: float
+    points: np.ndarray
+    local: bool
+
+    @property
+    def pose(self) -> Tuple[float, float, float]:
+        """PointFilter에 넘길 (x, z, heading_rad)."""
+        return (self.position[0], self.position[2], self.heading)
+
+
+def _decompress(body: memoryview, compression: int, expected_size: int) -> bytes:
+    """본문 압축 해제. 출력은 expected_size + 1 bytes까지만 만들어서 압축 폭탄을 막는다 (크기 검사는 호출 측)."""
+    if compression == COMPRESSION_GZIP:
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)  # gzip 헤더
+        return decompressor.decompress(body, expected_size + 1)
+    if compression == COMPRESSION_ZSTD:
+        if zstandard is None:
+            raise ValueError("zstd compressed frame but 'zstandard' is not installed")
+        with zstandard.ZstdDecompressor().stream_reader(body) as reader:
+            return reader.read(expected_size + 1)
+    raise ValueError(f"Unknown compression flag: {compression:#x}")
+
+
+def decode_frame(payload: bytes) -> LidarFrame:
+    """바이너리 프레임을 디코딩. 압축이 없으면 본문을 복사 없이 np.frombuffer로 참조."""
+    if len(payload) < HEADER_SIZE:
+        raise ValueError(f"Frame too short: {len(payload)} bytes")
+    (magic, version, flags, _, timestamp,
+     pose_x, pose_y, pose_z, heading, count) = struct.unpack_from(HEADER_FORMAT, payload)
+    if magic != FRAME_MAGIC:
+        raise ValueError(f"Bad frame magic: {magic!r}")
+    if version != FRAME_VERSION:
+        raise ValueError(f"Unsupported frame version: {version}")
+
+    dtype = POINT_DTYPE if flags & FLAG_INTENSITY else XYZ_DTYPE
+    expected_size = count * dtype.itemsize
+    body = memoryview(payload)[HEADER_SIZE:]
+    compression = flags & COMPRESSION_MASK
+    if compression != COMPRESSION_NONE:
+        try:
+            body = _decompress(body, compression, expected_size)
+        except _DECOMPRESS_ERRORS as e:
+            raise ValueError(f"Corrupt compressed frame body: {e}") from e
+        if len(body) != expected_size:
+            raise ValueError(f"Decompressed body is {len(body)} bytes, expected {expected_size} for {count} points")
+    elif len(body) < expected_size:
+        raise ValueError(f"Frame body too short for {count} points")
+
+    points = np.frombuffer(body, dtype=dtype, count=count)
+    return LidarFrame(
+        timestamp=timestamp,
+        position=(pose_x, pose_y, pose_z),
+        heading=heading,
+        points=points,
+        local=bool(flags & FLAG_LOCAL)
+    )
+
+
+def encode_frame(points: np.ndarray, timestamp: float = 0.0,
+                 position: Tuple[float, float, float] = (0.0, 0.0, 0.0),
+                 heading: float = 0.0, local: bool = False,
+                 compression: Optional[str] = None) -> bytes:
+    """테스트/시뮬레이터 클라이언트용 인코더. points는 (N, 3|4) float 배열 또는 구조화 배열."""
+    points = np.asarray(points)
+    if points.dtype.names is None:
+        points = np.ascontiguousarray(points[:, :4], dtype='<f4')
+        has_intensity = points.shape[1] > 3
+        body = points.tobytes()
+    else:
+        has_intensity = 'intensity' in points.dtype.names
+        body = points.astype(POINT_DTYPE if has_intensity else XYZ_DTYPE).tobytes()
+
+    flags = (FLAG_INTENSITY if has_intensity else 0) | (FLAG_LOCAL if local else 0)
+    if compression == 'gzip':
+        flags |= COMPRESSION_GZIP
+        body = gzip.compress(body, compresslevel=1)
+    elif compression == 'zstd':
+        if zstandard is None:
+            raise ValueError("'zstandard' is not installed")
+        flags |= COMPRESSION_ZSTD
+        body = zstandard.ZstdCompressor().compress(body)
+    elif compression is not None:
+        raise ValueError(f"Unknown compression: {compression}")
+
+    header = struct.pack(HEADER_FORMAT, FRAME_MAGIC, FRAME_VERSION, flags, 0, timestamp,
+                         position[0], position[1], position[2], heading, len(points))
+    return header + body
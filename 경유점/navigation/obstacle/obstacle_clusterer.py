@@ -1,48 +1,60 @@
 import numpy as np
 import logging
-from typing import Dict, List
-from sklearn.cluster import DBSCAN
-from scipy.spatial import KDTree
-from config.shared_config import SHARED, SHARED_LOCK
+from typing import Optional
+from navigation.obstacle.point_cloud import planar_coords
+from navigation.obstacle.cluster_backends import ClusterBackend, get_backend, group_labels
+from navigation.obstacle.spatial_index import FrameSpatialIndex
+from navigation.obstacle.cluster_store import ClusterStore
+from config.metrics import METRICS, timed
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 class ObstacleClusterer:
-    """DBSCAN을 사용한 장애물 클러스터링."""
-    def __init__(self, eps: float, min_samples: int):
+    """장애물 클러스터링 (백엔드: 'dbscan' 또는 'grid')."""
+    def __init__(self, eps: float, min_samples: int, backend: str = 'dbscan'):
         self.eps = eps
         self.min_samples = min_samples
+        self.backend = backend
 
-    def _adjust_eps(self, points: np.ndarray) -> float:
+    @property
+    def backend(self) -> str:
+        return self._backend.name
+
+    @backend.setter
+    def backend(self, name: str):
+        if getattr(self, '_backend', None) is None or self._backend.name != name:
+            self._backend: ClusterBackend = get_backend(name)
+
+    @timed("adjust_eps")
+    def _adjust_eps(self, index: FrameSpatialIndex) -> float:
         """포인트 간 평균 거리를 기반으로 eps 동적 조정."""
-        if not points.size:
+        avg_dist = index.mean_nn_distance()
+        if avg_dist is None:
             return self.eps
-        kdtree = KDTree(points)
-        distances, _ = kdtree.query(points, k=2)
-        avg_dist = np.mean(distances[:, 1])
         return max(1.0, min(5.0, avg_dist * 1.5))
 
-    def cluster_obstacles(self, points: List[Dict]) -> List[List[List[float]]]:
-        """DBSCAN으로 장애물 클러스터링."""
-        if not points:
-            return []
+    def cluster_obstacles(self, points: np.ndarray,
+                          index: Optional[FrameSpatialIndex] = None) -> ClusterStore:
+        """장애물 클러스터링. 결과를 ClusterStore(연속 포인트 배열 + 오프셋)로 반환.
+
+        index가 주어지면 프레임 공간 인덱스를 재사용하고 결과 라벨을 등록한다.
+        """
+        if not len(points):
+            return ClusterStore.empty()
         try:
-            coords = [[p['position']['x'], p['position']['z']] for p in points]
-            coords = np.array(coords)
-            
-            with SHARED_LOCK:
-                eps = self._adjust_eps(coords)
-                min_samples = self.min_samples
-            
-            db = DBSCAN(eps=eps, min_samples=min_samples).fit(coords)
-            labels = db.labels_
-            clusters = []
-            for label in set(labels) - {-1}:  # 노이즈(-1) 제외
-                cluster_points = [coords[i].tolist() for i in range(len(coords)) if labels[i] == label]
-                clusters.append(cluster_points)
-            
-            logging.debug(f"Clustered {len(clusters)} obstacle clusters")
+            if index is None:
+                index = FrameSpatialIndex(planar_coords(points))
+            coords = index.coords
+            eps = self._adjust_eps(index)
+
+            with METRICS.timer(f"cluster_{self.backend}"):
+                labels = self._backend.labels(coords, eps, self.min_samples, index)
+            index.set_labels(labels)
+            order, offsets = group_labels(labels)
+            clusters = ClusterStore(coords[order], offsets, version=index.version)
+
+            logger.debug("Clustered %d obstacle clusters (%s)", len(clusters), self.backend)
             return clusters
         except Exception as e:
-            logging.error(f"Clustering failed: {str(e)}", exc_info=True)
-            return []
\ No newline at end of file
+            logger.error("Clustering failed: %s", e, exc_info=True)
+            return ClusterStore.empty()
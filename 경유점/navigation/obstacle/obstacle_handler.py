@@ -1,74 +1,155 @@
 import logging
 from typing import List, Dict, Union, Optional, Tuple
 from navigation.obstacle.point_filter import PointFilter
+from navigation.obstacle.point_cloud import planar_coords
+from navigation.obstacle.spatial_index import FrameSpatialIndex
 from navigation.obstacle.obstacle_clusterer import ObstacleClusterer
 from navigation.obstacle.avoidance_commander import AvoidanceCommander
 from navigation.obstacle.path_planner import PathPlanner
 from navigation.obstacle.stats_provider import StatsProvider
-from config.shared_config import SHARED, SHARED_LOCK
+from navigation.obstacle.distance_field import DistanceField
+from config.shared_config import SHARED
+from config.state_store import StateStore
+from config.log_config import tick_logger
 
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
 
 class ObstacleHandler:
     """장애물 처리 메인 클래스: 각 모듈을 조율."""
-    def __init__(self):
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or SHARED
+        params = self.store['CONFIG_PARAMS']
+        self._config_version = self.store.version
         self.point_filter = PointFilter()
         self.clusterer = ObstacleClusterer(
-            eps=SHARED['CONFIG_PARAMS']['DBSCAN_EPS'],
-            min_samples=SHARED['CONFIG_PARAMS']['DBSCAN_MIN_SAMPLES']
+            eps=params['DBSCAN_EPS'],
+            min_samples=params['DBSCAN_MIN_SAMPLES'],
+            backend=params.get('CLUSTER_BACKEND', 'dbscan')
         )
         self.commander = AvoidanceCommander(
-            obstacle_radius=SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS']
+            obstacle_radius=params['OBSTACLE_RADIUS']
         )
         self.path_planner = PathPlanner(
-            obstacle_radius=SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS']
+            obstacle_radius=params['OBSTACLE_RADIUS'],
+            grid_resolution=params.get('GRID_RESOLUTION', 0.5),
+            grid_inflation=params.get('GRID_INFLATION', 1.0),
+            grid_size=params.get('GRID_SIZE', 500.0),
+            field_max_distance=params.get('FIELD_MAX_DISTANCE', 5.0),
+            mode=params.get('PATH_PLANNER', 'jps'),
+            cache_size=params.get('PATH_CACHE_SIZE', 64),
+            turn_radius=params.get('TURN_RADIUS', 5.0),
+            lattice_headings=params.get('LATTICE_HEADINGS', 16),
+            hybrid_time_budget=params.get('HYBRID_TIME_BUDGET', 0.05)
         )
         self.stats_provider = StatsProvider()
 
+    def _sync_config(self):
+        """대시보드에서 변경된 설정값을 각 모듈에 반영 (CONFIG_PARAMS가 바뀐 경우에만)."""
+        state = self.store.snapshot()
+        if not state.changed('CONFIG_PARAMS', self._config_version):
+            return
+        self._config_version = state.version
+        params = state['CONFIG_PARAMS']
+        self.clusterer.eps = params['DBSCAN_EPS']
+        self.clusterer.min_samples = params['DBSCAN_MIN_SAMPLES']
+        self.clusterer.backend = params.get('CLUSTER_BACKEND', 'dbscan')
+        self.commander.obstacle_radius = params['OBSTACLE_RADIUS']
+        self.path_planner.obstacle_radius = params['OBSTACLE_RADIUS']
+        self.path_planner.grid_resolution = params.get('GRID_RESOLUTION', 0.5)
+        self.path_planner.grid_inflation = params.get('GRID_INFLATION', 1.0)
+        self.path_planner.grid_size = params.get('GRID_SIZE', 500.0)
+        self.path_planner.field_max_distance = params.get('FIELD_MAX_DISTANCE', 5.0)
+        self.path_planner.mode = params.get('PATH_PLANNER', 'jps')
+        self.path_planner.path_cache.capacity = params.get('PATH_CACHE_SIZE', 64)
+        self.path_planner.turn_radius = params.get('TURN_RADIUS', 5.0)
+        self.path_planner.lattice_headings = params.get('LATTICE_HEADINGS', 16)
+        self.path_planner.hybrid_time_budget = params.get('HYBRID_TIME_BUDGET', 0.05)
+
     def update_obstacle(self, obstacle_data: Dict) -> Dict[str, str]:
-        """장애물 데이터를 업데이트하고 클러스터링 수행."""
+        """장애물 데이터를 업데이트하고 클러스터링 수행 (perceive -> update_map -> publish를 한 번에)."""
         try:
-            if not isinstance(obstacle_data, dict):
-                raise TypeError("obstacle_data must be a dictionary")
-            points = obstacle_data.get('lidarPoints', [])
-            filtered_points = self.point_filter.filter_points(points)
-            
-            with SHARED_LOCK:
-                SHARED['lidar_points'] = filtered_points
-                SHARED['obstacle_clusters'] = self.clusterer.cluster_obstacles(filtered_points)
-                logging.debug(f"Updated obstacles: {len(SHARED['lidar_points'])} points, "
-                              f"{len(SHARED['obstacle_clusters'])} clusters")
-            
+            perception = self.perceive(obstacle_data)
+            self.publish(perception, self.update_map(perception))
             return {"status": "OK", "message": "Obstacle data updated"}
         except Exception as e:
-            logging.error(f"Obstacle update failed: {str(e)}", exc_info=True)
+            logger.error("Obstacle update failed: %s", e, exc_info=True)
             return {"status": "ERROR", "message": str(e)}
 
-    def get_avoidance_command(self, current_position: Union[List, Tuple], 
+    def perceive(self, obstacle_data: Dict) -> Dict:
+        """인지 단계: 포인트 필터링, 프레임 공간 인덱스, 클러스터링. 공유 상태는 건드리지 않음."""
+        if not isinstance(obstacle_data, dict):
+            raise TypeError("obstacle_data must be a dictionary")
+        points = obstacle_data.get('lidarPoints', [])
+        pose = obstacle_data.get('pose')
+        self._sync_config()
+        filtered_points = self.point_filter.filter_points(points, pose)
+        # 프레임당 공간 인덱스 1개: eps 추정, DBSCAN, 경로 확인이 공유
+        index = FrameSpatialIndex(planar_coords(filtered_points))
+        clusters = self.clusterer.cluster_obstacles(filtered_points, index)
+        return {"points": filtered_points, "index": index, "clusters": clusters, "pose": pose}
+
+    def update_map(self, perception: Dict) -> Optional[DistanceField]:
+        """매핑 단계: 새 클러스터로 점유 격자와 거리장 갱신. 갱신된 거리장 반환."""
+        clusters = perception["clusters"]
+        return self.path_planner.update_map(clusters, self._map_center(perception["pose"], clusters))
+
+    def publish(self, perception: Dict, field: Optional[DistanceField]):
+        """인지/매핑 결과를 새 스냅샷 하나로 게시 (읽는 쪽은 네 값을 항상 같은 프레임 것으로 봄)."""
+        self.store.publish(
+            lidar_points=perception["points"],
+            obstacle_clusters=perception["clusters"],
+            spatial_index=perception["index"],
+            distance_field=field
+        )
+        tick_log.debug("Updated obstacles: %d points, %d clusters",
+                       len(perception['points']), len(perception['clusters']))
+
+    def _map_center(self, pose: Optional[Tuple[float, float, float]], clusters) -> Tuple[float, float]:
+        """점유 격자를 둘 기준 위치: LiDAR 포즈, 마지막 전차 위치, 클러스터 중심 순."""
+        if pose is not None:
+            return pose[0], pose[1]
+        player_pos = self.store['player_pos'].latest()
+        if player_pos is not None:
+            return player_pos
+        if len(clusters):
+            return tuple(clusters.centroids.mean(axis=0))
+        return 0.0, 0.0
+
+    def get_avoidance_command(self, current_position: Union[List, Tuple],
                             current_heading: float) -> Optional[Dict[str, Union[str, float]]]:
         """회피 명령 생성."""
-        with SHARED_LOCK:
-            clusters = SHARED['obstacle_clusters']
-        return self.commander.get_avoidance_command(current_position, current_heading, clusters)
+        self._sync_config()
+        state = self.store.snapshot()
+        return self.commander.get_avoidance_command(current_position, current_heading,
+                                                    state['obstacle_clusters'], state.get('distance_field'))
 
-    def is_obstacle_in_path(self, curr_x: float, curr_z: float, 
+    def is_obstacle_in_path(self, curr_x: float, curr_z: float,
                           lookahead_x: float, lookahead_z: float) -> bool:
         """경로 상 장애물 확인."""
-        with SHARED_LOCK:
-            clusters = SHARED['obstacle_clusters']
-        return self.path_planner.is_obstacle_in_path(curr_x, curr_z, lookahead_x, lookahead_z, clusters)
+        self._sync_config()
+        state = self.store.snapshot()
+        return self.path_planner.is_obstacle_in_path(curr_x, curr_z, lookahead_x, lookahead_z,
+                                                     state['obstacle_clusters'], state.get('spatial_index'),
+                                                     state.get('distance_field'))
+
+    def get_distance_field(self) -> Optional[DistanceField]:
+        """최근 맵 업데이트의 거리장 스냅샷 (아직 없으면 None)."""
+        return self.store.get('distance_field')
 
-    def find_alternative_path(self, curr_x: float, curr_z: float, 
-                           goal_x: float, goal_z: float) -> Optional[List[Tuple[float, float]]]:
-        """대체 경로 생성."""
-        with SHARED_LOCK:
-            clusters = SHARED['obstacle_clusters']
-        return self.path_planner.find_alternative_path(curr_x, curr_z, goal_x, goal_z, clusters)
+    def find_alternative_path(self, curr_x: float, curr_z: float,
+                           goal_x: float, goal_z: float,
+                           heading: Optional[float] = None) -> Optional[List[Tuple[float, float]]]:
+        """대체 경로 생성. heading(라디안)은 'hybrid' 계획에서 출발 방위로 쓴다."""
+        self._sync_config()
+        clusters = self.store['obstacle_clusters']
+        return self.path_planner.find_alternative_path(curr_x, curr_z, goal_x, goal_z, clusters, heading)
 
     def get_obstacle_stats(self) -> Dict[str, Union[int, float]]:
         """장애물 통계 제공."""
-        with SHARED_LOCK:
-            clusters = SHARED['obstacle_clusters']
-            player_pos = SHARED['player_pos'][-1] if SHARED['player_pos'] else [0.0, 0.0]
-        return self.stats_provider.get_obstacle_stats(clusters, player_pos)
\ No newline at end of file
+        state = self.store.snapshot()
+        player_pos = state['player_pos'].latest([0.0, 0.0])
+        stats = self.stats_provider.get_obstacle_stats(state['obstacle_clusters'], player_pos)
+        stats.update(self.path_planner.path_cache.stats())
+        return stats
@@ -0,0 +1,215 @@
+import copy
+import threading
+import numpy as np
+from collections import deque
+from typing import Optional, Sequence, Tuple
+from navigation.obstacle.distance_field import DistanceField
+
+
+class OccupancyGrid:
+    """월드 좌표에 고정된 2D 점유 격자 (x, z 평면).
+
+    cell (i, j)는 월드 좌표 [origin + (i, j) * resolution, origin + (i + 1, j + 1) * resolution)을 덮는다.
+    - obstacles: 장애물 포인트가 떨어진 셀
+    - occupied: obstacles를 inflation(m) 반경 원판으로 팽창한 셀 (계획에서 통과 불가)
+    - field: obstacles의 부호 있는 거리장. occupied는 field.distance <= inflation 으로 얻는다.
+    origin은 resolution의 정수배로 맞추므로 같은 해상도의 격자끼리는 셀 경계가 일치한다.
+    update()는 새 배열을 다 만든 뒤 한꺼번에 교체하므로(배열 자체는 고치지 않음), 다른 스레드에서 계획할 때는
+    snapshot()으로 한 version의 occupied/field를 고정해서 쓴다.
+    """
+    def __init__(self, origin: Sequence[float], resolution: float,
+                 shape: Tuple[int, int], inflation: float, max_distance: float = 5.0):
+        self.origin = np.asarray(origin, dtype=np.float64)
+        self.resolution = float(resolution)
+        self.shape = (int(shape[0]), int(shape[1]))
+        self.inflation = float(inflation)
+        self.obstacles = np.zeros(self.shape, dtype=bool)
+        self.occupied = np.zeros(self.shape, dtype=bool)
+        self._cells = np.zeros(0, dtype=np.int64)  # obstacles가 켜진 셀의 1차원 인덱스 (정렬)
+        # 팽창을 거리장으로 정확히 얻으려면 inflation보다 한 셀 이상 멀리까지 계산해야 함
+        self.max_distance = max(float(max_distance), self.inflation + self.resolution)
+        self.field: Optional[DistanceField] = None
+        self.version = 0
+        self._tables: Optional[Tuple[int, dict]] = None  # (만든 version, 점프 테이블)
+        # 최근 update마다 occupied가 바뀐 셀 (version, 1차원 인덱스 i * shape[1] + j)
+        self._changes = deque(maxlen=64)
+        self._lock = threading.Lock()  # update 결과 교체와 snapshot/점프 테이블 캐시 사이
+        self._source: Optional['OccupancyGrid'] = None  # snapshot이면 원래 격자
+
+    @classmethod
+    def around(cls, center: Sequence[float], size: float, resolution: float,
+               inflation: float, max_distance: float = 5.0) -> 'OccupancyGrid':
+        """center를 중심으로 한 변 size(m)인 정사각형 격자."""
+        cells = int(np.ceil(size / resolution))
+        origin = np.floor((np.asarray(center, dtype=np.float64) - size * 0.5) / resolution) * resolution
+        return cls(origin, resolution, (cells, cells), inflation, max_distance)
+
+    @property
+    def size(self) -> np.ndarray:
+        return np.array(self.shape) * self.resolution
+
+    def contains(self, xz: Sequence[float], margin: float = 0.0) -> bool:
+        """월드 좌표가 격자 안(가장자리에서 margin 이상 안쪽)에 있는지."""
+        rel = np.asarray(xz, dtype=np.float64) - self.origin
+        return bool(np.all(rel >= margin) and np.all(rel < self.size - margin))
+
+    def world_to_cell(self, xz) -> np.ndarray:
+        """월드 좌표 (..., 2) -> 셀 인덱스 (..., 2). 범위를 벗어나면 가장자리 셀로 자른다."""
+        cells = np.floor((np.asarray(xz, dtype=np.float64) - self.origin) / self.resolution).astype(np.int64)
+        return np.clip(cells, 0, np.array(self.shape) - 1)
+
+    def cell_to_world(self, cells) -> np.ndarray:
+        """셀 인덱스 (..., 2) -> 셀 중심 월드 좌표 (..., 2)."""
+        return self.origin + (np.asarray(cells, dtype=np.float64) + 0.5) * self.resolution
+
+    def update(self, points: np.ndarray) -> int:
+        """장애물 포인트 (N, 2)로 격자를 다시 채우고 거리장/팽창 갱신. 새 version 반환.
+
+        포인트를 셀 인덱스 집합으로 바꿔 이전 집합과 비교하므로 격자 전체를 새로 그리거나 비교하지 않는다.
+        obstacles는 바뀐 셀만 뒤집은 사본, 거리장은 바뀐 셀 주변만 다시 계산하고,
+        occupied도 바뀐 셀에서 팽창 반경 안쪽 창만 다시 구한다.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        cells = np.floor((points - self.origin) / self.resolution).astype(np.int64)
+        inside = np.all((cells >= 0) & (cells < np.array(self.shape)), axis=1)
+        cells = np.unique(np.ravel_multi_index(cells[inside].T, self.shape))
+        flipped = np.setxor1d(self._cells, cells, assume_unique=True)
+
+        version = self.version + 1
+        obstacles, occupied, changed = self.obstacles, self.occupied, np.zeros(0, dtype=np.int64)
+        if self.field is None:
+            obstacles = np.zeros(self.shape, dtype=bool)
+            obstacles.flat[cells] = True
+            field = DistanceField.compute(obstacles, self.origin, self.resolution,
+                                          self.max_distance, version)
+            occupied = field.distance <= self.inflation
+            changed = np.flatnonzero(occupied)
+        elif not len(flipped):
+            field = self.field.updated(obstacles, np.zeros((0, 2), dtype=np.int64), version)
+        else:
+            obstacles = obstacles.copy()
+            obstacles.flat[flipped] ^= True
+            rows, cols = np.unravel_index(flipped, self.shape)
+            field = self.field.updated(obstacles, np.column_stack((rows, cols)), version)
+            # 팽창 여부는 바뀐 셀에서 inflation(+1셀) 안쪽에서만 달라진다
+            halo = int(np.ceil(self.inflation / self.resolution)) + 1
+            i0, i1 = max(0, int(rows.min()) - halo), min(self.shape[0], int(rows.max()) + halo + 1)
+            j0, j1 = max(0, int(cols.min()) - halo), min(self.shape[1], int(cols.max()) + halo + 1)
+            window = field.distance[i0:i1, j0:j1] <= self.inflation
+            diff_i, diff_j = np.nonzero(window ^ self.occupied[i0:i1, j0:j1])
+            if len(diff_i):
+                occupied = occupied.copy()
+                occupied[i0:i1, j0:j1] = window
+                changed = np.ravel_multi_index((diff_i + i0, diff_j + j0), self.shape)
+        with self._lock:
+            self.obstacles = obstacles
+            self.field = field
+            self.occupied = occupied
+            self.version = version
+            self._cells = cells
+            self._changes.append((version, changed))
+        return version
+
+    def snapshot(self) -> 'OccupancyGrid':
+        """지금 version의 occupied/field/version을 고정한 읽기 전용 사본 (배열은 복사하지 않음).
+
+        이후 update()가 돌아도 사본은 바뀌지 않는다. 점프 테이블 캐시는 원래 격자와 공유한다.
+        """
+        with self._lock:
+            view = copy.copy(self)
+        view._source = self._source or self
+        return view
+
+    def same_grid(self, other: 'OccupancyGrid') -> bool:
+        """두 격자(또는 snapshot)가 같은 원래 격자에서 나온 것인지."""
+        return (self._source or self) is (other._source or other)
+
+    def changed_since(self, version: int) -> Optional[np.ndarray]:
+        """version 이후 occupied가 바뀐 셀의 1차원 인덱스. 기록이 그만큼 남아 있지 않으면 None."""
+        if version == self.version:
+            return np.zeros(0, dtype=np.int64)
+        with self._lock:  # snapshot과 공유하는 기록이라 이 version 이후 것만 센다
+            entries = [cells for v, cells in self._changes if version < v <= self.version]
+        if version > self.version or len(entries) != self.version - version:
+            return None
+        return np.unique(np.concatenate(entries))
+
+    def jump_tables(self) -> dict:
+        """점프 포인트 탐색용 바이트 테이블 (version마다 한 번 생성).
+
+        stop_*: 해당 방향으로 직진할 때 멈춰야 하는 셀 (점유 셀 또는 강제 이웃이 생기는 셀).
+        동/서는 행 우선 순서, 남/북(i 증가/감소)은 전치된 열 우선 순서로 저장해서
+        직진 탐색을 bytes.find / rfind 한 번으로 처리한다.
+        캐시는 만든 version을 함께 저장하므로, 만드는 도중 update()가 끼어들어도 다음 version에서
+        이전 occupied로 만든 테이블을 쓰는 일은 없다.
+        """
+        source = self._source or self
+        with source._lock:
+            cached = source._tables
+            occupied, version = self.occupied, self.version
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        tables = self._build_tables(occupied)
+        with source._lock:
+            if source.version == version:
+                source._tables = (version, tables)
+        return tables
+
+    @staticmethod
+    def _build_tables(occupied: np.ndarray) -> dict:
+        """occupied로 점프 테이블 생성 (jump_tables 참고)."""
+        p = np.pad(occupied, 1, constant_values=True)
+
+        def shifted(di: int, dj: int) -> np.ndarray:
+            # shifted(di, dj)[i, j] = p[i + di, j + dj], 범위 밖은 점유
+            out = np.ones_like(p)
+            h, w = p.shape
+            out[max(0, -di):h - max(0, di), max(0, -dj):w - max(0, dj)] = \
+                p[max(0, di):h - max(0, -di), max(0, dj):w - max(0, -dj)]
+            return out
+
+        east = p | (shifted(-1, 0) & ~shifted(-1, 1)) | (shifted(1, 0) & ~shifted(1, 1))
+        west = p | (shifted(-1, 0) & ~shifted(-1, -1)) | (shifted(1, 0) & ~shifted(1, -1))
+        south = p | (shifted(0, -1) & ~shifted(1, -1)) | (shifted(0, 1) & ~shifted(1, 1))
+        north = p | (shifted(0, -1) & ~shifted(-1, -1)) | (shifted(0, 1) & ~shifted(-1, 1))
+        return {
+            'blocked': p.tobytes(),
+            'stop_east': east.tobytes(),
+            'stop_west': west.tobytes(),
+            'stop_south': np.ascontiguousarray(south.T).tobytes(),
+            'stop_north': np.ascontiguousarray(north.T).tobytes()
+        }
+
+    def nearest_free_cell(self, cell: Tuple[int, int]) -> Optional[Tuple[int, int]]:
+        """cell이 점유 셀이면 주변(팽창 반경 + 2셀)에서 가장 가까운 빈 셀. 없으면 None."""
+        i, j = int(cell[0]), int(cell[1])
+        if not self.occupied[i, j]:
+            return i, j
+        r = int(np.ceil(self.inflation / self.resolution)) + 2
+        i0, j0 = max(0, i - r), max(0, j - r)
+        window = self.occupied[i0:i + r + 1, j0:j + r + 1]
+        free_i, free_j = np.nonzero(~window)
+        if not len(free_i):
+            return None
+        k = np.argmin((free_i + i0 - i) ** 2 + (free_j + j0 - j) ** 2)
+        return int(free_i[k] + i0), int(free_j[k] + j0)
+
+    def segment_free(self, start: Sequence[float], end: Sequence[float]) -> bool:
+        """월드 좌표 선분이 점유 셀을 지나지 않는지."""
+        return bool(self.segments_free(start, np.atleast_2d(end))[0])
+
+    def segments_free(self, start: Sequence[float], ends: np.ndarray) -> np.ndarray:
+        """start에서 각 ends[k]까지 선분이 점유 셀을 지나지 않는지 (K,) bool.
+
+        가장 긴 선분 기준 셀 크기의 절반 간격으로 모든 선분을 같은 개수만큼 샘플링한다.
+        """
+        start = np.asarray(start, dtype=np.float64)
+        ends = np.asarray(ends, dtype=np.float64).reshape(-1, 2)
+        if not len(ends):
+            return np.zeros(0, dtype=bool)
+        longest = float(np.max(np.linalg.norm(ends - start, axis=1)))
+        steps = max(2, int(np.ceil(longest / (self.resolution * 0.5))) + 1)
+        t = np.linspace(0.0, 1.0, steps)
+        samples = start + t[None, :, None] * (ends - start)[:, None, :]      # (K, steps, 2)
+        cells = self.world_to_cell(samples)
+        return ~self.occupied[cells[..., 0], cells[..., 1]].any(axis=1)
@@ -0,0 +1,70 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+_MISSING = object()
+
+
+class PathCache:
+    """대체 경로 LRU 캐시.
+
+    키는 (양자화된 start, 양자화된 goal, 반경 등 계획 조건)이고, 모든 항목은 하나의 맵 version에 묶인다.
+    조회 시 version이 바뀌었으면 전체를 비우므로 클러스터/격자가 바뀐 뒤의 오래된 경로는 반환되지 않는다.
+    경로가 없다는 결과(None)도 저장해서 같은 실패를 반복 계산하지 않는다.
+    """
+    MISSING = _MISSING  # get()에서 캐시에 없음을 나타내는 값
+
+    def __init__(self, capacity: int = 64):
+        self.capacity = capacity
+        self.version: Optional[Hashable] = None
+        self._entries: 'OrderedDict[Hashable, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def _check_version(self, version: Hashable):
+        if version != self.version:
+            if self._entries:
+                self.invalidations += 1
+                self._entries.clear()
+            self.version = version
+
+    def get(self, version: Hashable, key: Hashable):
+        """캐시된 경로 (None일 수 있음). 없으면 PathCache.MISSING."""
+        with self._lock:
+            self._check_version(version)
+            path = self._entries.get(key, _MISSING)
+            if path is _MISSING:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._entries.move_to_end(key)
+            return path
+
+    def put(self, version: Hashable, key: Hashable, path: Any):
+        """경로 저장. 용량을 넘으면 가장 오래 쓰지 않은 항목부터 제거."""
+        with self._lock:
+            self._check_version(version)
+            self._entries[key] = path
+            self._entries.move_to_end(key)
+            while len(self._entries) > max(self.capacity, 0):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.version = None
+
+    def stats(self) -> Dict[str, int]:
+        """적중/실패/제거 횟수와 현재 크기."""
+        with self._lock:
+            return {
+                "path_cache_size": len(self._entries),
+                "path_cache_hits": self.hits,
+                "path_cache_misses": self.misses,
+                "path_cache_evictions": self.evictions,
+                "path_cache_invalidations": self.invalidations
+            }
@@ -1,70 +1,267 @@
 import numpy as np
 import logging
+import threading
 from typing import List, Optional, Tuple
-from scipy.spatial import KDTree
+from navigation.obstacle.spatial_index import FrameSpatialIndex
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+from navigation.obstacle.distance_field import DistanceField
+from navigation.obstacle.grid_planner import plan_path
+from navigation.obstacle.dstar_lite import DStarLite
+from navigation.obstacle.path_cache import PathCache
+from navigation.obstacle.lattice_planner import MotionPrimitives, hybrid_astar
+from config.metrics import timed
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
+
+# segments_blocked에서 한 번에 계산하는 (선분, 포인트) 쌍의 최대 개수
+_MAX_PAIRS = 1 << 20
+
+
+def _perpendicular_hits(to_point: np.ndarray, path_vec: np.ndarray,
+                        length_sq: np.ndarray, radius_sq: float) -> np.ndarray:
+    """선분 시작점 기준 포인트 벡터(..., 2)가 선분 구간 안으로 투영되고 거리 < 반경인지."""
+    t = np.sum(to_point * path_vec, axis=-1) / length_sq
+    offset = to_point - t[..., None] * path_vec
+    dist_sq = np.sum(offset * offset, axis=-1)
+    return (t >= 0) & (t <= 1) & (dist_sq < radius_sq)
 
 class PathPlanner:
     """경로 상 장애물 확인 및 대체 경로 생성."""
-    def __init__(self, obstacle_radius: float):
+    def __init__(self, obstacle_radius: float, grid_resolution: float = 0.5,
+                 grid_inflation: float = 1.0, grid_size: float = 500.0,
+                 field_max_distance: float = 5.0, mode: str = 'jps',
+                 cache_size: int = 64, turn_radius: float = 5.0, lattice_headings: int = 16,
+                 hybrid_time_budget: float = 0.05):
         self.obstacle_radius = obstacle_radius
+        self.grid_resolution = grid_resolution  # 점유 격자 셀 크기 (m)
+        self.grid_inflation = grid_inflation  # 팽창 반경 = obstacle_radius * grid_inflation
+        self.grid_size = grid_size  # 격자 한 변 (m)
+        self.field_max_distance = field_max_distance  # 거리장 계산 범위 (m)
+        self.grid: Optional[OccupancyGrid] = None
+        self._grid_source = None  # 격자를 채운 ClusterStore version
+        self._grid_epoch = 0  # 격자를 새로 만들 때마다 증가 (경로 캐시 version의 일부)
+        self._grid_lock = threading.Lock()  # 맵 갱신(LiDAR 스레드)과 경로 계획(제어 스레드) 사이
+        self.mode = mode  # 'jps', 'dstar' 또는 'hybrid'
+        self._dstar: Optional[DStarLite] = None  # 'dstar' 모드에서 호출 사이에 유지하는 탐색 상태
+        self._dstar_lock = threading.Lock()
+        self.path_cache = PathCache(cache_size)
+        self.turn_radius = turn_radius  # 'hybrid' 모드 최소 회전 반경 (m)
+        self.lattice_headings = lattice_headings  # 'hybrid' 모드 방위 분할 수
+        self.hybrid_time_budget = hybrid_time_budget  # 'hybrid' 모드 탐색 시간 상한 (초), 넘으면 격자 경로
+        self.primitives = MotionPrimitives(grid_resolution, turn_radius, lattice_headings)
 
+    @timed("obstacle_in_path")
     def is_obstacle_in_path(self, curr_x: float, curr_z: float, 
                           lookahead_x: float, lookahead_z: float, 
-                          clusters: List[List[List[float]]]) -> bool:
+                          clusters: ClusterStore,
+                          index: Optional[FrameSpatialIndex] = None,
+                          field: Optional[DistanceField] = None) -> bool:
         """경로 상에 장애물 존재 여부 확인."""
         if not clusters or not all(isinstance(x, (int, float)) for x in [curr_x, curr_z, lookahead_x, lookahead_z]):
             return False
+        blocked = self.segments_blocked([[curr_x, curr_z]], [[lookahead_x, lookahead_z]], clusters, index, field)
+        return bool(blocked[0])
 
-        path_vec = np.array([lookahead_x - curr_x, lookahead_z - curr_z])
-        path_start = np.array([curr_x, curr_z])
-        path_length = np.linalg.norm(path_vec)
-        if path_length == 0:
-            return False
+    def segments_blocked(self, starts, ends, clusters: ClusterStore,
+                         index: Optional[FrameSpatialIndex] = None,
+                         field: Optional[DistanceField] = None) -> np.ndarray:
+        """여러 선분(starts[i] -> ends[i])의 장애물 간섭 여부를 한 번에 확인. (S,) bool 배열 반환.
 
-        for cluster in clusters:
-            for point in cluster:
-                to_point = np.array(point) - path_start
-                projection = np.dot(to_point, path_vec) / path_length
-                if projection < 0 or projection > path_length:
-                    continue
-                closest_point = path_start + (projection / path_length) * path_vec
-                dist_to_path = np.linalg.norm(np.array(point) - closest_point)
-                if dist_to_path < self.obstacle_radius:
-                    return True
-
-        return False
-
-    def find_alternative_path(self, curr_x: float, curr_z: float, 
-                           goal_x: float, goal_z: float, 
-                           clusters: List[List[List[float]]]) -> Optional[List[Tuple[float, float]]]:
-        """장애물을 피해 목표까지의 대체 경로 생성."""
-        points = np.array([point for cluster in clusters for point in cluster])
-        if not points.size:
-            return [(goal_x, goal_z)]
+        선분 위로 수직 투영되는 장애물 포인트 중 선분까지 거리가 obstacle_radius 미만인 것이
+        있으면 간섭으로 본다. 거리장이 있으면 선분을 따라 샘플링한 거리가 충분히 큰 선분은
+        포인트 조회 없이 통과시킨다. 남은 선분은 프레임 인덱스가 있으면 선분별 외접원 조회 한 번으로
+        후보를 고르고, 없으면 클러스터 바운딩 박스로 거른 포인트 전체와 비교한다.
+        """
+        starts = np.atleast_2d(np.asarray(starts, dtype=np.float64))
+        ends = np.atleast_2d(np.asarray(ends, dtype=np.float64))
+        blocked = np.zeros(len(starts), dtype=bool)
+        if not len(starts) or not clusters:
+            return blocked
+
+        path_vec = ends - starts
+        length_sq = np.einsum('ij,ij->i', path_vec, path_vec)
+        rows = np.flatnonzero(length_sq > 0)
+        if not len(rows):
+            return blocked
+        starts, path_vec, length_sq = starts[rows], path_vec[rows], length_sq[rows]
+        radius_sq = self.obstacle_radius ** 2
 
-        kdtree = KDTree(points)
-        path = [(curr_x, curr_z)]
-        current = np.array([curr_x, curr_z])
-        goal = np.array([goal_x, goal_z])
-
-        while np.linalg.norm(current - goal) > self.obstacle_radius:
-            direction = (goal - current) / np.linalg.norm(goal - current)
-            next_point = current + direction * self.obstacle_radius
-            dist, _ = kdtree.query(next_point)
-            if dist < self.obstacle_radius:
-                perp_vec = np.array([-direction[1], direction[0]])
-                left_point = next_point + perp_vec * self.obstacle_radius
-                right_point = next_point - perp_vec * self.obstacle_radius
-                left_dist, _ = kdtree.query(left_point)
-                right_dist, _ = kdtree.query(right_point)
-                next_point = left_point if left_dist > right_dist else right_point
-            path.append((next_point[0], next_point[1]))
-            current = next_point
-            if len(path) > 100:
+        if field is not None:
+            # 셀 중심 양자화 + 보간 + 샘플 간격 오차를 덮도록 두 셀만큼 여유
+            ends = starts + path_vec
+            margin = self.obstacle_radius + 2 * field.resolution
+            clear = (field.covers(starts) & field.covers(ends) &
+                     (field.min_clearance_along(starts, ends) >= margin))
+            if clear.all():
+                return blocked
+            rows, starts, path_vec, length_sq = rows[~clear], starts[~clear], path_vec[~clear], length_sq[~clear]
+
+        if index is not None and index.tree is not None:
+            # 선분별 외접원 안의 포인트만 (선분, 포인트) 쌍으로 펼쳐서 한 번에 계산
+            centers = starts + path_vec * 0.5
+            radii = np.sqrt(length_sq) * 0.5 + self.obstacle_radius
+            neighbors = index.tree.query_radius(centers, radii)
+            counts = np.fromiter(map(len, neighbors), dtype=np.int64, count=len(neighbors))
+            if not counts.sum():
+                return blocked
+            seg = np.repeat(np.arange(len(rows)), counts)
+            point_idx = np.concatenate(neighbors)
+            obstacle = index.obstacle_mask[point_idx]
+            seg, point_idx = seg[obstacle], point_idx[obstacle]
+            hit = _perpendicular_hits(index.coords[point_idx] - starts[seg], path_vec[seg],
+                                      length_sq[seg], radius_sq)
+            blocked[rows] = np.bincount(seg[hit], minlength=len(rows)) > 0
+            return blocked
+
+        points = self._candidate_points(starts, starts + path_vec, clusters)
+        if not len(points):
+            return blocked
+        # (S, M) 행렬이 너무 커지지 않도록 포인트를 나눠서 처리
+        chunk = max(1, _MAX_PAIRS // len(rows))
+        hit = np.zeros(len(rows), dtype=bool)
+        for begin in range(0, len(points), chunk):
+            to_point = points[None, begin:begin + chunk, :] - starts[:, None, :]
+            hit |= _perpendicular_hits(to_point, path_vec[:, None, :], length_sq[:, None],
+                                       radius_sq).any(axis=1)
+            if hit.all():
                 break
+        blocked[rows] = hit
+        return blocked
+
+    def _candidate_points(self, starts: np.ndarray, ends: np.ndarray,
+                          clusters: ClusterStore) -> np.ndarray:
+        """선분 전체를 감싸는 영역(+ obstacle_radius)과 겹치는 클러스터의 영역 내 포인트."""
+        if not isinstance(clusters, ClusterStore):
+            clusters = ClusterStore.from_clusters(clusters)
+        endpoints = np.vstack((starts, ends))
+        lo = endpoints.min(axis=0) - self.obstacle_radius
+        hi = endpoints.max(axis=0) + self.obstacle_radius
+        overlap = np.all((clusters.bbox_max >= lo) & (clusters.bbox_min <= hi), axis=1)
+        if not overlap.any():
+            return np.empty((0, 2))
+        points = clusters.points[overlap[clusters.labels]]
+        return points[np.all((points >= lo) & (points <= hi), axis=1)]
+
+    def _ensure_grid(self, clusters: ClusterStore, start: np.ndarray, goal: np.ndarray,
+                     margin: float = 0.0) -> Tuple[OccupancyGrid, Tuple[int, int]]:
+        """start, goal을 (가장자리에서 margin 이상 안쪽에) 포함하는 점유 격자의 snapshot과 맵 version을 준비.
+
+        새 격자는 start, goal이 가장자리에서 grid_size / 4 이상 떨어지도록 만든다.
+        격자를 새로 만들 때만 거리장을 전체 계산하고, 이후에는 클러스터 version이 바뀔 때
+        달라진 셀 주변만 갱신한다. snapshot은 _grid_lock 안에서 잡으므로 계획은 맵 version 하나에 고정되고,
+        그동안 다른 스레드가 격자를 갱신해도 섞이지 않는다.
+        """
+        inflation = self.obstacle_radius * self.grid_inflation
+        margin = max(margin, inflation)
+        size = max(self.grid_size, float(np.max(np.abs(goal - start))) + self.grid_size * 0.5)
+        with self._grid_lock:
+            grid = self.grid
+            if (grid is None or grid.resolution != self.grid_resolution or grid.inflation != inflation or
+                    grid.max_distance < self.field_max_distance or
+                    not grid.contains(start, margin) or not grid.contains(goal, margin)):
+                grid = OccupancyGrid.around((start + goal) * 0.5, size, self.grid_resolution,
+                                            inflation, self.field_max_distance)
+                self.grid = grid
+                self._grid_source = None
+                self._grid_epoch += 1
+            if self._grid_source != clusters.version:
+                grid.update(clusters.points)
+                self._grid_source = clusters.version
+            return grid.snapshot(), (self._grid_epoch, grid.version)
+
+    def update_map(self, clusters: ClusterStore, center: Tuple[float, float]) -> Optional[DistanceField]:
+        """새 클러스터로 점유 격자와 거리장을 갱신 (맵 업데이트마다 한 번). 갱신된 거리장 반환.
+
+        격자는 center(전차 위치)가 가장자리에서 grid_size / 8 이상 안쪽에 있는 동안 유지한다.
+        """
+        if not isinstance(clusters, ClusterStore):
+            clusters = ClusterStore.from_clusters(clusters)
+        center = np.asarray(center, dtype=np.float64)
+        grid, _ = self._ensure_grid(clusters, center, center, margin=self.grid_size * 0.125)
+        return grid.field
+
+    def find_alternative_path(self, curr_x: float, curr_z: float,
+                           goal_x: float, goal_z: float,
+                           clusters: ClusterStore,
+                           heading: Optional[float] = None) -> Optional[List[Tuple[float, float]]]:
+        """장애물을 피해 목표까지의 대체 경로 생성.
+
+        클러스터 포인트로 만든 점유 격자(OBSTACLE_RADIUS * GRID_INFLATION 만큼 팽창) 위에서
+        점프 포인트 탐색 후 시야선 평활화한 폴리라인을 반환한다. 경로가 없으면 None.
+        mode가 'dstar'이면 같은 격자, 같은 목표 셀인 동안 D* Lite 상태를 유지하고
+        격자에서 바뀐 셀만 반영해 다시 계획한다.
+        mode가 'hybrid'이고 heading(라디안)이 주어지면 회전 반경을 지키는 Hybrid A* 경로를 만들고,
+        실패하거나 hybrid_time_budget 안에 끝나지 않으면 격자 경로로 대신한다.
+        결과는 (start 셀, goal 셀, 팽창 반경, mode, 방위)를 키로 맵 version이 바뀔 때까지 캐시한다.
+        """
+        if not clusters:
+            return [(goal_x, goal_z)]
+        if not isinstance(clusters, ClusterStore):
+            clusters = ClusterStore.from_clusters(clusters)
+
+        start = np.array([curr_x, curr_z], dtype=np.float64)
+        goal = np.array([goal_x, goal_z], dtype=np.float64)
+        grid, map_version = self._ensure_grid(clusters, start, goal)
+        kinematic = self.mode == 'hybrid' and heading is not None
+        key = (tuple(grid.world_to_cell(start).tolist()), tuple(grid.world_to_cell(goal).tolist()),
+               grid.inflation, self.mode,
+               self._motion_primitives().heading_index(heading) if kinematic else None)
+        cached = self.path_cache.get(map_version, key)
+        if cached is not PathCache.MISSING:
+            return self._with_endpoints(cached, start, goal)
+
+        path = None
+        if kinematic:
+            path = hybrid_astar(grid, self._motion_primitives(), start, heading, goal,
+                                time_budget=self.hybrid_time_budget)
+            if path is None:
+                logger.warning("Hybrid A* failed, falling back to grid path")
+        if path is None:
+            search = self._incremental_search(grid) if self.mode == 'dstar' else None
+            path = plan_path(grid, start, goal, search)
+        if path is None:
+            self.path_cache.put(map_version, key, None)
+            logger.warning("No path found from (%.1f, %.1f) to (%.1f, %.1f)", curr_x, curr_z, goal_x, goal_z)
+            return None
+        # 마지막 점이 goal 자체인지 (goal이 팽창 영역 안이면 가까운 빈 셀에서 끝남)
+        self.path_cache.put(map_version, key, (path, path[-1] == (goal_x, goal_z)))
+        logger.debug("Alternative path generated with %d points", len(path))
+        return path
+
+    @staticmethod
+    def _with_endpoints(cached, start: np.ndarray, goal: np.ndarray) -> Optional[List[Tuple[float, float]]]:
+        """같은 셀에서 계획한 캐시 경로의 양 끝을 이번 start, goal로 바꿈."""
+        if cached is None:
+            return None
+        path, ends_at_goal = cached
+        end = (float(goal[0]), float(goal[1])) if ends_at_goal else path[-1]
+        return [(float(start[0]), float(start[1]))] + path[1:-1] + [end]
+
+    def _incremental_search(self, grid: OccupancyGrid):
+        """grid(snapshot) 위에서 D* Lite 상태를 이어 쓰는 셀 경로 탐색기 (plan_path의 search 인자).
+
+        같은 원래 격자의 snapshot이면 상태를 유지하고 이번 snapshot의 version까지 바뀐 셀만 반영한다.
+        """
+        def search(start_cell: Tuple[int, int], goal_cell: Tuple[int, int]):
+            with self._dstar_lock:
+                dstar = self._dstar
+                if dstar is None or not dstar.grid.same_grid(grid) or dstar.goal_cell != goal_cell:
+                    dstar = DStarLite(grid, goal_cell)
+                    self._dstar = dstar
+                else:
+                    dstar.grid = grid
+                    dstar.sync()
+                cells = dstar.plan(start_cell)
+                logger.debug("D* Lite expanded %d nodes", dstar.expanded)
+                return cells
+        return search
 
-        path.append((goal_x, goal_z))
-        logging.debug(f"Alternative path generated with {len(path)} points")
-        return path
\ No newline at end of file
+    def _motion_primitives(self) -> MotionPrimitives:
+        """현재 설정의 모션 프리미티브 표. 해상도/회전 반경/방위 수가 바뀔 때만 다시 만든다."""
+        primitives = self.primitives
+        if (primitives.resolution != self.grid_resolution or primitives.turn_radius != self.turn_radius or
+                primitives.headings != self.lattice_headings):
+            primitives = MotionPrimitives(self.grid_resolution, self.turn_radius, self.lattice_headings)
+            self.primitives = primitives
+        return primitives
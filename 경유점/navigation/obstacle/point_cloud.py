@@ -0,0 +1,90 @@
+import numpy as np
+from typing import Dict, List, Optional, Sequence, Union
+
+# 스캔 1회분을 담는 열(column) 단위 float32 레코드
+POINT_DTYPE = np.dtype([
+    ('x', '<f4'),
+    ('y', '<f4'),
+    ('z', '<f4'),
+    ('intensity', '<f4')
+])
+
+_NAN_POINT = (np.nan, np.nan, np.nan, 0.0)
+
+
+def empty_points() -> np.ndarray:
+    """빈 포인트 배열."""
+    return np.empty(0, dtype=POINT_DTYPE)
+
+
+def _point_tuple(p) -> tuple:
+    """LiDAR dict 하나를 (x, y, z, intensity) 튜플로 변환. 잘못된 포인트는 NaN."""
+    try:
+        pos = p['position']
+        return (pos['x'], pos.get('y', 0.0), pos['z'], p.get('intensity', 0.0))
+    except (TypeError, KeyError, AttributeError):
+        return _NAN_POINT
+
+
+def from_lidar_dicts(points: List[Dict]) -> np.ndarray:
+    """JSON lidarPoints(dict 리스트)를 구조화 배열로 한 번에 변환."""
+    if not points:
+        return empty_points()
+    try:
+        return np.array([_point_tuple(p) for p in points], dtype=POINT_DTYPE)
+    except (TypeError, ValueError):
+        # 숫자가 아닌 좌표가 섞인 경우: 포인트 단위로 다시 변환
+        out = np.empty(len(points), dtype=POINT_DTYPE)
+        for i, p in enumerate(points):
+            try:
+                out[i] = _point_tuple(p)
+            except (TypeError, ValueError):
+                out[i] = _NAN_POINT
+        return out
+
+
+def from_xyz(xyz: np.ndarray, intensity: Optional[np.ndarray] = None) -> np.ndarray:
+    """(N, 3) 또는 (N, 4) 좌표 배열을 구조화 배열로 변환."""
+    xyz = np.asarray(xyz, dtype=np.float32)
+    out = np.empty(len(xyz), dtype=POINT_DTYPE)
+    out['x'] = xyz[:, 0]
+    out['y'] = xyz[:, 1]
+    out['z'] = xyz[:, 2]
+    if intensity is not None:
+        out['intensity'] = intensity
+    elif xyz.shape[1] > 3:
+        out['intensity'] = xyz[:, 3]
+    else:
+        out['intensity'] = 0.0
+    return out
+
+
+def as_points(points: Union[np.ndarray, List[Dict]]) -> np.ndarray:
+    """입력이 이미 구조화 배열이면 그대로, 일반 배열/dict 리스트면 변환."""
+    if isinstance(points, np.ndarray):
+        if points.dtype == POINT_DTYPE:
+            return points
+        if points.dtype.names is None:
+            return from_xyz(points)
+        # x/z 필드만 있으면 되므로 바이너리 프레임(XYZ 레코드)은 복사 없이 사용
+        return points
+    return from_lidar_dicts(points)
+
+
+def planar_coords(points: np.ndarray) -> np.ndarray:
+    """클러스터링/경로 계산용 (N, 2) [x, z] 좌표."""
+    return np.column_stack((points['x'], points['z']))
+
+
+def to_world(points: np.ndarray, pose: Sequence[float]) -> np.ndarray:
+    """차량 좌표계 포인트를 월드 좌표계로 변환 (pose = (x, z, heading_rad))."""
+    px, pz, heading = pose
+    cos_h = np.float32(np.cos(heading))
+    sin_h = np.float32(np.sin(heading))
+    x = points['x']
+    z = points['z']
+    world = points.copy()
+    # heading은 +z 기준 시계 방향 (atan2(dx, dz))
+    world['x'] = px + x * cos_h + z * sin_h
+    world['z'] = pz - x * sin_h + z * cos_h
+    return world
@@ -1,19 +1,35 @@
 import numpy as np
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence, Union
+from navigation.obstacle.point_cloud import as_points, to_world
+from config.metrics import timed
 
-logging.basicConfig(level=logging.DEBUG)
+logger = logging.getLogger(__name__)
 
 class PointFilter:
     """라이다 포인트 필터링을 담당."""
-    def filter_points(self, points: List[Dict]) -> List[Dict]:
-        """포인트 필터링: 유효한 포인트만 반환."""
-        filtered = [
-            p for p in points
-            if isinstance(p, dict) and 
-            isinstance(p.get('position'), dict) and
-            'x' in p['position'] and 'z' in p['position'] and
-            0.05 < np.sqrt(p['position']['x']**2 + p['position']['z']**2) < 100.0
-        ]
-        logging.debug(f"Filtered lidar points: {len(filtered)}/{len(points)}")
-        return filtered
\ No newline at end of file
+    def __init__(self, min_range: float = 0.05, max_range: float = 100.0):
+        self.min_range = min_range
+        self.max_range = max_range
+
+    @timed("filter_points")
+    def filter_points(self, points: Union[np.ndarray, List[Dict]],
+                      pose: Optional[Sequence[float]] = None) -> np.ndarray:
+        """포인트 필터링: 유효한 포인트만 구조화 배열로 반환.
+
+        pose(x, z, heading_rad)가 주어지면 포인트를 차량 좌표계로 보고
+        거리 게이팅 후 월드 좌표계로 변환한다.
+        """
+        cloud = as_points(points)
+        x = cloud['x']
+        z = cloud['z']
+        range_sq = x * x + z * z
+        mask = (
+            np.isfinite(x) & np.isfinite(z) &
+            (range_sq > self.min_range ** 2) & (range_sq < self.max_range ** 2)
+        )
+        filtered = cloud[mask]
+        if pose is not None:
+            filtered = to_world(filtered, pose)
+        logger.debug("Filtered lidar points: %d/%d", len(filtered), len(cloud))
+        return filtered
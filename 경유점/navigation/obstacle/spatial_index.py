@@ -0,0 +1,119 @@
+import itertools
+import numpy as np
+from typing import Optional, Tuple
+from scipy.sparse import csr_matrix
+from sklearn.neighbors import KDTree
+
+_versions = itertools.count(1)
+
+
+class FrameSpatialIndex:
+    """LiDAR 프레임 1개당 한 번 만드는 공간 인덱스.
+
+    eps 추정, DBSCAN(반경 이웃 그래프), 경로 간섭 확인, 최근접 장애물 조회가
+    모두 같은 KD-tree를 공유한다. version은 프레임마다 증가한다.
+    """
+    def __init__(self, coords: np.ndarray):
+        self.coords = np.ascontiguousarray(coords, dtype=np.float64)
+        self.tree = KDTree(self.coords) if len(self.coords) else None
+        self.version = next(_versions)
+        self.labels: Optional[np.ndarray] = None
+        self._mean_nn = None
+        self._radius_neighbors = {}
+        self._obstacle_tree = None
+
+    def __len__(self) -> int:
+        return len(self.coords)
+
+    def mean_nn_distance(self) -> Optional[float]:
+        """포인트별 최근접 이웃 거리의 평균 (eps 동적 조정용)."""
+        if len(self.coords) < 2:
+            return None
+        if self._mean_nn is None:
+            distances, _ = self.tree.query(self.coords, k=2)
+            self._mean_nn = float(np.mean(distances[:, 1]))
+        return self._mean_nn
+
+    def radius_neighbors(self, eps: float) -> np.ndarray:
+        """반경 eps 이웃 그래프: 포인트별 이웃 인덱스 배열(자기 자신 포함)의 object 배열."""
+        neighbors = self._radius_neighbors.get(eps)
+        if neighbors is None:
+            neighbors = self.tree.query_radius(self.coords, eps)
+            self._radius_neighbors = {eps: neighbors}  # 프레임당 eps는 하나뿐이므로 마지막 것만 유지
+        return neighbors
+
+    def radius_neighbors_graph(self, eps: float) -> csr_matrix:
+        """반경 eps 이웃 그래프를 거리 값의 희소 행렬(n x n, 자기 자신 포함)로 반환. DBSCAN(metric="precomputed") 입력용.
+
+        거리 0(자기 자신, 중복 점)도 명시적으로 저장되므로 이웃으로 센다.
+        """
+        neighbors = self.radius_neighbors(eps)
+        counts = np.fromiter(map(len, neighbors), dtype=np.int64, count=len(neighbors))
+        indptr = np.zeros(len(neighbors) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        indices = np.concatenate(neighbors) if len(neighbors) else np.zeros(0, dtype=np.int64)
+        rows = np.repeat(np.arange(len(neighbors)), counts)
+        distances = np.linalg.norm(self.coords[rows] - self.coords[indices], axis=1)
+        # 행마다 거리 순으로 정렬해 두면 DBSCAN이 행별 재정렬(sort_graph_by_row_values)을 건너뜀
+        order = np.lexsort((distances, rows))
+        indices, distances = indices[order], distances[order]
+        n = len(self.coords)
+        return csr_matrix((distances, indices, indptr), shape=(n, n))
+
+    def set_labels(self, labels: np.ndarray):
+        """클러스터링 결과(포인트별 라벨, 노이즈 -1)를 등록."""
+        self.labels = labels
+        self._obstacle_tree = None
+
+    @property
+    def obstacle_mask(self) -> np.ndarray:
+        if self.labels is None:
+            return np.ones(len(self.coords), dtype=bool)
+        return self.labels >= 0
+
+    def _get_obstacle_tree(self) -> Tuple[Optional[KDTree], np.ndarray]:
+        if self._obstacle_tree is None:
+            idx = np.flatnonzero(self.obstacle_mask)
+            tree = KDTree(self.coords[idx]) if len(idx) else None
+            self._obstacle_tree = (tree, idx)
+        return self._obstacle_tree
+
+    def nearest_obstacle(self, queries: np.ndarray, k: int = 16) -> Tuple[np.ndarray, np.ndarray]:
+        """쿼리 포인트별 가장 가까운 장애물(클러스터) 포인트까지 거리와 인덱스.
+
+        공유 트리에서 k개 이웃을 먼저 보고, 그 안에 장애물 포인트가 없는 쿼리만
+        장애물 전용 트리(프레임당 최초 1회 생성)로 다시 조회한다.
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float64))
+        dist = np.full(len(queries), np.inf)
+        index = np.full(len(queries), -1, dtype=np.int64)
+        if self.tree is None or not len(queries):
+            return dist, index
+
+        mask = self.obstacle_mask
+        k = min(k, len(self.coords))
+        d, i = self.tree.query(queries, k=k)
+        hit = mask[i]
+        found = hit.any(axis=1)
+        first = np.argmax(hit, axis=1)
+        rows = np.flatnonzero(found)
+        dist[rows] = d[rows, first[rows]]
+        index[rows] = i[rows, first[rows]]
+
+        missing = np.flatnonzero(~found)
+        if len(missing):
+            obstacle_tree, obstacle_idx = self._get_obstacle_tree()
+            if obstacle_tree is not None:
+                d2, i2 = obstacle_tree.query(queries[missing], k=1)
+                dist[missing] = d2[:, 0]
+                index[missing] = obstacle_idx[i2[:, 0]]
+        return dist, index
+
+    def obstacle_points_near(self, center: np.ndarray, radius: float) -> np.ndarray:
+        """center에서 radius 이내의 장애물 포인트 좌표 (M, 2)."""
+        if self.tree is None:
+            return np.empty((0, 2))
+        idx = self.tree.query_radius(np.atleast_2d(center), radius)[0]
+        if len(idx):
+            idx = idx[self.obstacle_mask[idx]]
+        return self.coords[idx]
@@ -0,0 +1,82 @@
+import bisect
+import numpy as np
+from typing import List, Sequence, Tuple
+
+
+class PathTracker:
+    """폴리라인 경로의 호 길이 색인.
+
+    꼭짓점마다 누적 호 길이를 미리 계산해 두고,
+    - project(): 마지막으로 가장 가까웠던 구간(cursor)부터 앞쪽 search_distance 안의 구간만 보고 현재 위치를 투영
+    - point_at(): 호 길이 s 위치를 이진 탐색으로 찾음
+    을 제공한다. 따라서 꼭짓점이 수천 개인 경로도 틱마다 O(log n) (cursor 이동은 분할 상환 O(1))로 추종한다.
+    """
+    def __init__(self, waypoints: Sequence[Sequence[float]]):
+        points = np.asarray(waypoints, dtype=np.float64).reshape(-1, 2)
+        if len(points) < 2:
+            raise ValueError("PathTracker needs at least 2 waypoints")
+        # 길이 0인 구간(연속 중복 점) 제거
+        keep = np.concatenate(([True], np.any(np.diff(points, axis=0) != 0, axis=1)))
+        points = points[keep]
+        if len(points) < 2:
+            points = np.vstack((points, points))
+        self.points = points
+        self.segments = np.diff(points, axis=0)
+        self.segment_lengths = np.linalg.norm(self.segments, axis=1)
+        self.arc = np.concatenate(([0.0], np.cumsum(self.segment_lengths)))  # 꼭짓점별 누적 호 길이
+        self._arc_list: List[float] = self.arc.tolist()
+        self.length = float(self.arc[-1])
+        self.cursor = 0  # 마지막으로 가장 가까웠던 구간 인덱스 (뒤로 가지 않음)
+        self.progress = 0.0  # 마지막 투영 위치의 호 길이
+
+    @property
+    def end(self) -> Tuple[float, float]:
+        return float(self.points[-1, 0]), float(self.points[-1, 1])
+
+    def _project_range(self, position: np.ndarray, lo: int, hi: int) -> Tuple[int, float, float]:
+        """구간 [lo, hi) 중 position에 가장 가까운 구간. (구간 인덱스, 호 길이, 거리)."""
+        seg = self.segments[lo:hi]
+        lengths = self.segment_lengths[lo:hi]
+        rel = position - self.points[lo:hi]
+        t = np.clip(np.sum(rel * seg, axis=1) / np.maximum(lengths ** 2, 1e-12), 0.0, 1.0)
+        dist = np.linalg.norm(rel - t[:, None] * seg, axis=1)
+        k = int(np.argmin(dist))
+        return lo + k, float(self.arc[lo + k] + t[k] * lengths[k]), float(dist[k])
+
+    def project(self, position: Sequence[float], search_distance: float) -> Tuple[float, float]:
+        """현재 위치를 경로에 투영. (호 길이, 경로까지 거리) 반환.
+
+        cursor 구간부터 마지막 투영 위치 + 호 길이 search_distance 안의 구간만 검사한다. 그 안에서 찾은 거리가
+        search_distance보다 크면(경로에서 크게 벗어난 경우) 남은 경로 전체를 다시 검사한다.
+        """
+        position = np.asarray(position, dtype=np.float64)
+        n = len(self.segments)
+        # 긴 구간 끝에 다다랐을 때 다음 구간도 보도록 창은 마지막 투영 위치부터 잡음
+        hi = min(n, max(self.cursor + 1,
+                        bisect.bisect_right(self._arc_list, self.progress + search_distance)))
+        k, s, dist = self._project_range(position, self.cursor, hi)
+        if dist > search_distance and hi < n:
+            k, s, dist = self._project_range(position, self.cursor, n)
+        self.cursor = k
+        self.progress = max(self.progress, s)
+        return self.progress, dist
+
+    def point_at(self, s: float) -> Tuple[float, float]:
+        """호 길이 s 위치의 점 (경로 범위로 자름)."""
+        if s <= 0.0:
+            return float(self.points[0, 0]), float(self.points[0, 1])
+        if s >= self.length:
+            return self.end
+        k = bisect.bisect_right(self._arc_list, s) - 1
+        t = (s - self._arc_list[k]) / self.segment_lengths[k]
+        x, z = self.points[k] + t * self.segments[k]
+        return float(x), float(z)
+
+    def next_vertex_arc(self) -> float:
+        """마지막 투영 위치보다 앞에 있는 첫 꼭짓점의 호 길이 (없으면 경로 길이)."""
+        k = bisect.bisect_right(self._arc_list, self.progress + 1e-9)
+        return self._arc_list[k] if k < len(self._arc_list) else self.length
+
+    def remaining(self) -> float:
+        """마지막 투영 위치에서 경로 끝까지 호 길이."""
+        return self.length - self.progress
@@ -1,8 +1,17 @@
 import time
+import logging
+from typing import Optional
 from config.shared_config import SHARED
+from config.state_store import StateStore
+from config.log_config import tick_logger
+from config.metrics import timed
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
 
 class PIDController:
-    def __init__(self):
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or SHARED
         self.integral_error = 0.0
         self.last_error = 0.0
         self.last_speed_update_time = time.time()
@@ -13,12 +22,14 @@ class PIDController:
         self.integral_error = 0.0
         self.last_error = 0.0
 
+    @timed("pid")
     def compute_speed(self, current_speed_kh):
         """PID 제어를 사용하여 속도 계산."""
-        target_val_kh = SHARED['tank_tar_val_kh']
-        kp_val = SHARED['pid']['kp']
-        ki_val = SHARED['pid']['ki']
-        kd_val = SHARED['pid']['kd']
+        state = self.store.snapshot()
+        target_val_kh = state['tank_tar_val_kh']
+        kp_val = state['pid']['kp']
+        ki_val = state['pid']['ki']
+        kd_val = state['pid']['kd']
         integral_limit = 10.0
         speed_smoothing = 0.7
 
@@ -38,5 +49,5 @@ class PIDController:
         speed_ms = max(min(speed_ms, 70.0 / 3.6), -30.0 / 3.6)
         speed_ms = speed_smoothing * self.prev_speed_ms + (1 - speed_smoothing) * speed_ms
         self.prev_speed_ms = speed_ms
-        print(f"PID output: {speed_ms*3.6} km/h, Error: {error_kh}")
+        tick_log.debug("PID output: %.2f km/h, Error: %s", speed_ms * 3.6, error_kh)
         return speed_ms
\ No newline at end of file
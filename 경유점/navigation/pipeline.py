@@ -0,0 +1,238 @@
+import time
+import logging
+import threading
+from typing import Callable, Dict, Hashable, Optional, Union
+from navigation.telemetry import TelemetryFrame, Vec3, parse_telemetry
+from config.log_config import tick_logger
+from config.metrics import METRICS, Counter
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
+
+_EMPTY = object()
+
+
+class Mailbox:
+    """종류(key)별 단일 칸 최신값 우편함.
+
+    put()은 같은 key로 아직 꺼내지 않은 값이 있으면 그 값을 버리고 덮어쓴다 (dropped 증가, drop_counter가 있으면
+    같이 증가). 다른 key의 값은 건드리지 않으므로 LiDAR 프레임이 대기 중인 /update_obstacle 데이터를 지우는 일은 없다.
+    get()은 대기 중인 값 중 가장 먼저 들어온 것을 꺼낸다. key를 주지 않으면 기존처럼 칸 하나짜리 우편함.
+    """
+    def __init__(self, name: str, drop_counter: Optional[Counter] = None):
+        self.name = name
+        self.drop_counter = drop_counter
+        self._cond = threading.Condition()
+        self._items: Dict[Hashable, object] = {}  # 들어온 순서 유지 (덮어쓴 값은 맨 뒤로)
+        self._closed = False
+        self.put_count = 0
+        self.dropped = 0
+
+    def put(self, item, key: Hashable = None):
+        with self._cond:
+            if self._items.pop(key, _EMPTY) is not _EMPTY:
+                self.dropped += 1
+                if self.drop_counter is not None:
+                    self.drop_counter.inc()
+            self._items[key] = item
+            self.put_count += 1
+            self._cond.notify()
+
+    def get(self, timeout: Optional[float] = None):
+        """값을 꺼냄. timeout 안에 값이 없거나 닫혔으면 None."""
+        with self._cond:
+            if not self._items and not self._closed:
+                self._cond.wait(timeout)
+            if not self._items:
+                return None
+            key = next(iter(self._items))
+            return self._items.pop(key)
+
+    def close(self):
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class Stage:
+    """우편함 하나를 입력으로 받아 처리하고 결과를 다음 우편함에 넣는 작업 스레드.
+
+    우편함에 오가는 값은 {"seq", "kind", "ingested_at", "data"} dict이며, ingested_at(수신 시각)으로
+    입력이 이 단계에 도착했을 때 얼마나 오래됐는지(input age)를 잰다. 다음 우편함에도 kind를 key로 넣어서
+    같은 종류의 더 새 프레임만 이전 프레임을 밀어낸다. handler가 None을 돌려주면 다음 단계로 넘기지 않는다.
+    """
+    def __init__(self, name: str, handler: Callable, inbox: Mailbox, outbox: Optional[Mailbox] = None):
+        self.name = name
+        self.handler = handler
+        self.inbox = inbox
+        self.outbox = outbox
+        self.processed = 0
+        self.errors = 0
+        self.last_input_age = 0.0
+        self.max_input_age = 0.0
+        self.last_duration = 0.0
+        self.last_output_time: Optional[float] = None  # 마지막 결과를 낸 입력의 ingested_at
+        self._histogram = METRICS.stage(f"pipeline_{name}")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=f"stage-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        self.inbox.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            envelope = self.inbox.get(timeout=0.5)
+            if envelope is None:
+                continue
+            self.process(envelope)
+
+    def process(self, envelope: Dict):
+        """값 하나 처리 (작업 스레드에서 호출)."""
+        started = time.monotonic()
+        self.last_input_age = started - envelope["ingested_at"]
+        self.max_input_age = max(self.max_input_age, self.last_input_age)
+        try:
+            result = self.handler(envelope["data"])
+        except Exception as e:
+            self.errors += 1
+            logger.error("Stage %s failed: %s", self.name, e, exc_info=True)
+            return
+        finally:
+            self.last_duration = time.monotonic() - started
+            self._histogram.observe(self.last_duration)
+            self.processed += 1
+        if result is None:
+            return
+        self.last_output_time = envelope["ingested_at"]
+        if self.outbox is not None:
+            self.outbox.put({"seq": envelope["seq"], "kind": envelope["kind"],
+                             "ingested_at": envelope["ingested_at"], "data": result}, envelope["kind"])
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "processed": self.processed,
+            "dropped": self.inbox.dropped,
+            "errors": self.errors,
+            "input_age_ms": round(self.last_input_age * 1000.0, 3),
+            "max_input_age_ms": round(self.max_input_age * 1000.0, 3),
+            "duration_ms": round(self.last_duration * 1000.0, 3)
+        }
+
+
+class Pipeline:
+    """수신(ingest) -> 인지(perception) -> 매핑/계획(mapping) -> 제어(control) 단계 파이프라인.
+
+    - submit(): 위치/적 정보(텔레메트리)는 호출한 스레드에서 lock을 잡고 바로 반영 (샘플 하나당 비용이 작고,
+      버려지면 속도/방향 계산이 틀어지므로 우편함을 거치지 않음). LiDAR 스캔만 수신 단계로 넘긴다.
+    - ingest: 스캔 종류('info' 안의 lidarPoints, 'obstacle', 'frame')를 인지 단계 입력 형식으로 정리
+    - perception: 포인트 필터링, 공간 인덱스, 클러스터링 (ObstacleHandler.perceive)
+    - mapping: 점유 격자/거리장 갱신 후 공유 상태에 게시 (ObstacleHandler.update_map, publish)
+    - control: ControlLoop (고정 주기 스레드, 게시된 최신 상태로 명령 계산)
+    단계 사이는 종류별 단일 칸 Mailbox라서 뒤처지면 같은 종류의 오래된 스캔만 버려진다.
+    lock을 주면 위치 갱신을 그 락으로 다른 직접 호출과 직렬화한다 (없으면 파이프라인 전용 락).
+    """
+    def __init__(self, navigator, control_loop=None, lock=None):
+        self.navigator = navigator
+        self.control_loop = control_loop
+        self.lock = lock if lock is not None else threading.Lock()
+        self._seq = 0
+        self._seq_lock = threading.Lock()
+        ingest_box, perception_box, mapping_box = (
+            Mailbox(name, METRICS.counter("tank_frames_dropped_total", "Frames overwritten in a stage mailbox", stage=name))
+            for name in ("ingest", "perception", "mapping"))
+        self.stages = {
+            "ingest": Stage("ingest", self._ingest, ingest_box, perception_box),
+            "perception": Stage("perception", self._perceive, perception_box, mapping_box),
+            "mapping": Stage("mapping", self._map, mapping_box)
+        }
+        if control_loop is not None:
+            control_loop.input_time = lambda: self.stages["mapping"].last_output_time
+
+    def start(self):
+        for stage in self.stages.values():
+            stage.start()
+        if self.control_loop is not None:
+            self.control_loop.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        for stage in self.stages.values():
+            stage.stop(timeout)
+        if self.control_loop is not None:
+            self.control_loop.stop(timeout)
+
+    def submit(self, kind: str, payload) -> Dict[str, Union[str, int]]:
+        """텔레메트리는 바로 반영하고 LiDAR 스캔은 수신 단계 우편함에 넣은 뒤 반환.
+
+        kind: 'info' (TelemetryFrame 또는 /info dict), 'obstacle' (/update_obstacle dict), 'frame' (LidarFrame).
+        "queued"는 스캔이 우편함에 들어갔는지 여부. 위치/텔레메트리 반영이 실패하면 그 ERROR 결과를 반환하고
+        스캔은 넣지 않는다 (HTTP 라우트는 400으로 응답).
+        """
+        METRICS.counter("tank_frames_total", "Telemetry frames received", kind=kind).inc()
+        if kind == "info":
+            payload = payload if isinstance(payload, TelemetryFrame) else parse_telemetry(payload)
+            with self.lock:
+                result = self.navigator.update_telemetry(payload.without_lidar())
+            if result["status"] == "ERROR":
+                tick_log.debug("Ingest info: %s", result["message"])
+                return result
+            scan = payload.lidar_points
+        elif kind == "frame":
+            with self.lock:
+                result = self.navigator.position_handler.update_vec(Vec3(*payload.position), payload.timestamp)
+            if result["status"] == "ERROR":
+                return result
+            scan = payload
+        elif kind == "obstacle":
+            scan = payload
+        else:
+            raise ValueError(f"Unknown ingest kind: {kind}")
+        with self._seq_lock:
+            self._seq += 1
+            seq = self._seq
+        if scan is None:
+            return {"status": "OK", "queued": False, "seq": seq}
+        self.submit_scan(kind, scan, seq)
+        return {"status": "OK", "queued": True, "seq": seq}
+
+    def submit_scan(self, kind: str, scan, seq: Optional[int] = None):
+        """LiDAR 스캔만 수신 단계에 넣음 (위치는 호출한 쪽에서 이미 반영한 경우, 예: Session.ingest_batch)."""
+        if seq is None:
+            with self._seq_lock:
+                self._seq += 1
+                seq = self._seq
+        self.stages["ingest"].inbox.put(
+            {"seq": seq, "kind": kind, "ingested_at": time.monotonic(), "data": (kind, scan)}, kind)
+
+    def _ingest(self, item):
+        kind, scan = item
+        if kind == "info":
+            return {"lidarPoints": scan, "pose": None}
+        if kind == "frame":
+            return {"lidarPoints": scan.points, "pose": scan.pose if scan.local else None}
+        return scan
+
+    def _perceive(self, obstacle_data):
+        return self.navigator.obstacle_handler.perceive(obstacle_data)
+
+    def _map(self, perception):
+        handler = self.navigator.obstacle_handler
+        handler.publish(perception, handler.update_map(perception))
+        return True
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float]]]:
+        """단계별 처리/버림/오류 횟수와 입력 나이, 우회 경로 캐시 적중/실패 횟수."""
+        stats = {name: stage.stats() for name, stage in self.stages.items()}
+        stats["planner"] = self.navigator.obstacle_handler.path_planner.path_cache.stats()
+        if self.control_loop is not None:
+            stats["control"] = self.control_loop.stats()
+        return stats
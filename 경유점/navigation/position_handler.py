@@ -1,25 +1,57 @@
 import math
 import time
+import logging
+import numpy as np
+from scipy.signal import lfilter
+from typing import Dict, Optional, Sequence, Union
 from config.shared_config import SHARED
+from config.state_store import StateStore
+from navigation.telemetry import Vec3, parse_vec3
+from config.log_config import tick_logger
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
 
 class PositionHandler:
-    def __init__(self):
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or SHARED
         self.current_position = None
         self.current_heading = 0.0
         self.current_speed_kh = 0.0
         self.smoothed_speed_kh = 0.0
         self.last_update_time = time.time()
+        self.last_sample_time: Optional[float] = None  # 마지막 시뮬레이터 타임스탬프 (배치 입력용)
+
+    def update_position(self, position_str, timestamp: Optional[float] = None):
+        """"x,y,z" 문자열 입력용 어댑터 (update_vec 참고)."""
+        try:
+            position = parse_vec3(position_str)
+        except ValueError as e:
+            logger.warning("Error in update_position: %s", e)
+            return {"status": "ERROR", "message": str(e)}
+        return self.update_vec(position, timestamp)
 
-    def update_position(self, position_str):
-        """새 위치 데이터를 기반으로 현재 위치, 방향, 속도를 업데이트."""
+    def update_vec(self, position: Vec3, timestamp: Optional[float] = None):
+        """새 위치 데이터를 기반으로 현재 위치, 방향, 속도를 업데이트.
+
+        timestamp(시뮬레이터 시각, 초)를 주면 dt를 도착 시각 대신 샘플 시각 차로 계산한다.
+        """
         try:
             now = time.time()
-            dt = now - self.last_update_time if now > self.last_update_time else 0.01
+            if timestamp is not None and self.last_sample_time is not None:
+                dt = float(timestamp) - self.last_sample_time
+            else:
+                dt = now - self.last_update_time if now > self.last_update_time else 0.01
             dt = max(dt, 0.01)
             self.last_update_time = now
+            if timestamp is not None:
+                self.last_sample_time = float(timestamp)
 
-            x, y, z = map(float, position_str.split(","))
+            x, z = position.x, position.z
             new_position = (x, z)
+            state = self.store.snapshot()
+            target_kh = state['tank_tar_val_kh']
+            heading_smoothing = state['CONFIG_PARAMS']['HEADING_SMOOTHING']
 
             if self.current_position:
                 prev_x, prev_z = self.current_position
@@ -27,29 +59,25 @@ class PositionHandler:
                 dz = z - prev_z
 
                 # 위치 변화량 저장
-                SHARED['del_playerPos_x'].append(dx)
-                SHARED['del_playerPos_z'].append(dz)
-                if len(SHARED['del_playerPos_x']) > 1000:
-                    SHARED['del_playerPos_x'] = SHARED['del_playerPos_x'][-1000:]
-                    SHARED['del_playerPos_z'] = SHARED['del_playerPos_z'][-1000:]
-                print(f"Delta position appended: dX={dx}, dZ={dz}")
+                self.store.buffer('del_playerPos').append((dx, dz))
+                tick_log.debug("Delta position appended: dX=%s, dZ=%s", dx, dz)
 
                 distance_moved = math.sqrt(dx**2 + dz**2)
                 if distance_moved > 0.01:
                     new_heading = math.atan2(dx, dz)
                     self.current_heading = (
-                        SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING'] * self.current_heading +
-                        (1 - SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING']) * new_heading
+                        heading_smoothing * self.current_heading +
+                        (1 - heading_smoothing) * new_heading
                     )
                     self.current_heading = math.atan2(
                         math.sin(self.current_heading), math.cos(self.current_heading)
                     )
                     if dt > 0:
-                        max_distance = (abs(SHARED['tank_tar_val_kh']) / 3.6) * dt
+                        max_distance = (abs(target_kh) / 3.6) * dt
                         distance_moved = min(distance_moved, max_distance)
                         raw_speed_kh = (distance_moved / dt) * 3.6
-                        raw_speed_kh = min(raw_speed_kh, abs(SHARED['tank_tar_val_kh']))
-                        if SHARED['tank_tar_val_kh'] < 0:
+                        raw_speed_kh = min(raw_speed_kh, abs(target_kh))
+                        if target_kh < 0:
                             raw_speed_kh = -raw_speed_kh
                         smoothing = 0.7
                         self.smoothed_speed_kh = (
@@ -60,25 +88,95 @@ class PositionHandler:
                         self.current_speed_kh = self.smoothed_speed_kh
 
                         # 속도 데이터 저장
-                        SHARED['speed_data'].append(self.current_speed_kh)
-                        print(f"Speed data appended: {self.current_speed_kh}, Total points: {len(SHARED['speed_data'])}")
-                        if len(SHARED['speed_data']) > 1000:
-                            SHARED['speed_data'] = SHARED['speed_data'][-1000:]
+                        self.store.buffer('speed_data').append(self.current_speed_kh)
+                        tick_log.debug("Speed data appended: %s, Total points: %d", self.current_speed_kh, len(state['speed_data']))
 
             # 전차 위치 저장
-            SHARED['player_pos'].append(new_position)
-            if len(SHARED['player_pos']) > 1000:
-                SHARED['player_pos'] = SHARED['player_pos'][-1000:]
-            print(f"Position appended: {new_position}")
+            self.store.buffer('player_pos').append(new_position)
+            tick_log.debug("Position appended: %s", new_position)
 
             self.current_position = new_position
-            print(f"Position updated: {self.current_position}, Heading: {math.degrees(self.current_heading)}")
+            tick_log.debug("Position updated: %s, Heading: %.2f", self.current_position, math.degrees(self.current_heading))
+            return {
+                "status": "OK",
+                "current_position": self.current_position,
+                "heading": math.degrees(self.current_heading),
+                "speed_kh": self.current_speed_kh
+            }
+        except Exception as e:
+            logger.error("Error in update_position: %s", e)
+            return {"status": "ERROR", "message": str(e)}
+
+    @staticmethod
+    def _smooth(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+        """y[k] = alpha * y[k-1] + (1 - alpha) * x[k] (y[-1] = initial)를 한 번에 계산."""
+        filtered, _ = lfilter([1.0 - alpha], [1.0, -alpha], values, zi=[alpha * initial])
+        return filtered
+
+    def update_positions(self, timestamps: Sequence[float],
+                         positions: Union[np.ndarray, Sequence[Sequence[float]]]) -> Dict[str, Union[str, int, float, tuple]]:
+        """시뮬레이터 시각이 붙은 위치 여러 개(x, y, z)를 한 번에 처리.
+
+        update_vec()을 샘플마다 부른 것과 같은 규칙(위치 변화량, 0.01 넘게 움직였을 때만
+        방향/속도 평활, 목표 속도 상한)을 NumPy로 한 번에 계산하고 기록 버퍼는 extend()로 채운다.
+        dt는 샘플 시각 차이라서 네트워크 지연/묶음 전송과 무관하다. 배치 첫 샘플의 이전 시각을 모르면
+        (처음 받은 배치) 그 샘플의 속도는 계산하지 않는다.
+        """
+        try:
+            times = np.asarray(timestamps, dtype=np.float64).reshape(-1)
+            points = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+            if len(times) != len(points):
+                raise ValueError(f"{len(times)} timestamps for {len(points)} positions")
+            if not len(points):
+                raise ValueError("Empty position batch")
+            order = np.argsort(times, kind="stable")
+            times, xz = times[order], points[order][:, [0, 2]]
+
+            state = self.store.snapshot()
+            target_kh = state['tank_tar_val_kh']
+            heading_smoothing = state['CONFIG_PARAMS']['HEADING_SMOOTHING']
+
+            if self.current_position:
+                prev_xz = np.vstack([np.asarray(self.current_position, dtype=np.float64), xz])
+                prev_t = np.concatenate([[self.last_sample_time if self.last_sample_time is not None else np.nan], times])
+            else:
+                prev_xz, prev_t = xz, times
+            deltas = np.diff(prev_xz, axis=0)
+            dt = np.maximum(np.diff(prev_t), 0.01)
+            distance = np.hypot(deltas[:, 0], deltas[:, 1])
+            moved = distance > 0.01
+
+            # 방향: 움직인 샘플만 지수 평활 ([-pi, pi] 값의 볼록 결합이라 범위를 벗어나지 않음)
+            headings = np.arctan2(deltas[moved, 0], deltas[moved, 1])
+            if len(headings):
+                self.current_heading = float(self._smooth(headings, heading_smoothing, self.current_heading)[-1])
+
+            # 속도: 시각을 아는 움직인 샘플만, 목표 속도로 상한
+            timed = moved & ~np.isnan(dt)
+            speeds = np.empty(0)
+            if timed.any():
+                limit = abs(target_kh)
+                raw = np.minimum(np.minimum(distance[timed], limit / 3.6 * dt[timed]) / dt[timed] * 3.6, limit)
+                if target_kh < 0:
+                    raw = -raw
+                speeds = np.clip(self._smooth(raw, 0.7, self.smoothed_speed_kh), -30.0, 70.0)
+                self.smoothed_speed_kh = self.current_speed_kh = float(speeds[-1])
+
+            self.store.buffer('del_playerPos').extend(deltas)
+            self.store.buffer('speed_data').extend(speeds)
+            self.store.buffer('player_pos').extend(xz)
+
+            self.current_position = (float(xz[-1, 0]), float(xz[-1, 1]))
+            self.last_sample_time = float(times[-1])
+            self.last_update_time = time.time()
+            tick_log.debug("Position batch: %d samples, %d speeds, last %s", len(xz), len(speeds), self.current_position)
             return {
                 "status": "OK",
+                "samples": int(len(xz)),
                 "current_position": self.current_position,
                 "heading": math.degrees(self.current_heading),
                 "speed_kh": self.current_speed_kh
             }
         except Exception as e:
-            print(f"Error in update_position: {str(e)}")
-            return {"status": "ERROR", "message": str(e)}
\ No newline at end of file
+            logger.error("Error in update_positions: %s", e)
+            return {"status": "ERROR", "message": str(e)}
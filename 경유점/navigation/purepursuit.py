@@ -1,56 +1,178 @@
 import math
-import random
+import logging
 import numpy as np
+from typing import Optional, Sequence
 from config.shared_config import SHARED
+from config.state_store import StateStore
+from navigation.path_tracker import PathTracker
+from navigation.rollout_controller import RolloutController
+from config.log_config import tick_logger
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
+
+# 장애물 때문에 멈춘 STOP 명령의 message (Navigation.get_move가 회피 방향 명령으로 바꿈)
+BLOCKED_MESSAGE = "Obstacle detected in path"
 
 class PurePursuit:
-    def __init__(self):
+    def __init__(self, store: Optional[StateStore] = None):
+        self.store = store or SHARED
+        params = self.store['CONFIG_PARAMS']
         self.last_command = None
         self.last_steering = 0.0
         self.initial_distance = None
+        self.path: Optional[PathTracker] = None  # 경유점 경로 추종 모드 (None이면 destination 직선 추종)
+        self.planned = False  # self.path 앞부분이 PathPlanner가 만든 우회 경로인지 (합류점을 지나면 False)
+        self.splice_arc = 0.0  # 우회 경로가 원래 경로에 합류하는 점의 호 길이
+        self._detour: Optional[list] = None  # 마지막으로 이어 붙인 우회 경로
+        self._rejoin = None  # 우회 목표 (원래 경로의 합류 경유점)와 그 뒤 경유점들
+        self.rollout = RolloutController(
+            samples=params.get('ROLLOUT_SAMPLES', 2048),
+            horizon=params.get('ROLLOUT_HORIZON', 8),
+            seed=params.get('ROLLOUT_SEED', 0)
+        )
 
-    def compute_move(self, current_position, current_heading, current_speed_kh, destination, controller, obstacle_handler):
-        """Pure Pursuit 알고리즘으로 이동 명령 계산."""
-        if current_position is None or destination is None:
-            print("No movement: Position or destination is None")
-            return {"move": "STOP", "weight": 1.0}
-
+    def set_path(self, waypoints: Optional[Sequence[Sequence[float]]], planned: bool = False):
+        """경유점 폴리라인 [(x, z), ...]을 추종 경로로 설정. None이면 직선 추종으로 되돌림.
+
+        planned=True는 장애물 때문에 PathPlanner가 만든 우회 경로를 앞에 이어 붙인 경로 (_plan_detour에서만 씀).
+        """
+        self.path = PathTracker(waypoints) if waypoints is not None else None
+        self.planned = planned and self.path is not None
+        if not self.planned:
+            self._detour = None
+            self._rejoin = None
+        return self.path
+
+    def _rejoin_target(self, destination, blocked_arc: Optional[float]):
+        """막힌 지점 다음 경유점(합류점)과 그 뒤에 남은 경유점 목록.
+
+        경로 추종 중이면 호 길이 blocked_arc보다 뒤에 있는 첫 꼭짓점에서 원래 경로로 돌아가고,
+        직선 추종 중이면 destination이 합류점이다.
+        """
+        if self.path is None or blocked_arc is None:
+            return (float(destination[0]), float(destination[1])), []
+        points = self.path.points
+        k = int(np.searchsorted(self.path.arc, blocked_arc, side='right'))
+        if k >= len(points):
+            return self.path.end, []
+        return (float(points[k, 0]), float(points[k, 1])), [tuple(p) for p in points[k + 1:].tolist()]
+
+    def _plan_detour(self, current_position, current_heading, destination, obstacle_handler,
+                     blocked_arc: Optional[float] = None) -> bool:
+        """막힌 지점 다음 경유점까지 우회 경로를 계획해서 남은 경로 앞에 이어 붙임. 경로가 없으면 False.
+
+        우회 중(planned)에 다시 막히면 처음 정한 합류점까지 다시 계획하고, 우회 경로가 그대로면 추종 상태(cursor)를 유지한다.
+        현재 방위(라디안)를 넘기므로 PATH_PLANNER가 'hybrid'이면 회전 반경을 지키는 경로를 추종한다.
+        """
+        if self.planned:
+            rejoin, rest = self._rejoin
+        else:
+            rejoin, rest = self._rejoin_target(destination, blocked_arc)
+        path = obstacle_handler.find_alternative_path(current_position[0], current_position[1],
+                                                      rejoin[0], rejoin[1], current_heading)
+        if not path or len(path) < 2:
+            return False
+        if self.planned and self._detour is not None and list(path[1:]) == list(self._detour[1:]):
+            return True  # 같은 우회 경로 (캐시 적중): 경로를 다시 만들지 않음
+        if not self.planned:
+            tick_log.info("Detour planned: %d points, rejoining at (%.1f, %.1f)", len(path), rejoin[0], rejoin[1])
+        self.set_path(list(path) + rest, planned=True)
+        self._detour = list(path)
+        self._rejoin = (rejoin, rest)
+        self.splice_arc = float(np.sum(np.linalg.norm(np.diff(np.asarray(path, dtype=np.float64), axis=0), axis=1)))
+        return True
+
+    def _distance(self, current_position, destination, params) -> float:
+        """목표까지 남은 거리 (경로 추종 모드면 현재 위치를 경로에 투영한 뒤 남은 호 길이)."""
         curr_x, curr_z = current_position
         dest_x, dest_z = destination
-        distance = math.sqrt((dest_x - curr_x) ** 2 + (dest_z - curr_z) ** 2)
-        print(f"Distance to destination: {distance}")
-
-        if distance < SHARED['CONFIG_PARAMS']['TOLERANCE']:
-            self.initial_distance = None
-            controller.reset_integral()
-            print("Destination reached, stopping")
-            return {"move": "STOP", "weight": 1.0}
-
+        if self.path is None:
+            return math.sqrt((dest_x - curr_x) ** 2 + (dest_z - curr_z) ** 2)
+        dest_x, dest_z = self.path.end
+        self.path.project(current_position, params['LOOKAHEAD_MAX'] * 2.0)
+        return max(self.path.remaining(), math.sqrt((dest_x - curr_x) ** 2 + (dest_z - curr_z) ** 2))
+
+    def _lookahead(self, current_position, destination, distance: float, params):
+        """(주시 거리, 주시점 x, z). 경로 추종 모드에서는 경로 위에서 lookahead만큼 앞선 점을 향함."""
+        curr_x, curr_z = current_position
         lookahead_distance = min(
-            SHARED['CONFIG_PARAMS']['LOOKAHEAD_MAX'],
-            max(SHARED['CONFIG_PARAMS']['LOOKAHEAD_MIN'], distance * 0.5)
+            params['LOOKAHEAD_MAX'],
+            max(params['LOOKAHEAD_MIN'], distance * 0.5)
         )
-        goal_vector = np.array([dest_x - curr_x, dest_z - curr_z])
+        target_x, target_z = destination
+        if self.path is not None:
+            s = self.path.progress + lookahead_distance
+            if self.planned:
+                # 우회 경로는 꼭짓점을 넘어가는 현이 장애물 모서리를 가로지를 수 있어서 다음 꼭짓점까지만 봄
+                s = min(s, self.path.next_vertex_arc())
+            target_x, target_z = self.path.point_at(s)
+        goal_vector = np.array([target_x - curr_x, target_z - curr_z])
         goal_distance = np.linalg.norm(goal_vector)
 
         if goal_distance > 0:
             goal_vector = goal_vector / goal_distance
 
-        target_vector = goal_vector * SHARED['CONFIG_PARAMS']['GOAL_WEIGHT']
+        target_vector = goal_vector * params['GOAL_WEIGHT']
         target_vector_norm = np.linalg.norm(target_vector)
 
         if target_vector_norm > 0:
             target_vector = target_vector / target_vector_norm
-            target_heading = math.atan2(target_vector[0], target_vector[1])
-        else:
-            target_heading = math.atan2(goal_vector[0], goal_vector[1])
 
-        lookahead_x = curr_x + target_vector[0] * lookahead_distance
-        lookahead_z = curr_z + target_vector[1] * lookahead_distance
+        return (lookahead_distance,
+                curr_x + target_vector[0] * lookahead_distance,
+                curr_z + target_vector[1] * lookahead_distance)
+
+    def compute_move(self, current_position, current_heading, current_speed_kh, destination, controller, obstacle_handler):
+        """Pure Pursuit 알고리즘으로 이동 명령 계산.
+
+        경유점 경로(self.path)가 있으면 남은 호 길이를 거리로 쓰고, 경로 위 투영점에서
+        호 길이 lookahead만큼 앞선 점을 추종한다. 주시점까지 장애물이 있으면 obstacle_handler의
+        대체 경로 계획으로 막힌 지점 다음 경유점까지 우회 경로를 만들어 남은 경로 앞에 붙이고(합류점을 지나면
+        원래 경유점 추종으로 돌아감), 우회 경로가 다시 막혔을 때만 현재 위치에서 합류점까지 다시 계획한다
+        ('dstar' 모드는 바뀐 셀만 고쳐서 재계획). 우회 경로도 없으면 정지.
+        """
+        if current_position is None or destination is None:
+            tick_log.debug("No movement: Position or destination is None")
+            return {"move": "STOP", "weight": 1.0}
+
+        # 한 틱 동안은 같은 시점의 설정/목표 속도를 씀 (대시보드 변경이 틱 중간에 섞이지 않음)
+        state = self.store.snapshot()
+        params = state['CONFIG_PARAMS']
+        curr_x, curr_z = current_position
+        if self.planned:
+            self.path.project(current_position, params['LOOKAHEAD_MAX'] * 2.0)
+            if self.path.progress >= self.splice_arc - params['TOLERANCE']:
+                # 합류점에 도달: 남은 경로는 원래 경유점이므로 다시 일반 경로 추종 (막히면 새로 우회)
+                self.planned = False
+                self._detour = None
+                self._rejoin = None
+        distance = self._distance(current_position, destination, params)
+        tick_log.debug("Distance to destination: %.2f", distance)
+
+        if distance < params['TOLERANCE']:
+            self.initial_distance = None
+            controller.reset_integral()
+            logger.info("Destination reached, stopping")
+            return {"move": "STOP", "weight": 1.0}
 
-        if obstacle_handler.is_obstacle_in_path(curr_x, curr_z, lookahead_x, lookahead_z):
-            print("Obstacle detected, stopping")
-            return {"move": "STOP", "weight": 1.0, "message": "Obstacle detected in path"}
+        lookahead_distance, lookahead_x, lookahead_z = self._lookahead(current_position, destination, distance, params)
+
+        blocked = obstacle_handler.is_obstacle_in_path(curr_x, curr_z, lookahead_x, lookahead_z)
+        # 직선 추종 중에는 목적지까지 선분 전체도 확인해서 미리 우회 경로를 계획
+        # (회전 반경을 지키는 'hybrid' 경로는 장애물 바로 앞에서는 만들 수 없음)
+        # 우회 중에 다시 막히면 같은 합류점까지 다시 계획 (우회 경로가 안 막혔으면 추종 상태를 그대로 유지)
+        if blocked or (self.path is None and obstacle_handler.is_obstacle_in_path(
+                curr_x, curr_z, destination[0], destination[1])):
+            blocked_arc = self.path.progress + lookahead_distance if self.path is not None else None
+            if self._plan_detour(current_position, current_heading, destination, obstacle_handler, blocked_arc):
+                distance = self._distance(current_position, destination, params)
+                lookahead_distance, lookahead_x, lookahead_z = self._lookahead(current_position, destination,
+                                                                               distance, params)
+                blocked = obstacle_handler.is_obstacle_in_path(curr_x, curr_z, lookahead_x, lookahead_z)
+        if blocked:
+            tick_log.debug("Obstacle detected, stopping")
+            return {"move": "STOP", "weight": 1.0, "message": BLOCKED_MESSAGE}
 
         dx = lookahead_x - curr_x
         dz = lookahead_z - curr_z
@@ -59,44 +181,53 @@ class PurePursuit:
         steering = ((steering + 180) % 360) - 180
         # 조향 평활화 적용
         steering = (
-            SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING'] * self.last_steering +
-            (1 - SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING']) * steering
+            params['STEERING_SMOOTHING'] * self.last_steering +
+            (1 - params['STEERING_SMOOTHING']) * steering
         )
         self.last_steering = steering
-        print(f"Steering calculated: {steering}, Target heading: {target_heading}")
+        tick_log.debug("Steering calculated: %s, Target heading: %s", steering, target_heading)
 
         speed_ms = controller.compute_speed(current_speed_kh)
         abs_steering = abs(steering / 180.0)
-        speed_ms = speed_ms * (1.0 - abs_steering * SHARED['CONFIG_PARAMS']['SPEED_FACTOR'])
+        speed_ms = speed_ms * (1.0 - abs_steering * params['SPEED_FACTOR'])
         speed_ms = max(min(speed_ms, 70.0 / 3.6), -30.0 / 3.6)
-        print(f"Speed calculated: {speed_ms*3.6} km/h, Target speed: {SHARED['tank_tar_val_kh']}")
+        tick_log.debug("Speed calculated: %.2f km/h, Target speed: %s", speed_ms * 3.6, state['tank_tar_val_kh'])
 
         progress = max(0, 1 - distance / self.initial_distance) if self.initial_distance and distance > 0 else 0.0
 
         dynamic_weights = {
-            "D": SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['D'] * (1 + abs_steering * 0.01) if steering > 0 else 0.0,
-            "A": SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['A'] * (1 + abs_steering * 0.01) if steering < 0 else 0.0,
-            "W": SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['W'] * abs(speed_ms) if speed_ms > 0 else 0.0,
-            "S": SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['S'] * abs(speed_ms) if speed_ms < 0 else 0.0
+            "D": params['WEIGHT_FACTORS']['D'] * (1 + abs_steering * 0.01) if steering > 0 else 0.0,
+            "A": params['WEIGHT_FACTORS']['A'] * (1 + abs_steering * 0.01) if steering < 0 else 0.0,
+            "W": params['WEIGHT_FACTORS']['W'] * abs(speed_ms) if speed_ms > 0 else 0.0,
+            "S": params['WEIGHT_FACTORS']['S'] * abs(speed_ms) if speed_ms < 0 else 0.0
         }
-        print(f"Dynamic weights: {dynamic_weights}")
+        tick_log.debug("Dynamic weights: %s", dynamic_weights)
 
         for cmd in dynamic_weights:
             if dynamic_weights[cmd] > 0:
                 dynamic_weights[cmd] *= (1 + progress * 0.5)
 
-        commands = [cmd for cmd, w in dynamic_weights.items() if w > 0]
-        if not commands:
+        # 동적 가중치를 샘플링 확률로 쓰는 롤아웃으로 명령 선택 (주시점까지 거리 + 거리장 여유)
+        move_distance = params['MOVE_STEP'] * abs(speed_ms)
+        self.rollout.samples = params.get('ROLLOUT_SAMPLES', 2048)
+        self.rollout.horizon = params.get('ROLLOUT_HORIZON', 8)
+        if params.get('ROLLOUT_SEED', 0) != self.rollout.seed:
+            self.rollout.reseed(params.get('ROLLOUT_SEED', 0))
+        chosen_cmd = self.rollout.select(
+            dynamic_weights, (curr_x, curr_z), current_heading, move_distance,
+            1.0 if speed_ms > 0 else -1.0, (lookahead_x, lookahead_z),
+            heading_smoothing=params['HEADING_SMOOTHING'],
+            field=obstacle_handler.get_distance_field(),
+            obstacle_radius=params['OBSTACLE_RADIUS']
+        )
+        if chosen_cmd is None:
             command = {"move": "STOP"}
         else:
-            weights = [dynamic_weights[cmd] for cmd in commands]
-            chosen_cmd = random.choices(commands, weights=weights, k=1)[0]
             command = {"move": chosen_cmd, "weight": dynamic_weights[chosen_cmd]}
             self.last_command = chosen_cmd
-        print(f"Command chosen: {command}")
+        tick_log.debug("Command chosen: %s", command)
 
         if self.last_command:
-            move_distance = SHARED['CONFIG_PARAMS']['MOVE_STEP'] * abs(speed_ms)
             new_x, new_z = curr_x, curr_z
 
             if self.last_command == "D":
@@ -112,6 +243,6 @@ class PurePursuit:
                 new_x -= move_distance * math.sin(current_heading) * (1 if speed_ms > 0 else -1)
                 new_z -= move_distance * math.cos(current_heading) * (1 if speed_ms > 0 else -1)
 
-            print(f"New position calculated: ({new_x}, {new_z})")
+            tick_log.debug("New position calculated: (%s, %s)", new_x, new_z)
             return command, (new_x, new_z)
         return command, None
\ No newline at end of file
@@ -0,0 +1,111 @@
+import math
+import numpy as np
+from typing import Dict, Optional, Sequence, Tuple
+from navigation.obstacle.distance_field import DistanceField
+
+# 명령 인덱스 순서
+COMMANDS = ("D", "A", "W", "S")
+
+
+class RolloutController:
+    """샘플링 기반 국소 제어기: 후보 명령열을 한꺼번에 전방 시뮬레이션해서 가장 좋은 첫 명령을 고른다.
+
+    - 후보: 명령별 동적 가중치를 확률로 삼아 뽑은 samples개 명령열(길이 horizon)과, 각 명령을 계속 누르는
+      명령열. 난수 생성기는 select()마다 (seed, tick)으로 새로 만든다. tick은 select 호출 순번(reseed()에서 0)이라서
+      같은 seed, 같은 tick, 같은 입력이면 같은 명령이 나오고, reseed() 후 같은 입력 순서를 다시 넣으면 명령 순서도 같다.
+    - 운동 모델: PurePursuit.compute_move의 추측 항법(new_position)과 같은 한 걸음 이동,
+      방위는 PositionHandler처럼 이동 방향으로 HEADING_SMOOTHING 평활화.
+    - 비용: 마지막 위치와 목표점 사이 거리 + 거리장 여유가 safe_distance보다 작은 만큼의 제곱 합.
+      여유가 obstacle_radius보다 작은 점을 지나는 명령열은 충돌로 보고 제외한다.
+    """
+    def __init__(self, samples: int = 2048, horizon: int = 8, seed: int = 0,
+                 obstacle_weight: float = 10.0):
+        self.samples = samples
+        self.horizon = horizon
+        self.seed = seed
+        self.obstacle_weight = obstacle_weight
+        self.tick = 0  # 다음 select()의 순번
+        self.last_cost: Optional[float] = None
+
+    def reseed(self, seed: Optional[int] = None):
+        """seed(기본값: 지금 seed)를 바꾸고 tick을 0부터 다시 셈."""
+        if seed is not None:
+            self.seed = seed
+        self.tick = 0
+
+    def _sequences(self, weights: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """(M, horizon) 명령 인덱스 후보."""
+        allowed = np.flatnonzero(weights > 0)
+        constant = np.repeat(allowed[:, None], self.horizon, axis=1)
+        if self.samples <= 0:
+            return constant
+        prob = weights[allowed] / weights[allowed].sum()
+        sampled = allowed[rng.choice(len(allowed), size=(self.samples, self.horizon), p=prob)]
+        return np.vstack((constant, sampled))
+
+    @staticmethod
+    def simulate(sequences: np.ndarray, position: Sequence[float], heading: float,
+                 move_distance: float, direction: float, heading_smoothing: float) -> np.ndarray:
+        """명령열 (M, H)를 한꺼번에 전방 시뮬레이션. 각 걸음 뒤 위치 (M, H, 2) 반환.
+
+        direction은 속도 부호 (+1 전진, -1 후진)로 W/S 이동 방향에 곱한다.
+        """
+        m, h = sequences.shape
+        x = np.full(m, float(position[0]))
+        z = np.full(m, float(position[1]))
+        hd = np.full(m, float(heading))
+        out = np.empty((m, h, 2))
+        for k in range(h):
+            cmd = sequences[:, k]
+            # D: cos/sin(heading + π/2), A: cos/sin(heading - π/2), W: ±(sin, cos)(heading), S: W의 반대
+            side = np.where(cmd == 0, 0.5 * np.pi, -0.5 * np.pi)
+            forward = np.where(cmd == 2, direction, -direction)
+            lateral = cmd < 2
+            dx = np.where(lateral, np.cos(hd + side), forward * np.sin(hd)) * move_distance
+            dz = np.where(lateral, np.sin(hd + side), forward * np.cos(hd)) * move_distance
+            x = x + dx
+            z = z + dz
+            moved = dx * dx + dz * dz > 1e-4
+            new_hd = heading_smoothing * hd + (1 - heading_smoothing) * np.arctan2(dx, dz)
+            new_hd = np.arctan2(np.sin(new_hd), np.cos(new_hd))
+            hd = np.where(moved, new_hd, hd)
+            out[:, k, 0] = x
+            out[:, k, 1] = z
+        return out
+
+    def select(self, weights: Dict[str, float], position: Sequence[float], heading: float,
+               move_distance: float, direction: float, target: Sequence[float],
+               heading_smoothing: float = 0.8, field: Optional[DistanceField] = None,
+               obstacle_radius: float = 0.5, tick: Optional[int] = None) -> Optional[str]:
+        """가중치가 0보다 큰 명령 중 비용이 가장 작은 명령열의 첫 명령. 고를 명령이 없으면 None.
+
+        tick을 주면 그 순번의 난수로 다시 계산한다 (기록된 틱 재생용). 주지 않으면 내부 순번을 쓰고 1 증가.
+        """
+        if tick is None:
+            tick = self.tick
+            self.tick += 1
+        w = np.array([max(float(weights.get(c, 0.0)), 0.0) for c in COMMANDS])
+        if not np.any(w > 0):
+            return None
+        sequences = self._sequences(w, np.random.default_rng((self.seed, tick)))
+        trajectory = self.simulate(sequences, position, heading, move_distance, direction, heading_smoothing)
+
+        end = trajectory[:, -1, :]
+        cost = np.hypot(end[:, 0] - target[0], end[:, 1] - target[1])
+        if field is not None:
+            points = trajectory.reshape(-1, 2)
+            clearance = np.full(len(points), field.max_distance)
+            inside = field.covers(points)
+            clearance[inside] = field.clearance(points[inside])
+            clearance = clearance.reshape(trajectory.shape[:2])
+            safe_distance = obstacle_radius * 2.0
+            cost = cost + self.obstacle_weight * np.sum(np.maximum(safe_distance - clearance, 0.0) ** 2, axis=1)
+            cost = np.where(clearance.min(axis=1) < obstacle_radius, np.inf, cost)
+
+        best = int(np.argmin(cost))
+        self.last_cost = float(cost[best])
+        if not math.isfinite(self.last_cost):
+            # 모든 후보가 충돌: 가장 오래 버티는 명령열 선택
+            steps_clear = np.argmax(clearance < obstacle_radius, axis=1)
+            best = int(np.argmax(steps_clear))
+        return COMMANDS[int(sequences[best, 0])]
@@ -0,0 +1,214 @@
+import time
+import zlib
+import logging
+import threading
+from typing import Any, Dict, List, Optional, Union
+from config.shared_config import SHARED, SERVER_CONFIG, initial_state
+from config.state_store import StateStore, thaw
+from navigation.navigation import Navigation
+from navigation.control_loop import ControlLoop
+from navigation.pipeline import Pipeline
+from navigation.telemetry import TelemetryFrame
+from config.metrics import METRICS, TimedLock
+from config.log_config import tick_logger
+
+logger = logging.getLogger(__name__)
+tick_log = tick_logger(__name__)
+
+# 세션 ID가 없는 요청이 쓰는 세션 (전역 SHARED를 쓰고 대시보드가 보여 주며 정리되지 않음)
+DEFAULT_SESSION = "default"
+
+
+class SessionLimitError(RuntimeError):
+    """세션 수가 max_sessions에 도달해서 새 세션을 만들 수 없음 (서버는 503으로 응답)."""
+
+
+class Session:
+    """전차 한 대의 내비게이션 상태: 전용 상태 저장소, Navigation, 제어 루프, 파이프라인.
+
+    파이프라인 단계 스레드와 제어 루프 스레드가 세션마다 따로 있어서 한 전차의 무거운 프레임이
+    다른 전차의 처리를 막지 않는다. lock은 같은 세션에 대한 직접 호출(목적지 설정, 초기화, 위치 갱신 등)을
+    직렬화한다 (파이프라인 submit()의 텔레메트리 반영과 제어 루프의 명령 계산도 같은 lock).
+    """
+    def __init__(self, session_id: str, store: StateStore):
+        self.session_id = session_id
+        self.store = store
+        self.lock = TimedLock("session")
+        self.navigator = Navigation(store)
+        self.control_loop = ControlLoop(self.navigator, lock=self.lock)
+        self.pipeline = Pipeline(self.navigator, self.control_loop, self.lock)
+        self.created_at = time.monotonic()
+        self.last_seen = self.created_at
+        self.requests = 0
+
+    def touch(self):
+        self.last_seen = time.monotonic()
+        self.requests += 1
+
+    def tick(self, frame: TelemetryFrame) -> Dict[str, Union[str, float, int]]:
+        """한 틱의 텔레메트리(LiDAR 포함 가능)를 바로 처리하고 새 명령을 계산해서 반환.
+
+        파이프라인 우편함을 거치지 않으므로 응답의 명령은 이 요청의 위치/LiDAR까지 반영한 것이다.
+        인지/계획을 포함해 CPU를 쓰는 호출이라서 비동기 서버에서는 작업 스레드에서 부른다.
+        """
+        METRICS.counter("tank_frames_total", "Telemetry frames received", kind="tick").inc()
+        with self.lock:
+            result = self.navigator.update_telemetry(frame.without_lidar())
+            if result["status"] == "ERROR":
+                tick_log.debug("Tick info: %s", result["message"])
+            if frame.lidar_points:
+                handler = self.navigator.obstacle_handler
+                perception = handler.perceive({"lidarPoints": frame.lidar_points, "pose": None})
+                handler.publish(perception, handler.update_map(perception))
+        return self.control_loop.tick()
+
+    def ingest_batch(self, frames: List[TelemetryFrame]) -> Dict[str, Any]:
+        """시각 순으로 정렬된 텔레메트리 프레임 묶음 처리.
+
+        위치/적 정보는 세션 락 안에서 바로 반영하고(Navigation.update_telemetry_batch), 가장 최근 LiDAR 스캔은
+        그 뒤에 파이프라인 수신 단계로 넘긴다. 인지/매핑은 파이프라인 스레드에서 이번 묶음의 위치 기준으로 돈다.
+        """
+        METRICS.counter("tank_frames_total", "Telemetry frames received", kind="batch").inc(len(frames))
+        with self.lock:
+            result = self.navigator.update_telemetry_batch([f.without_lidar() for f in frames])
+        scans = [f for f in frames if f.lidar_points]
+        if scans and result["status"] != "ERROR":
+            self.pipeline.submit_scan("info", scans[-1].lidar_points)
+        result["queued"] = bool(scans) and result["status"] != "ERROR"
+        return result
+
+    def start(self):
+        self.pipeline.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self.pipeline.stop(timeout)
+
+    def stats(self) -> Dict[str, Union[str, int, float]]:
+        return {
+            "session": self.session_id,
+            "requests": self.requests,
+            "idle_s": round(time.monotonic() - self.last_seen, 3),
+            "age_s": round(time.monotonic() - self.created_at, 3),
+            "control": self.control_loop.stats()
+        }
+
+
+class SessionManager:
+    """세션 ID(전차 ID)별 Session 관리.
+
+    - get(): 처음 보는 ID면 세션을 만들어서(지연 생성) 반환. 새 세션의 CONFIG_PARAMS는 기본 세션의
+      현재 설정에 config_overrides를 덮어쓴 값으로 시작한다.
+    - 세션 표는 ID 해시로 나눈 shard마다 락이 따로 있어서, 한 세션을 만드는 동안 다른 shard의 조회는 기다리지 않는다.
+    - evict_idle(): idle_timeout 동안 요청이 없던 세션의 스레드를 멈추고 제거 (start() 후 정리 스레드가 주기적으로 호출).
+    """
+    def __init__(self, idle_timeout: Optional[float] = None, shards: Optional[int] = None,
+                 max_sessions: Optional[int] = None):
+        self.idle_timeout = idle_timeout if idle_timeout is not None else SERVER_CONFIG.get('session_idle_timeout', 300.0)
+        self.max_sessions = max_sessions if max_sessions is not None else SERVER_CONFIG.get('max_sessions', 64)
+        n = max(1, shards if shards is not None else SERVER_CONFIG.get('session_shards', 16))
+        self._shards: List[Dict[str, Session]] = [{} for _ in range(n)]
+        self._shard_locks = [threading.Lock() for _ in range(n)]
+        self._started = False
+        self._stop = threading.Event()
+        self._reaper: Optional[threading.Thread] = None
+        self.created = 0
+        self.evicted = 0
+        self.default = self.get(DEFAULT_SESSION)
+
+    def _shard(self, session_id: str) -> int:
+        return zlib.crc32(session_id.encode("utf-8")) % len(self._shards)
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    def get(self, session_id: Optional[str] = None,
+            config_overrides: Optional[Dict[str, Any]] = None) -> Session:
+        """세션 반환 (없으면 생성). session_id가 비어 있으면 기본 세션.
+
+        세션 수가 max_sessions에 도달한 상태에서 새 ID면 SessionLimitError.
+        """
+        session_id = session_id or DEFAULT_SESSION
+        k = self._shard(session_id)
+        session = self._shards[k].get(session_id)
+        if session is None:
+            with self._shard_locks[k]:
+                session = self._shards[k].get(session_id)
+                if session is None:
+                    session = self._create(session_id, config_overrides)
+                    self._shards[k][session_id] = session
+        session.touch()
+        return session
+
+    def _create(self, session_id: str, config_overrides: Optional[Dict[str, Any]]) -> Session:
+        if session_id == DEFAULT_SESSION:
+            store = SHARED
+        else:
+            if len(self) >= self.max_sessions:
+                raise SessionLimitError(f"Too many sessions (max {self.max_sessions})")
+            state = initial_state()
+            state['CONFIG_PARAMS'] = thaw(SHARED['CONFIG_PARAMS'])
+            store = StateStore(state)
+        session = Session(session_id, store)
+        if config_overrides:
+            store.update_config(**config_overrides)
+        if self._started:
+            session.start()
+        self.created += 1
+        logger.info("Session created: %s", session_id)
+        return session
+
+    def sessions(self) -> List[Session]:
+        return [session for shard in self._shards for session in list(shard.values())]
+
+    def remove(self, session_id: str) -> bool:
+        """세션 제거 (기본 세션은 제거하지 않음)."""
+        if session_id == DEFAULT_SESSION:
+            return False
+        k = self._shard(session_id)
+        with self._shard_locks[k]:
+            session = self._shards[k].pop(session_id, None)
+        if session is None:
+            return False
+        session.stop(timeout=1.0)
+        logger.info("Session removed: %s", session_id)
+        return True
+
+    def evict_idle(self) -> int:
+        """idle_timeout 넘게 요청이 없던 세션 제거. 제거한 수 반환."""
+        now = time.monotonic()
+        idle = [s.session_id for s in self.sessions()
+                if s.session_id != DEFAULT_SESSION and now - s.last_seen > self.idle_timeout]
+        removed = sum(1 for session_id in idle if self.remove(session_id))
+        self.evicted += removed
+        return removed
+
+    def start(self):
+        """모든 세션 스레드와 정리 스레드 시작."""
+        self._started = True
+        for session in self.sessions():
+            session.start()
+        if self._reaper is None or not self._reaper.is_alive():
+            self._stop.clear()
+            self._reaper = threading.Thread(target=self._reap, name="session-reaper", daemon=True)
+            self._reaper.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        for session in self.sessions():
+            session.stop(timeout)
+        self._started = False
+
+    def _reap(self):
+        interval = max(self.idle_timeout / 4.0, 0.1)
+        while not self._stop.wait(interval):
+            removed = self.evict_idle()
+            if removed:
+                logger.info("Evicted %d idle sessions", removed)
+
+    def stats(self) -> Dict[str, Union[int, List[Dict]]]:
+        return {
+            "sessions": len(self),
+            "created": self.created,
+            "evicted": self.evicted,
+            "details": [session.stats() for session in self.sessions()]
+        }
@@ -0,0 +1,82 @@
+"""
+시뮬레이터 텔레메트리 프레임 (/info, /tick, /info_batch, 스트리밍 채널 공통)
+
+요청 JSON은 parse_telemetry()에서 한 번만 검사/변환하고, 이후 Navigation, PositionHandler,
+파이프라인에는 TelemetryFrame을 그대로 넘긴다 ("x,y,z" 문자열로 바꿨다가 다시 나누지 않음).
+"""
+
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence
+
+
+class Vec3(NamedTuple):
+    x: float
+    y: float
+    z: float
+
+    @property
+    def xz(self):
+        """지면 좌표 (x, z)."""
+        return (self.x, self.z)
+
+
+class TelemetryFrame(NamedTuple):
+    timestamp: Optional[float]  # 시뮬레이터 시각 (초), 없으면 도착 시각 기준
+    player_pos: Optional[Vec3]
+    enemy_pos: Optional[Vec3]
+    enemy_turret_x: Optional[float]  # 적 포신 방향 (도)
+    player_speed: Optional[float]
+    lidar_points: Optional[Sequence[Any]]
+
+    def without_lidar(self) -> 'TelemetryFrame':
+        return self._replace(lidar_points=None)
+
+
+def parse_vec3(value: Any, name: str = "position") -> Vec3:
+    """{"x", "y", "z"} dict, "x,y,z" 문자열, (x, y, z) 시퀀스 -> Vec3. 형식이 틀리면 ValueError."""
+    try:
+        if isinstance(value, dict):
+            return Vec3(float(value["x"]), float(value.get("y", 0.0)), float(value["z"]))
+        if isinstance(value, str):
+            x, y, z = value.split(",")
+            return Vec3(float(x), float(y), float(z))
+        x, y, z = value
+        return Vec3(float(x), float(y), float(z))
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {name}: {value!r}") from e
+
+
+def _optional_float(data: Dict[str, Any], key: str) -> Optional[float]:
+    value = data.get(key)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid {key}: {value!r}") from e
+
+
+def parse_telemetry(data: Dict[str, Any]) -> TelemetryFrame:
+    """/info 형식 dict -> TelemetryFrame. 있는 필드의 형식이 틀리면 ValueError (없는 필드는 None)."""
+    if not isinstance(data, dict):
+        raise ValueError("Telemetry must be a JSON object")
+    player_pos = data.get("playerPos")
+    enemy_pos = data.get("enemyPos")
+    lidar_points = data.get("lidarPoints")
+    return TelemetryFrame(
+        timestamp=_optional_float(data, "timestamp"),
+        player_pos=parse_vec3(player_pos, "playerPos") if player_pos is not None else None,
+        enemy_pos=parse_vec3(enemy_pos, "enemyPos") if enemy_pos is not None else None,
+        enemy_turret_x=_optional_float(data, "enemyTurretX"),
+        player_speed=_optional_float(data, "playerSpeed"),
+        lidar_points=lidar_points or None
+    )
+
+
+def parse_batch(frames: Any) -> List[TelemetryFrame]:
+    """/info_batch의 frames 목록 -> 시각 순으로 정렬한 TelemetryFrame 목록 (모든 프레임에 timestamp 필요)."""
+    if not isinstance(frames, list) or not frames:
+        raise ValueError("frames must be a non-empty list")
+    parsed = [parse_telemetry(frame) for frame in frames]
+    if any(frame.timestamp is None for frame in parsed):
+        raise ValueError("Every batched frame needs a timestamp")
+    return sorted(parsed, key=lambda frame: frame.timestamp)
@@ -0,0 +1,61 @@
+import heapq
+import math
+import numpy as np
+import pytest
+from typing import Dict, List, Optional, Tuple
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+
+_SQRT2 = math.sqrt(2.0)
+
+
+def grid_from_mask(mask: np.ndarray) -> OccupancyGrid:
+    """mask(True = 장애물)를 그대로 occupied로 갖는 1m 격자 (팽창 없음)."""
+    grid = OccupancyGrid((0.0, 0.0), 1.0, mask.shape, inflation=0.0)
+    grid.update(np.argwhere(mask) + 0.5)
+    assert np.array_equal(grid.occupied, mask)
+    return grid
+
+
+def dijkstra_cost(occupied: np.ndarray, start: Tuple[int, int], goal: Tuple[int, int]) -> Optional[float]:
+    """8-연결(대각 √2, 빈 셀끼리면 모서리 통과 허용) 최단 경로 비용. 경로가 없으면 None."""
+    if occupied[start] or occupied[goal]:
+        return None
+    h, w = occupied.shape
+    dist: Dict[Tuple[int, int], float] = {start: 0.0}
+    heap = [(0.0, start)]
+    while heap:
+        d, (i, j) = heapq.heappop(heap)
+        if (i, j) == goal:
+            return d
+        if d > dist[(i, j)]:
+            continue
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                ni, nj = i + di, j + dj
+                if (di or dj) and 0 <= ni < h and 0 <= nj < w and not occupied[ni, nj]:
+                    nd = d + (_SQRT2 if di and dj else 1.0)
+                    if nd < dist.get((ni, nj), math.inf):
+                        dist[(ni, nj)] = nd
+                        heapq.heappush(heap, (nd, (ni, nj)))
+    return None
+
+
+def path_cost(occupied: np.ndarray, cells: List[Tuple[int, int]]) -> float:
+    """셀 경로(직선/대각 구간의 꼭짓점 목록) 비용. 지나는 셀이 모두 비어 있는지도 확인."""
+    cost = 0.0
+    for (i0, j0), (i1, j1) in zip(cells, cells[1:]):
+        di, dj = i1 - i0, j1 - j0
+        steps = max(abs(di), abs(dj))
+        assert di == 0 or dj == 0 or abs(di) == abs(dj), "구간은 직선 또는 대각이어야 함"
+        si, sj = (di > 0) - (di < 0), (dj > 0) - (dj < 0)
+        for k in range(steps + 1):
+            assert not occupied[i0 + si * k, j0 + sj * k]
+        cost += steps * (_SQRT2 if di and dj else 1.0)
+    return cost
+
+
+@pytest.fixture
+def random_masks():
+    """시드 고정 무작위 장애물 격자들 (밀도 0.1 ~ 0.35)."""
+    rng = np.random.default_rng(7)
+    return [rng.random((24, 32)) < density for density in (0.1, 0.2, 0.3, 0.35) for _ in range(5)]
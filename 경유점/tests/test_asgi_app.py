@@ -0,0 +1,108 @@
+"""ASGI 앱 경로: 상태 코드, 세션 선택(경로/헤더), 세션 한도 503, 동기 처리가 작업 스레드에서 도는지."""
+import asyncio
+import json
+import threading
+import pytest
+from navigation.session_manager import SessionManager
+from web.asgi_app import AsgiApp
+
+
+def call(app: AsgiApp, method: str, path: str, body=None, headers=None):
+    """ASGI 요청 하나를 보내고 (상태 코드, content-type, 본문) 반환. 본문은 JSON이면 디코딩."""
+    raw = body if isinstance(body, bytes) else (json.dumps(body).encode() if body is not None else b"")
+    scope = {"type": "http", "method": method, "path": path,
+             "headers": [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]}
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": raw, "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    start, response = sent
+    content_type = dict(start["headers"])[b"content-type"].decode()
+    payload = response["body"].decode()
+    return start["status"], content_type, (json.loads(payload) if content_type == "application/json" else payload)
+
+
+INFO = {"playerPos": [0, 0, 0], "enemyPos": [60, 0, 60], "enemyTurretX": 0.0}
+
+
+@pytest.fixture
+def app():
+    sessions = SessionManager(idle_timeout=60.0, max_sessions=3)
+    app = AsgiApp(sessions, workers=2)
+    yield app
+    sessions.stop(timeout=1.0)
+    app.executor.shutdown(wait=True)
+
+
+def test_unknown_route_is_404(app):
+    assert call(app, "GET", "/nope")[0] == 404
+    assert call(app, "DELETE", "/tank/")[0] == 404
+
+
+@pytest.mark.parametrize("path, body", [
+    ("/info", None),
+    ("/info", {"playerPos": {"x": "a", "y": 0, "z": 0}}),
+    ("/info", {"playerPos": [0, 0, 0]}),  # 적 정보 없음: 텔레메트리 반영 오류
+    ("/update_position", {"x": 1}),
+    ("/set_destination", {}),
+    ("/update_obstacle", {"foo": 1}),
+    ("/info_batch", {"frames": [{"playerPos": [0, 0, 0]}]}),  # timestamp 없음
+    ("/config", {"GRID_RESOLUTION": "fine"}),
+    ("/lidar_frame", b"short"),
+])
+def test_bad_requests_are_400(app, path, body):
+    status, _, payload = call(app, "POST", path, body)
+    assert status == 400 and payload["status"] == "ERROR"
+
+
+def test_tick_returns_a_command(app):
+    call(app, "POST", "/update_position", {"position": "0,0,0"})
+    assert call(app, "POST", "/set_destination", {"destination": "0,0,50"})[0] == 200
+    status, _, command = call(app, "POST", "/tick", {"playerPos": {"x": 0.0, "y": 0.0, "z": 1.0}})
+    assert status == 200 and command["move"] in ("W", "A", "S", "D", "STOP") and "seq" in command
+    assert call(app, "GET", "/get_move")[2]["seq"] == command["seq"]
+
+
+def test_sessions_by_path_and_header(app):
+    call(app, "POST", "/tank/a/config", {"MOVE_STEP": 0.3})
+    status, _, payload = call(app, "POST", "/config", {"MOVE_STEP": 0.4}, headers={"X-Tank-Id": "b"})
+    assert status == 200 and payload["session"] == "b"
+    assert app.sessions.get("a").store['CONFIG_PARAMS']['MOVE_STEP'] == 0.3
+    assert app.sessions.get("b").store['CONFIG_PARAMS']['MOVE_STEP'] == 0.4
+    listed = call(app, "GET", "/sessions")[2]
+    assert listed["sessions"] == 3 and {s["session"] for s in listed["details"]} == {"default", "a", "b"}
+    assert call(app, "DELETE", "/tank/a")[2]["removed"] is True
+    assert call(app, "DELETE", "/tank/a")[2]["removed"] is False
+
+
+def test_session_limit_is_503(app):
+    call(app, "GET", "/tank/a/get_move")
+    call(app, "GET", "/tank/b/get_move")
+    status, _, payload = call(app, "GET", "/tank/c/get_move")
+    assert status == 503 and payload["status"] == "ERROR"
+
+
+def test_metrics_is_text(app):
+    call(app, "GET", "/get_move")
+    status, content_type, body = call(app, "GET", "/metrics")
+    assert status == 200 and content_type.startswith("text/plain") and "tank_" in body
+
+
+def test_sync_work_runs_on_worker_threads(app, monkeypatch):
+    threads = []
+    lookup = app._session
+
+    def recording(request):
+        threads.append(threading.current_thread().name)
+        return lookup(request)
+    monkeypatch.setattr(app, "_session", recording)
+    for method, path, body in [("GET", "/get_move", None), ("POST", "/info", INFO),
+                               ("POST", "/update_obstacle", {"lidarPoints": []}), ("GET", "/pipeline_stats", None),
+                               ("POST", "/config", {"MOVE_STEP": 0.2}), ("GET", "/init", None)]:
+        assert call(app, method, path, body)[0] == 200
+    assert len(threads) == 6 and all(name.startswith("asgi-worker") for name in threads)
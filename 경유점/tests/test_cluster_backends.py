@@ -0,0 +1,46 @@
+"""클러스터 백엔드: grid 백엔드 라벨이 DBSCAN과 (번호 순서까지) 같은지, group_labels 범위."""
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+from navigation.obstacle.cluster_backends import GridHashBackend, get_backend, group_labels
+
+
+def _same_partition(a: np.ndarray, b: np.ndarray) -> bool:
+    """두 라벨이 번호 치환을 빼고 같은지 (노이즈 -1은 그대로)."""
+    if not np.array_equal(a < 0, b < 0):
+        return False
+    pairs = np.unique(np.stack([a[a >= 0], b[b >= 0]], axis=1), axis=0)
+    return len(np.unique(pairs[:, 0])) == len(pairs) == len(np.unique(pairs[:, 1]))
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_grid_labels_match_dbscan(seed):
+    rng = np.random.default_rng(seed)
+    coords = rng.uniform(0.0, rng.uniform(5.0, 40.0), (int(rng.integers(1, 300)), 2))
+    if seed % 2:
+        coords = np.round(coords * 2.0) / 2.0  # 격자 위 점: eps 경계 거리/중복 점
+    eps, min_samples = float(rng.uniform(0.3, 3.0)), int(rng.integers(1, 8))
+    expected = DBSCAN(eps=eps, min_samples=min_samples).fit(coords).labels_
+    labels = GridHashBackend().labels(coords, eps, min_samples)
+    assert _same_partition(labels, expected)
+    assert np.array_equal(labels, expected)  # 경계점 배정과 번호까지 같음
+
+
+def test_grid_uses_true_distance_not_cells():
+    # 대각선 이웃 셀이지만 eps보다 먼 두 점은 이웃이 아님
+    coords = np.array([[0.05, 0.05], [1.95, 1.95]])
+    assert GridHashBackend().labels(coords, 1.0, 2).tolist() == [-1, -1]
+    assert GridHashBackend().labels(coords, 3.0, 2).tolist() == [0, 0]
+
+
+def test_group_labels_ranges():
+    labels = np.array([1, -1, 0, 1, 0, -1, 1])
+    order, offsets = group_labels(labels)
+    assert offsets.tolist() == [0, 2, 5]
+    assert sorted(order[offsets[0]:offsets[1]].tolist()) == [2, 4]
+    assert sorted(order[offsets[1]:offsets[2]].tolist()) == [0, 3, 6]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError, match="Unknown cluster backend"):
+        get_backend('foo')
@@ -0,0 +1,49 @@
+"""ClusterStore: 오프셋으로 나눈 클러스터, 게시 시점에 계산한 중심점/바운딩 박스/반경/껍질, 최근접 중심점."""
+import numpy as np
+import pytest
+from navigation.obstacle.cluster_store import ClusterStore
+
+
+@pytest.fixture
+def clusters():
+    rng = np.random.default_rng(5)
+    return [rng.normal(center, 0.5, (count, 2)) for center, count in
+            [((0.0, 0.0), 7), ((10.0, -3.0), 1), ((-4.0, 8.0), 20), ((5.0, 5.0), 2)]]
+
+
+def test_offsets_slice_each_cluster(clusters):
+    store = ClusterStore.from_clusters(clusters, version=3)
+    assert len(store) == 4 and store.version == 3
+    assert store.offsets.tolist() == [0, 7, 8, 28, 30]
+    assert store.labels.tolist() == [0] * 7 + [1] + [2] * 20 + [3] * 2
+    for expected, got in zip(clusters, store):
+        assert np.array_equal(got, expected)
+
+
+def test_per_cluster_geometry_matches_direct(clusters):
+    store = ClusterStore.from_clusters(clusters)
+    for i, c in enumerate(clusters):
+        centroid = c.mean(axis=0)
+        assert np.allclose(store.centroids[i], centroid)
+        assert np.array_equal(store.bbox_min[i], c.min(axis=0)) and np.array_equal(store.bbox_max[i], c.max(axis=0))
+        assert store.radii[i] == pytest.approx(np.max(np.linalg.norm(c - centroid, axis=1)))
+        # 껍질 꼭짓점은 원래 포인트이고, 포인트가 3개 미만이면 원본 그대로
+        assert all(any(np.array_equal(v, p) for p in c) for v in store.hulls[i])
+        if len(c) < 3:
+            assert np.array_equal(store.hulls[i], c)
+
+
+def test_nearest_uses_centroids(clusters):
+    store = ClusterStore.from_clusters(clusters)
+    position = np.array([9.0, -2.0])
+    distances = np.linalg.norm(np.array([c.mean(axis=0) for c in clusters]) - position, axis=1)
+    dist, idx = store.nearest(position)
+    assert idx == int(np.argmin(distances)) and dist == pytest.approx(distances.min())
+    assert np.allclose(store.centroid_distances(position), distances)
+
+
+def test_empty_store():
+    store = ClusterStore.from_clusters([], version=2)
+    assert len(store) == 0 and store.version == 2 and list(store) == []
+    assert store.nearest((0.0, 0.0)) == (float('inf'), -1)
+    assert store.centroid_distances((0.0, 0.0)).shape == (0,)
@@ -0,0 +1,67 @@
+"""ControlLoop: 틱마다 seq를 붙여 게시, 오류 시 STOP, 세션 락 안에서 계산, 구독자에게 사본 전달, 주기 스레드."""
+import threading
+import time
+from navigation.control_loop import ControlLoop
+
+
+class FakeNavigator:
+    def __init__(self, lock=None, delay=0.0):
+        self.lock = lock
+        self.delay = delay
+        self.calls = 0
+        self.locked = []
+
+    def get_move(self):
+        self.calls += 1
+        if self.lock is not None:
+            self.locked.append(self.lock.locked())
+        if self.delay:
+            time.sleep(self.delay)
+        if self.calls == 2:
+            raise RuntimeError("planner exploded")
+        return {"move": "W", "weight": 0.5}
+
+
+def test_tick_publishes_sequenced_commands_and_stops_on_error():
+    loop = ControlLoop(FakeNavigator(), rate_hz=10.0)
+    assert loop.latest()["seq"] == 0 and loop.latest()["move"] == "STOP"
+    first = loop.tick()
+    assert first["move"] == "W" and first["seq"] == 1 and "timestamp" in first
+    failed = loop.tick()
+    assert failed == loop.latest() and failed["move"] == "STOP" and failed["seq"] == 2
+    assert "planner exploded" in failed["message"]
+    loop.latest()["move"] = "S"  # 사본이라 게시된 명령은 그대로
+    assert loop.latest()["move"] == "STOP" and loop.stats()["ticks"] == 2
+
+
+def test_get_move_runs_under_the_given_lock():
+    lock = threading.Lock()
+    navigator = FakeNavigator(lock)
+    loop = ControlLoop(navigator, rate_hz=10.0, lock=lock)
+    loop.tick()
+    assert navigator.locked == [True] and not lock.locked()
+
+
+def test_listeners_get_their_own_copy():
+    loop = ControlLoop(FakeNavigator(), rate_hz=10.0)
+    received = []
+
+    def mutate(command):
+        command["type"] = "command"
+        raise RuntimeError("listener failed")  # 다른 구독자에는 영향 없음
+    loop.subscribe(mutate)
+    loop.subscribe(received.append)
+    command = loop.tick()
+    assert received == [command] and "type" not in command and "type" not in loop.latest()
+    loop.unsubscribe(received.append)
+    loop.tick()
+    assert len(received) == 1
+
+
+def test_thread_ticks_at_rate_and_counts_overruns():
+    loop = ControlLoop(FakeNavigator(delay=0.03), rate_hz=100.0)
+    loop.start()
+    time.sleep(0.3)
+    loop.stop(timeout=1.0)
+    stats = loop.stats()
+    assert 3 <= stats["ticks"] <= 15 and stats["overruns"] >= stats["ticks"] - 1
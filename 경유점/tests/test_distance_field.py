@@ -0,0 +1,104 @@
+"""거리장: 전체 계산이 직접 계산한 거리와 같은지, 부분 갱신이 전체 재계산과 같은지, 회피 명령이 표면 거리를 쓰는지."""
+import numpy as np
+import pytest
+from navigation.obstacle.avoidance_commander import AvoidanceCommander
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.distance_field import DistanceField
+
+
+def _brute_force(obstacles: np.ndarray, resolution: float, max_distance: float) -> np.ndarray:
+    """셀마다 가장 가까운 반대편 셀(장애물 밖이면 장애물, 안이면 빈 셀) 중심까지 거리, ±max_distance로 자름."""
+    cells = np.argwhere(np.ones_like(obstacles))
+    occupied, free = np.argwhere(obstacles), np.argwhere(~obstacles)
+    expected = np.empty(obstacles.shape)
+    for i, j in cells:
+        if obstacles[i, j]:
+            d = np.min(np.hypot(*(free - (i, j)).T)) if len(free) else np.inf
+            expected[i, j] = -min(d * resolution, max_distance)
+        else:
+            d = np.min(np.hypot(*(occupied - (i, j)).T)) if len(occupied) else np.inf
+            expected[i, j] = min(d * resolution, max_distance)
+    return expected
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_compute_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    obstacles = rng.random((24, 30)) < 0.05
+    field = DistanceField.compute(obstacles, (0.0, 0.0), 0.5, 3.0)
+    assert np.allclose(field.distance, _brute_force(obstacles, 0.5, 3.0), atol=1e-5)
+
+
+def test_empty_and_full_grids():
+    empty = DistanceField.compute(np.zeros((5, 5), dtype=bool), (0.0, 0.0), 1.0, 2.0)
+    full = DistanceField.compute(np.ones((5, 5), dtype=bool), (0.0, 0.0), 1.0, 2.0)
+    assert np.all(empty.distance == 2.0) and np.all(full.distance == -2.0)
+
+
+@pytest.mark.parametrize("seed", range(6))
+@pytest.mark.parametrize("extent", [3, 40])  # 작은 변경은 창만, 큰 변경은 전체 재계산
+def test_incremental_update_matches_full_recompute(seed, extent):
+    rng = np.random.default_rng(seed)
+    obstacles = rng.random((80, 80)) < 0.02
+    field = DistanceField.compute(obstacles, (0.0, 0.0), 0.25, 1.5, version=1)
+    for version in range(2, 6):
+        new = obstacles.copy()
+        i, j = rng.integers(0, 80 - extent, 2)
+        new[i:i + extent, j:j + extent] = rng.random((extent, extent)) < 0.3
+        field = field.updated(new, new ^ obstacles, version)
+        obstacles = new
+        expected = DistanceField.compute(obstacles, (0.0, 0.0), 0.25, 1.5)
+        assert field.version == version
+        assert np.array_equal(field.distance, expected.distance)
+
+
+def test_updated_does_not_modify_snapshot():
+    obstacles = np.zeros((20, 20), dtype=bool)
+    field = DistanceField.compute(obstacles, (0.0, 0.0), 1.0, 3.0)
+    before = field.distance.copy()
+    obstacles[10, 10] = True
+    newer = field.updated(obstacles, obstacles.copy(), 2)
+    assert np.array_equal(field.distance, before) and newer.distance[10, 10] < 0
+
+
+def test_clearance_is_interpolated_in_world_coordinates():
+    obstacles = np.zeros((40, 40), dtype=bool)
+    obstacles[20, :] = True  # x = 10.0~10.5 줄
+    field = DistanceField.compute(obstacles, (0.0, 0.0), 0.5, 5.0)
+    clearance, gradient = field.clearance_and_gradient(np.array([[12.25, 7.0], [7.75, 7.0]]))
+    assert clearance == pytest.approx([2.0, 2.5])
+    assert gradient[0, 0] > 0 > gradient[1, 0]  # 장애물에서 멀어지는 방향
+    assert field.covers(np.array([[0.0, 0.0], [19.9, 19.9], [20.0, 5.0], [-0.1, 5.0]])).tolist() == \
+        [True, True, False, False]
+
+
+class TestAvoidanceThresholds:
+    """거리장이 있으면 STOP/SLOW_DOWN 기준은 클러스터 중심점이 아니라 장애물 표면까지 거리."""
+    radius = 0.5
+
+    @pytest.fixture
+    def wall(self):
+        # z = 2.0에 있는 길이 20m 벽: 중심점 (0, 2)
+        points = np.stack([np.arange(-10.0, 10.0, 0.1), np.full(200, 2.0)], axis=1)
+        clusters = ClusterStore.from_clusters([points], version=1)
+        obstacles = np.zeros((400, 400), dtype=bool)
+        cells = np.floor((points + 20.0) / 0.1).astype(int)
+        obstacles[cells[:, 0], cells[:, 1]] = True
+        field = DistanceField.compute(obstacles, (-20.0, -20.0), 0.1, 5.0)
+        return clusters, field
+
+    @pytest.mark.parametrize("position, move", [
+        ((8.0, 1.8), "STOP"),        # 표면 약 0.25m, 중심점 8m
+        ((8.0, 1.4), "SLOW_DOWN"),   # 표면 약 0.65m
+        ((8.0, 0.0), "TURN"),        # 표면 약 2m: 방향 명령
+    ])
+    def test_surface_distance(self, wall, position, move):
+        clusters, field = wall
+        command = AvoidanceCommander(self.radius).get_avoidance_command(position, 0.0, clusters, field)
+        assert command["move"].startswith(move)
+
+    def test_centroid_distance_outside_field(self, wall):
+        clusters, _ = wall
+        # 거리장이 없으면 중심점 기준: 표면은 0.25m지만 중심점이 8m라서 멈추지 않음
+        command = AvoidanceCommander(self.radius).get_avoidance_command((8.0, 1.8), 0.0, clusters, None)
+        assert command["move"].startswith("TURN")
@@ -0,0 +1,88 @@
+"""점프 포인트 탐색과 D* Lite가 8-연결 Dijkstra와 같은 최단 비용을 내는지, D* 증분 보수가 새 탐색과 같은지."""
+import numpy as np
+import pytest
+from navigation.obstacle.grid_planner import jump_point_search
+from navigation.obstacle.dstar_lite import DStarLite
+from tests.conftest import grid_from_mask, dijkstra_cost, path_cost
+
+
+def _endpoints(mask: np.ndarray, rng: np.random.Generator, count: int = 4):
+    free = np.argwhere(~mask)
+    for _ in range(count):
+        a, b = free[rng.choice(len(free), size=2, replace=False)]
+        yield tuple(int(v) for v in a), tuple(int(v) for v in b)
+
+
+def test_jps_matches_dijkstra(random_masks):
+    rng = np.random.default_rng(1)
+    for mask in random_masks:
+        grid = grid_from_mask(mask)
+        for start, goal in _endpoints(mask, rng):
+            expected = dijkstra_cost(mask, start, goal)
+            cells = jump_point_search(grid, start, goal)
+            if expected is None:
+                assert cells is None
+            else:
+                assert cells[0] == start and cells[-1] == goal
+                assert path_cost(mask, cells) == pytest.approx(expected)
+
+
+def test_dstar_matches_dijkstra(random_masks):
+    rng = np.random.default_rng(2)
+    for mask in random_masks:
+        grid = grid_from_mask(mask)
+        for start, goal in _endpoints(mask, rng):
+            expected = dijkstra_cost(mask, start, goal)
+            cells = DStarLite(grid, goal).plan(start)
+            if expected is None:
+                assert cells is None
+            else:
+                assert cells[0] == start and cells[-1] == goal
+                assert path_cost(mask, cells) == pytest.approx(expected)
+
+
+def test_dstar_incremental_repair_matches_fresh_search(random_masks):
+    """장애물을 더하고 빼면서 출발점도 옮겨도 sync() 후 plan이 새 D* Lite, Dijkstra와 같은 비용."""
+    rng = np.random.default_rng(3)
+    for mask in random_masks[::2]:
+        grid = grid_from_mask(mask)
+        (start, goal), = _endpoints(mask, rng, 1)
+        dstar = DStarLite(grid, goal)
+        dstar.plan(start)
+        current = mask.copy()
+        for _ in range(4):
+            flip = rng.random(mask.shape) < 0.05
+            current = current ^ flip
+            current[goal] = False
+            grid.update(np.argwhere(current) + 0.5)
+            free = np.argwhere(~current)
+            start = tuple(int(v) for v in free[rng.integers(len(free))])
+
+            assert dstar.sync() is False  # 변경 기록이 있으므로 초기화 없이 보수
+            repaired = dstar.plan(start)
+            fresh = DStarLite(grid, goal).plan(start)
+            expected = dijkstra_cost(current, start, goal)
+            if expected is None:
+                assert repaired is None and fresh is None
+            else:
+                assert path_cost(current, repaired) == pytest.approx(expected)
+                assert path_cost(current, fresh) == pytest.approx(expected)
+
+
+def test_dstar_follows_grid_snapshots():
+    """snapshot을 번갈아 넘겨도 같은 격자면 상태를 이어 쓰고, 이후 갱신은 snapshot에 보이지 않음."""
+    mask = np.zeros((10, 10), dtype=bool)
+    grid = grid_from_mask(mask)
+    view = grid.snapshot()
+    dstar = DStarLite(view, (9, 9))
+    assert path_cost(mask, dstar.plan((0, 0))) == pytest.approx(9 * 2 ** 0.5)
+
+    wall = mask.copy()
+    wall[1:, 5] = True
+    grid.update(np.argwhere(wall) + 0.5)
+    assert not view.occupied.any() and view.version == 1
+    new_view = grid.snapshot()
+    assert new_view.same_grid(view)
+    dstar.grid = new_view
+    assert dstar.sync() is False
+    assert path_cost(wall, dstar.plan((0, 0))) == pytest.approx(dijkstra_cost(wall, (0, 0), (9, 9)))
@@ -0,0 +1,54 @@
+"""Hybrid A*: 경로 곡률이 회전 반경을 지키는지, 시간 상한을 넘으면 격자 경로로 대신하는지."""
+import math
+import numpy as np
+import pytest
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.lattice_planner import MotionPrimitives, hybrid_astar
+from navigation.obstacle.occupancy_grid import OccupancyGrid
+from navigation.obstacle.path_planner import PathPlanner
+
+
+def _max_curvature(path) -> float:
+    """연속한 현 사이 방향 변화 / 현 길이의 최댓값."""
+    points = np.asarray(path, dtype=np.float64)
+    chords = np.diff(points, axis=0)
+    lengths = np.linalg.norm(chords, axis=1)
+    angles = np.arctan2(chords[:, 0], chords[:, 1])
+    turns = np.abs(np.angle(np.exp(1j * np.diff(angles))))
+    return float(np.max(turns / np.minimum(lengths[:-1], lengths[1:]))) if len(turns) else 0.0
+
+
+def _wall_grid() -> OccupancyGrid:
+    grid = OccupancyGrid((-40.0, -40.0), 0.5, (160, 160), inflation=0.5)
+    wall = np.stack([np.arange(-10.0, 10.0, 0.25), np.full(80, 15.0)], axis=1)
+    grid.update(wall)
+    return grid
+
+
+@pytest.mark.parametrize("turn_radius", [3.0, 5.0, 8.0])
+@pytest.mark.parametrize("goal", [(15.0, 20.0), (-20.0, 5.0), (0.0, 30.0)])
+def test_path_respects_turn_radius(turn_radius, goal):
+    grid = _wall_grid()
+    primitives = MotionPrimitives(grid.resolution, turn_radius, 16)
+    path = hybrid_astar(grid, primitives, (0.0, 0.0), 0.0, goal)
+    assert path is not None and path[0] == (0.0, 0.0) and path[-1] == goal
+    # 마지막 goal 연결 구간을 뺀 프리미티브 구간만 (출발 방위 +z에서 시작)
+    body = path[:-1]
+    assert abs(math.atan2(body[1][0] - body[0][0], body[1][1] - body[0][1])) <= math.pi / 16
+    assert _max_curvature(body) <= 1.0 / turn_radius * 1.05
+    assert all(grid.segment_free(a, b) for a, b in zip(path, path[1:]))
+
+
+def test_time_budget_stops_search():
+    grid = _wall_grid()
+    primitives = MotionPrimitives(grid.resolution, 5.0, 16)
+    assert hybrid_astar(grid, primitives, (0.0, 0.0), 0.0, (0.0, 30.0), time_budget=0.0) is None
+
+
+def test_planner_falls_back_to_grid_path_when_budget_runs_out():
+    clusters = ClusterStore.from_clusters([np.stack([np.arange(-10.0, 10.0, 0.25), np.full(80, 15.0)], axis=1)],
+                                          version=1)
+    hybrid = PathPlanner(0.5, grid_size=100.0, mode='hybrid', hybrid_time_budget=0.0)
+    grid_only = PathPlanner(0.5, grid_size=100.0, mode='jps')
+    path = hybrid.find_alternative_path(0.0, 0.0, 0.0, 30.0, clusters, heading=0.0)
+    assert path == grid_only.find_alternative_path(0.0, 0.0, 0.0, 30.0, clusters)
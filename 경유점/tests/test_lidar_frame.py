@@ -0,0 +1,67 @@
+"""바이너리 LiDAR 프레임: 인코딩/디코딩 왕복, 손상된 헤더/본문, 압축 폭탄 제한."""
+import gzip
+import struct
+import numpy as np
+import pytest
+from navigation.obstacle.lidar_frame import (HEADER_FORMAT, HEADER_SIZE, FRAME_MAGIC, XYZ_DTYPE,
+                                             decode_frame, encode_frame)
+from navigation.obstacle.point_cloud import POINT_DTYPE
+
+
+def _points(n: int, columns: int) -> np.ndarray:
+    return np.random.default_rng(0).uniform(-50.0, 50.0, (n, columns)).astype('<f4')
+
+
+@pytest.mark.parametrize("columns", [3, 4])
+@pytest.mark.parametrize("compression", [None, 'gzip'])
+def test_round_trip(columns, compression):
+    points = _points(257, columns)
+    frame = decode_frame(encode_frame(points, timestamp=12.5, position=(1.0, 2.0, 3.0), heading=0.5,
+                                      local=True, compression=compression))
+    assert frame.timestamp == 12.5 and frame.local
+    assert frame.position == pytest.approx((1.0, 2.0, 3.0)) and frame.heading == pytest.approx(0.5)
+    assert frame.pose == pytest.approx((1.0, 3.0, 0.5))
+    assert frame.points.dtype == (POINT_DTYPE if columns == 4 else XYZ_DTYPE)
+    decoded = np.stack([frame.points[name] for name in frame.points.dtype.names], axis=1)
+    assert np.array_equal(decoded, points)
+
+
+def test_uncompressed_body_is_not_copied():
+    payload = encode_frame(_points(16, 3))
+    frame = decode_frame(payload)
+    assert not frame.points.flags.owndata and not frame.points.flags.writeable
+
+
+def test_empty_frame():
+    frame = decode_frame(encode_frame(np.empty((0, 3), dtype='<f4'), compression='gzip'))
+    assert len(frame.points) == 0
+
+
+@pytest.mark.parametrize("mutate, message", [
+    (lambda p: p[:HEADER_SIZE - 1], "too short"),
+    (lambda p: b'XXXX' + p[4:], "magic"),
+    (lambda p: p[:4] + b'\x09' + p[5:], "version"),
+    (lambda p: p[:5] + bytes([p[5] | 0x06]) + p[6:], "compression"),
+    (lambda p: p[:-1], "too short"),
+])
+def test_corrupt_header_or_body_rejected(mutate, message):
+    with pytest.raises(ValueError, match=message):
+        decode_frame(mutate(encode_frame(_points(8, 3))))
+
+
+def _gzip_frame(count: int, body: bytes) -> bytes:
+    header = struct.pack(HEADER_FORMAT, FRAME_MAGIC, 1, 0x02, 0, 0.0, 0.0, 0.0, 0.0, 0.0, count)
+    return header + body
+
+
+def test_corrupt_gzip_body_rejected():
+    payload = encode_frame(_points(8, 3), compression='gzip')
+    with pytest.raises(ValueError, match="Corrupt"):
+        decode_frame(payload[:HEADER_SIZE] + b'not gzip' + payload[HEADER_SIZE + 8:])
+
+
+@pytest.mark.parametrize("size", [12 * 4 - 1, 12 * 4 + 1, 64 << 20])
+def test_gzip_body_size_must_match_point_count(size):
+    # 헤더는 4점(48 bytes)인데 본문이 그보다 짧거나 길면 거부 (64MB 0 바이트 압축 폭탄 포함)
+    with pytest.raises(ValueError, match="expected 48"):
+        decode_frame(_gzip_frame(4, gzip.compress(b'\0' * size)))
@@ -0,0 +1,66 @@
+"""틱 로그: 같은 템플릿은 간격마다 한 번, 건너뛴 수를 붙임, 꺼진 수준은 포맷하지 않음. JSON 형식, 가득 찬 큐."""
+import json
+import logging
+import queue
+import pytest
+from config.log_config import DroppingQueueHandler, JsonFormatter, RateLimitedLogger
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def capture():
+    logger = logging.getLogger("tests.rate_limited")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    yield logger, records
+    logger.removeHandler(handler)
+
+
+def test_same_template_is_rate_limited(capture, monkeypatch):
+    logger, records = capture
+    clock = Clock()
+    monkeypatch.setattr("config.log_config.time.monotonic", clock)
+    tick = RateLimitedLogger(logger, interval=1.0)
+    for i in range(5):
+        tick.debug("tick %d", i)
+        tick.info("other %d", i)
+        clock.now += 0.3
+    # 0.0초에 한 번, 1.2초에 한 번 (그 사이 3번 건너뜀)
+    assert [r.getMessage() for r in records] == ["tick 0", "other 0", "tick 4 (+3 suppressed)",
+                                                 "other 4 (+3 suppressed)"]
+
+
+def test_disabled_level_skips_formatting(capture):
+    logger, records = capture
+    logger.setLevel(logging.INFO)
+
+    class Exploding:
+        def __str__(self):
+            raise AssertionError("formatted")
+    RateLimitedLogger(logger, interval=0.0).debug("value %s", Exploding())
+    assert records == []
+
+
+def test_json_formatter_includes_extra_fields():
+    record = logging.LogRecord("nav", logging.INFO, __file__, 1, "moved %s", ("W",), None)
+    record.session = "t1"
+    entry = json.loads(JsonFormatter().format(record))
+    assert entry["msg"] == "moved W" and entry["level"] == "INFO" and entry["session"] == "t1"
+
+
+def test_full_queue_drops_instead_of_blocking():
+    handler = DroppingQueueHandler(queue.Queue(1))
+    for _ in range(3):
+        handler.enqueue(logging.LogRecord("nav", logging.INFO, __file__, 1, "x", None, None))
+    assert handler.queue.qsize() == 1 and handler.dropped == 2
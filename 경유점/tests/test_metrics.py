@@ -0,0 +1,58 @@
+"""지표: 히스토그램 버킷/분위수, TimedLock 대기 시간, Prometheus 텍스트 형식."""
+import threading
+import time
+import pytest
+from config.metrics import Histogram, MetricsRegistry, TimedLock
+
+
+def test_histogram_buckets_and_quantiles():
+    histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+    for value in (0.5, 1.0, 1.5, 3.0, 100.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1, 1] and histogram.count == 5 and histogram.sum == pytest.approx(106.0)
+    assert histogram.quantile(0.2) == pytest.approx(0.5)   # 첫 버킷 [0, 1] 안 선형 보간
+    assert histogram.quantile(0.6) == pytest.approx(2.0)
+    assert histogram.quantile(1.0) == 4.0                  # +Inf 칸은 마지막 상한
+    assert Histogram().quantile(0.5) is None
+
+
+def test_timed_lock_records_wait():
+    registry = MetricsRegistry()
+    lock = TimedLock("test", registry)
+    lock.acquire()
+    waiter = threading.Thread(target=lambda: (lock.acquire(), lock.release()))
+    waiter.start()
+    time.sleep(0.05)
+    lock.release()
+    waiter.join()
+    assert lock.acquisitions.value == 2 and lock.wait_seconds.value >= 0.04
+    assert lock.wait_histogram.count == 2 and not lock.locked()
+
+
+def test_render_prometheus_text_format():
+    registry = MetricsRegistry()
+    registry.counter("tank_frames_total", "Frames", kind="info").inc(3)
+    registry.counter("tank_frames_total", "Frames", kind="frame").inc()
+    histogram = registry.histogram("tank_stage_seconds", "Stage time", buckets=(0.01, 0.1), stage="map")
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    histogram.observe(1.0)
+    assert registry.render_prometheus() == "\n".join([
+        "# HELP tank_frames_total Frames",
+        "# TYPE tank_frames_total counter",
+        'tank_frames_total{kind="frame"} 1',
+        'tank_frames_total{kind="info"} 3',
+        "# HELP tank_stage_seconds Stage time",
+        "# TYPE tank_stage_seconds histogram",
+        'tank_stage_seconds_bucket{stage="map",le="0.01"} 1',
+        'tank_stage_seconds_bucket{stage="map",le="0.1"} 2',
+        'tank_stage_seconds_bucket{stage="map",le="+Inf"} 3',
+        'tank_stage_seconds_sum{stage="map"} 1.055',
+        'tank_stage_seconds_count{stage="map"} 3',
+    ]) + "\n"
+
+
+def test_registry_returns_same_metric_for_same_labels():
+    registry = MetricsRegistry()
+    assert registry.counter("c", a="1", b="2") is registry.counter("c", b="2", a="1")
+    assert registry.stage("x") is registry.histogram("tank_stage_seconds", stage="x")
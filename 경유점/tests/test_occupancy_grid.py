@@ -0,0 +1,55 @@
+"""점프 테이블 캐시가 격자 version을 따라가는지."""
+import numpy as np
+from tests.conftest import grid_from_mask
+
+
+def _blocked(grid) -> np.ndarray:
+    h, w = grid.shape
+    return np.frombuffer(grid.jump_tables()['blocked'], dtype=bool).reshape(h + 2, w + 2)[1:-1, 1:-1]
+
+
+def test_jump_tables_rebuilt_after_update():
+    mask = np.zeros((8, 8), dtype=bool)
+    mask[3, 3] = True
+    grid = grid_from_mask(mask)
+    assert np.array_equal(_blocked(grid), mask)
+    assert grid.jump_tables() is grid.jump_tables()  # 같은 version이면 캐시
+
+    mask[5, 1] = True
+    grid.update(np.argwhere(mask) + 0.5)
+    assert np.array_equal(_blocked(grid), mask)
+
+
+def test_stale_snapshot_does_not_poison_cache():
+    """이전 version snapshot이 만든 테이블은 원래 격자 캐시에 들어가지 않음."""
+    old = np.zeros((8, 8), dtype=bool)
+    grid = grid_from_mask(old)
+    view = grid.snapshot()
+    new = old.copy()
+    new[:, 4] = True
+    grid.update(np.argwhere(new) + 0.5)
+
+    assert np.array_equal(_blocked(view), old)
+    assert np.array_equal(_blocked(grid), new)
+    assert np.array_equal(_blocked(view), old)
+
+
+def test_incremental_update_matches_fresh_grid():
+    from navigation.obstacle.occupancy_grid import OccupancyGrid
+    rng = np.random.default_rng(3)
+    grid = OccupancyGrid((0.0, 0.0), 0.5, (120, 120), inflation=1.0)
+    points = rng.uniform(0.0, 60.0, (300, 2))
+    grid.update(points)
+    for step in range(6):
+        before, version = grid.occupied, grid.version
+        points = points.copy()
+        points[:20 * step] = rng.uniform(10.0, 20.0, (20 * step, 2))  # step 0: 같은 포인트
+        grid.update(np.concatenate([points, rng.uniform(-5.0, 0.0, (5, 2))]))  # 격자 밖 포인트는 무시
+        fresh = OccupancyGrid((0.0, 0.0), 0.5, (120, 120), inflation=1.0)
+        fresh.update(points)
+        assert np.array_equal(grid.obstacles, fresh.obstacles)
+        assert np.array_equal(grid.occupied, fresh.occupied)
+        assert np.array_equal(grid.field.distance, fresh.field.distance)
+        assert np.array_equal(grid.changed_since(version), np.flatnonzero(before ^ grid.occupied))
+        if step == 0:
+            assert grid.occupied is before  # 바뀐 셀이 없으면 배열을 새로 만들지 않음
@@ -0,0 +1,51 @@
+"""PathCache LRU(적중/제거/version 무효화)와 PathPlanner가 같은 셀 요청을 캐시로 처리하는지."""
+import numpy as np
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.path_cache import PathCache
+from navigation.obstacle.path_planner import PathPlanner
+
+
+def test_lru_eviction_and_hits():
+    cache = PathCache(capacity=2)
+    cache.put(1, 'a', [(0, 0)])
+    cache.put(1, 'b', None)
+    assert cache.get(1, 'a') == [(0, 0)]  # a가 최근 사용
+    cache.put(1, 'c', [(1, 1)])           # b 제거
+    assert cache.get(1, 'b') is PathCache.MISSING
+    assert cache.get(1, 'c') == [(1, 1)]
+    stats = cache.stats()
+    assert (stats['path_cache_hits'], stats['path_cache_misses'], stats['path_cache_evictions']) == (2, 1, 1)
+
+
+def test_none_result_is_cached():
+    cache = PathCache()
+    cache.put(1, 'k', None)
+    assert cache.get(1, 'k') is None
+
+
+def test_version_change_invalidates_everything():
+    cache = PathCache()
+    cache.put(1, 'a', [(0, 0)])
+    assert cache.get(2, 'a') is PathCache.MISSING
+    cache.put(2, 'a', [(5, 5)])
+    assert cache.get(2, 'a') == [(5, 5)] and cache.stats()['path_cache_invalidations'] == 1
+
+
+def _wall(version: int, z: float = 15.0) -> ClusterStore:
+    return ClusterStore.from_clusters([np.stack([np.arange(-10.0, 10.0, 0.25), np.full(80, z)], axis=1)],
+                                      version=version)
+
+
+def test_planner_hits_cache_within_cell_and_replans_on_new_map():
+    planner = PathPlanner(0.5, grid_size=100.0, mode='jps')
+    clusters = _wall(1)
+    first = planner.find_alternative_path(0.0, 0.0, 0.0, 30.0, clusters)
+    again = planner.find_alternative_path(0.1, 0.2, 0.0, 30.0, clusters)  # 같은 출발 셀
+    stats = planner.path_cache.stats()
+    assert (stats['path_cache_hits'], stats['path_cache_misses']) == (1, 1)
+    assert again[0] == (0.1, 0.2) and again[1:] == first[1:]
+
+    moved = planner.find_alternative_path(0.1, 0.2, 0.0, 30.0, _wall(2, z=20.0))
+    stats = planner.path_cache.stats()
+    assert stats['path_cache_misses'] == 2 and stats['path_cache_invalidations'] == 1
+    assert moved[1:] != first[1:]
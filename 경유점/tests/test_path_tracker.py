@@ -0,0 +1,60 @@
+"""PathTracker: 호 길이 색인, point_at, 앞으로만 가는 cursor 투영 (긴 구간 끝의 인계, 되돌아오는 경로)."""
+import numpy as np
+import pytest
+from navigation.path_tracker import PathTracker
+
+
+def _brute_projection(points: np.ndarray, position: np.ndarray) -> float:
+    """모든 구간에 투영해서 가장 가까운 점의 호 길이."""
+    seg = np.diff(points, axis=0)
+    lengths = np.linalg.norm(seg, axis=1)
+    arc = np.concatenate(([0.0], np.cumsum(lengths)))
+    t = np.clip(np.sum((position - points[:-1]) * seg, axis=1) / lengths ** 2, 0.0, 1.0)
+    dist = np.linalg.norm(position - points[:-1] - t[:, None] * seg, axis=1)
+    k = int(np.argmin(dist))
+    return float(arc[k] + t[k] * lengths[k])
+
+
+def test_arc_length_and_point_at():
+    tracker = PathTracker([(0, 0), (0, 0), (3, 4), (3, 10)])  # 길이 0 구간은 제거
+    assert tracker.points.tolist() == [[0, 0], [3, 4], [3, 10]]
+    assert tracker.arc.tolist() == [0.0, 5.0, 11.0] and tracker.length == 11.0
+    assert tracker.point_at(-1.0) == (0.0, 0.0) and tracker.point_at(99.0) == (3.0, 10.0)
+    assert tracker.point_at(2.5) == pytest.approx((1.5, 2.0))
+    assert tracker.point_at(8.0) == pytest.approx((3.0, 7.0))
+
+
+def test_following_matches_brute_force_projection():
+    rng = np.random.default_rng(12)
+    angles = np.cumsum(rng.normal(0.0, 0.3, 400))
+    steps = rng.uniform(0.5, 3.0, 400)
+    points = np.cumsum(np.column_stack((np.sin(angles), np.cos(angles))) * steps[:, None], axis=0)
+    tracker = PathTracker(points)
+    for s in np.linspace(0.0, tracker.length, 600):
+        position = np.array(tracker.point_at(s)) + rng.normal(0.0, 0.05, 2)
+        progress, _ = tracker.project(position, 10.0)
+        assert progress == pytest.approx(max(s, 0.0), abs=0.3)
+    assert tracker.remaining() == pytest.approx(tracker.length - tracker.progress)
+
+
+def test_long_segment_hands_over_to_next():
+    tracker = PathTracker([(0, 0), (0, 100), (10, 100)])
+    tracker.project((0.0, 99.0), 10.0)
+    assert tracker.cursor == 0
+    progress, dist = tracker.project((5.0, 100.5), 10.0)
+    assert tracker.cursor == 1 and progress == pytest.approx(105.0) and dist == pytest.approx(0.5)
+    assert tracker.next_vertex_arc() == pytest.approx(110.0)
+
+
+def test_cursor_does_not_jump_back_on_returning_path():
+    # 같은 곳으로 되돌아오는 U자 경로: 돌아오는 구간에서 처음 구간으로 투영되면 안 됨
+    points = np.array([(0, 0), (0, 20), (1, 20), (1, 0)], dtype=float)
+    tracker = PathTracker(points)
+    for z in np.arange(0.0, 20.0, 1.0):
+        tracker.project((0.0, z), 5.0)
+    tracker.project((0.5, 20.0), 5.0)
+    for z in np.arange(19.0, 0.0, -1.0):
+        # x = 0.4는 처음 구간(x = 0)이 더 가깝지만 진행 방향상 돌아오는 구간에 있음
+        progress, dist = tracker.project((0.4, z), 5.0)
+        assert progress == pytest.approx(21.0 + 20.0 - z) and dist == pytest.approx(0.6)
+        assert _brute_projection(points, np.array([0.4, z])) == pytest.approx(z)
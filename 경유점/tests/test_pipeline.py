@@ -0,0 +1,58 @@
+"""Pipeline: 종류별 단일 칸 우편함(같은 종류는 오래된 것부터 버림), 단계 처리, submit 오류는 우편함에 넣지 않음."""
+import time
+import pytest
+from navigation.pipeline import Mailbox, Pipeline, Stage
+
+
+def test_mailbox_overwrites_only_same_kind():
+    box = Mailbox("test")
+    box.put("scan-1", "frame")
+    box.put("obstacle-1", "obstacle")
+    box.put("scan-2", "frame")  # 아직 꺼내지 않은 scan-1을 버림
+    assert box.dropped == 1 and box.put_count == 3
+    assert [box.get(0.0), box.get(0.0), box.get(0.0)] == ["obstacle-1", "scan-2", None]
+
+
+def test_mailbox_close_wakes_reader():
+    box = Mailbox("test")
+    box.close()
+    started = time.monotonic()
+    assert box.get(timeout=5.0) is None and time.monotonic() - started < 1.0
+
+
+def test_stage_forwards_result_with_kind_and_counts_errors():
+    inbox, outbox = Mailbox("in"), Mailbox("out")
+    stage = Stage("double", lambda x: x * 2 if x else None, inbox, outbox)
+    stage.process({"seq": 1, "kind": "frame", "ingested_at": time.monotonic(), "data": 4})
+    stage.process({"seq": 2, "kind": "frame", "ingested_at": time.monotonic(), "data": 0})  # None: 넘기지 않음
+    stage.process({"seq": 3, "kind": "frame", "ingested_at": time.monotonic(), "data": "x"})
+    broken = Stage("broken", lambda x: 1 / 0, Mailbox("b"))
+    broken.process({"seq": 4, "kind": "frame", "ingested_at": time.monotonic(), "data": 1})
+    assert outbox.get(0.0)["data"] == "xx" and outbox.dropped == 1  # 같은 종류: seq 1 결과는 밀려남
+    assert stage.stats()["processed"] == 3 and broken.stats()["errors"] == 1
+
+
+class FakeNavigator:
+    def __init__(self, status):
+        self.status = status
+        self.applied = []
+
+    def update_telemetry(self, frame):
+        self.applied.append(frame)
+        return {"status": self.status, "message": "bad telemetry"}
+
+
+@pytest.mark.parametrize("status, queued", [("OK", True), ("ERROR", False)])
+def test_submit_applies_telemetry_and_queues_only_valid_scans(status, queued):
+    navigator = FakeNavigator(status)
+    pipeline = Pipeline(navigator)
+    result = pipeline.submit("info", {"playerPos": [1, 0, 2], "lidarPoints": [{"position": {"x": 1}}]})
+    assert result["status"] == status and navigator.applied[0].lidar_points is None
+    assert pipeline.stages["ingest"].inbox.put_count == int(queued)
+    if queued:
+        assert result["queued"] is True
+
+
+def test_submit_rejects_unknown_kind():
+    with pytest.raises(ValueError):
+        Pipeline(FakeNavigator("OK")).submit("nope", {})
@@ -0,0 +1,39 @@
+"""LiDAR 입력 변환: dict 목록 -> float32 구조화 배열(잘못된 포인트는 NaN), 거리 게이팅, 차량->월드 변환."""
+import numpy as np
+import pytest
+from navigation.obstacle.point_cloud import POINT_DTYPE, as_points, from_lidar_dicts, planar_coords, to_world
+from navigation.obstacle.point_filter import PointFilter
+
+
+def test_dicts_to_structured_array():
+    cloud = from_lidar_dicts([
+        {"position": {"x": 1.0, "y": 2.0, "z": 3.0}, "intensity": 0.5},
+        {"position": {"x": 4, "z": 5}},           # y, intensity 없음
+        {"position": {"x": "bad", "z": 1.0}},     # 숫자가 아님
+        {"nope": 1},
+    ])
+    assert cloud.dtype == POINT_DTYPE and len(cloud) == 4
+    assert cloud[0].tolist() == (1.0, 2.0, 3.0, 0.5) and cloud[1].tolist() == (4.0, 0.0, 5.0, 0.0)
+    assert np.isnan(cloud['x'][2:]).all()
+    assert planar_coords(cloud[:2]).tolist() == [[1.0, 3.0], [4.0, 5.0]]
+
+
+def test_as_points_accepts_arrays():
+    cloud = as_points(np.array([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]]))
+    assert cloud.dtype == POINT_DTYPE and cloud['z'].tolist() == [3.0, 6.0]
+    assert as_points(cloud) is cloud and len(as_points([])) == 0
+
+
+def test_filter_gates_range_and_invalid_points():
+    cloud = from_lidar_dicts([{"position": {"x": x, "z": z}} for x, z in
+                              [(0.0, 0.01), (3.0, 4.0), (80.0, 80.0), (float("nan"), 1.0), (-1.0, 0.0)]])
+    kept = PointFilter(min_range=0.05, max_range=100.0).filter_points(cloud)
+    assert planar_coords(kept).tolist() == [[3.0, 4.0], [-1.0, 0.0]]
+
+
+def test_vehicle_frame_to_world():
+    cloud = from_lidar_dicts([{"position": {"x": 0.0, "z": 2.0}}, {"position": {"x": 1.0, "z": 0.0}}])
+    # heading π/2: 차량 +z(앞)가 월드 +x
+    world = to_world(cloud, (10.0, 20.0, np.pi / 2))
+    assert planar_coords(world) == pytest.approx(np.array([[12.0, 20.0], [10.0, 19.0]]), abs=1e-5)
+    assert cloud['x'].tolist() == [0.0, 1.0]  # 입력은 그대로
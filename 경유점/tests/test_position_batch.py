@@ -0,0 +1,49 @@
+"""시각이 붙은 위치 묶음: update_positions가 샘플마다 update_vec을 부른 것과 같은 위치/방위/속도/기록을 내는지."""
+import numpy as np
+import pytest
+from config.shared_config import initial_state
+from config.state_store import StateStore
+from navigation.position_handler import PositionHandler
+from navigation.telemetry import Vec3
+
+
+def _track(count: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    times = np.cumsum(rng.uniform(0.05, 0.15, count))
+    steps = rng.normal(0.0, 0.3, (count, 2)) + [0.0, 0.8]
+    steps[rng.random(count) < 0.2] = 0.0  # 멈춘 샘플(0.01 이하 이동)도 섞음
+    xz = np.cumsum(steps, axis=0)
+    return times, np.column_stack((xz[:, 0], np.zeros(count), xz[:, 1]))
+
+
+def _handler():
+    store = StateStore(initial_state())
+    store.publish(tank_tar_val_kh=30.0)
+    return PositionHandler(store), store
+
+
+@pytest.mark.parametrize("split", [0, 1, 17])
+def test_batch_matches_per_sample(split):
+    times, positions = _track(60)
+    single, single_store = _handler()
+    for t, p in zip(times, positions):
+        assert single.update_vec(Vec3(*p), t)["status"] == "OK"
+
+    batch, batch_store = _handler()
+    if split:  # 앞부분을 샘플 단위로 넣은 뒤 나머지를 묶음으로
+        for t, p in zip(times[:split], positions[:split]):
+            batch.update_vec(Vec3(*p), t)
+    result = batch.update_positions(times[split:], positions[split:])
+    assert result["status"] == "OK" and result["samples"] == 60 - split
+
+    assert batch.current_position == pytest.approx(single.current_position)
+    assert batch.current_heading == pytest.approx(single.current_heading)
+    assert batch.current_speed_kh == pytest.approx(single.current_speed_kh)
+    for key in ('player_pos', 'del_playerPos', 'speed_data'):
+        assert np.allclose(batch_store[key].last(), single_store[key].last())
+
+
+def test_mismatched_lengths_are_an_error():
+    handler, _ = _handler()
+    result = handler.update_positions([1.0, 2.0], [(0.0, 0.0, 0.0)])
+    assert result["status"] == "ERROR" and "timestamps" in result["message"]
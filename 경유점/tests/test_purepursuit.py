@@ -0,0 +1,105 @@
+"""우회 경로 이어 붙이기(막힌 지점 다음 경유점까지, 합류 후 원래 경로)와 get_move의 회피 명령 우선순위."""
+import numpy as np
+import pytest
+from navigation.navigation import Navigation
+from navigation.pid_controller import PIDController
+from navigation.purepursuit import BLOCKED_MESSAGE, PurePursuit
+
+
+class FakeObstacles:
+    """원형 장애물 목록으로 선분 막힘을 판단하고, 정해 둔 우회 경유점을 돌려주는 ObstacleHandler 대역."""
+    def __init__(self, circles, via):
+        self.circles = circles
+        self.via = via
+        self.goals = []
+
+    def is_obstacle_in_path(self, x0, z0, x1, z1):
+        a, b = np.array([x0, z0]), np.array([x1, z1])
+        for cx, cz, r in self.circles:
+            c = np.array([cx, cz])
+            d = b - a
+            t = np.clip(np.dot(c - a, d) / max(np.dot(d, d), 1e-12), 0.0, 1.0)
+            if np.linalg.norm(a + t * d - c) < r:
+                return True
+        return False
+
+    def find_alternative_path(self, x, z, goal_x, goal_z, heading=None):
+        self.goals.append((goal_x, goal_z))
+        self.heading = heading
+        return [(x, z), self.via, (goal_x, goal_z)]
+
+    def get_distance_field(self):
+        return None
+
+
+def _command(result):
+    return result[0] if isinstance(result, tuple) else result
+
+
+@pytest.fixture
+def tracker():
+    pp = PurePursuit()
+    pp.set_path([(0.0, 0.0), (0.0, 20.0), (0.0, 40.0)])
+    return pp, PIDController()
+
+
+def test_detour_rejoins_at_next_waypoint_past_blockage(tracker):
+    pp, controller = tracker
+    obstacles = FakeObstacles([(0.0, 8.0, 1.5)], via=(3.0, 8.0))
+    pp.compute_move((0.0, 4.0), 0.0, 0.0, (0.0, 40.0), controller, obstacles)
+    assert obstacles.goals == [(0.0, 20.0)]
+    assert pp.planned and pp.path.points.tolist() == [[0.0, 4.0], [3.0, 8.0], [0.0, 20.0], [0.0, 40.0]]
+
+    # 우회 경로가 막히지 않은 동안은 다시 계획하지 않음
+    command = _command(pp.compute_move((1.5, 6.0), 0.5, 10.0, (0.0, 40.0), controller, obstacles))
+    assert obstacles.goals == [(0.0, 20.0)] and command.get("message") != BLOCKED_MESSAGE
+
+    # 합류점을 지나면 원래 경유점 추종으로 돌아감
+    pp.compute_move((0.0, 20.5), 0.0, 10.0, (0.0, 40.0), controller, obstacles)
+    assert not pp.planned and pp.path.end == (0.0, 40.0) and len(obstacles.goals) == 1
+
+
+def test_blocked_detour_replans_to_same_rejoin_point(tracker):
+    pp, controller = tracker
+    obstacles = FakeObstacles([(0.0, 8.0, 1.5)], via=(3.0, 8.0))
+    pp.compute_move((0.0, 4.0), 0.0, 0.0, (0.0, 40.0), controller, obstacles)
+    obstacles.circles.append((2.0, 7.0, 1.0))  # 우회 경로 위에 새 장애물
+    obstacles.via = (-3.0, 8.0)
+    pp.compute_move((0.5, 5.0), 0.5, 10.0, (0.0, 40.0), controller, obstacles)
+    assert obstacles.goals == [(0.0, 20.0), (0.0, 20.0)]
+    assert pp.planned and pp.path.points.tolist()[1:] == [[-3.0, 8.0], [0.0, 20.0], [0.0, 40.0]]
+
+
+def test_straight_mode_plans_early_with_heading():
+    pp, controller = PurePursuit(), PIDController()
+    # 주시 거리(LOOKAHEAD_MAX) 밖의 장애물도 직선 추종 중이면 미리 우회 경로를 계획
+    obstacles = FakeObstacles([(0.0, 25.0, 1.5)], via=(4.0, 25.0))
+    pp.compute_move((0.0, 0.0), 0.3, 0.0, (0.0, 40.0), controller, obstacles)
+    assert obstacles.goals == [(0.0, 40.0)] and obstacles.heading == 0.3
+    assert pp.planned and pp.path.end == (0.0, 40.0)
+
+
+def test_blocked_without_detour_stops():
+    pp, controller = PurePursuit(), PIDController()
+    obstacles = FakeObstacles([(0.0, 4.0, 1.5)], via=None)
+    obstacles.find_alternative_path = lambda *args: None
+    command = _command(pp.compute_move((0.0, 2.0), 0.0, 0.0, (0.0, 20.0), controller, obstacles))
+    assert command["move"] == "STOP" and command["message"] == BLOCKED_MESSAGE
+
+
+@pytest.mark.parametrize("avoidance, pursuit, expected", [
+    ("STOP", "W", "STOP"),                 # 정지 범위: 회피 명령 우선
+    ("SLOW_DOWN", "W", "SLOW_DOWN"),
+    ("TURN_LEFT", "W", "W"),               # 먼 장애물: 우회 경로 추종이 우선
+    ("TURN_LEFT", "BLOCKED", "TURN_LEFT"),  # 우회 경로도 없이 막혔을 때만 회피 방향
+])
+def test_get_move_avoidance_priority(monkeypatch, avoidance, pursuit, expected):
+    nav = Navigation()
+    nav.position_handler.current_position = (0.0, 0.0)
+    nav.destination = (0.0, 30.0)
+    monkeypatch.setattr(nav.obstacle_handler, "get_avoidance_command",
+                        lambda position, heading: {"move": avoidance, "weight": 1.0})
+    command = ({"move": "STOP", "weight": 1.0, "message": BLOCKED_MESSAGE} if pursuit == "BLOCKED"
+               else {"move": pursuit, "weight": 1.0})
+    monkeypatch.setattr(nav.pure_pursuit, "compute_move", lambda *args: command)
+    assert nav.get_move()["move"] == expected
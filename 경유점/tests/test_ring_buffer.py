@@ -0,0 +1,65 @@
+"""RingBuffer 경계 처리: 용량을 넘는 append/extend, last(n), latest, 읽기 전용 뷰."""
+import numpy as np
+import pytest
+from config.ring_buffer import RingBuffer
+
+
+def test_append_wraparound_keeps_latest_in_order():
+    ring = RingBuffer(5)
+    for v in range(13):
+        ring.append(float(v))
+        expected = np.arange(max(0, v - 4), v + 1, dtype=float)
+        assert np.array_equal(ring.last(), expected)
+    assert ring.count == 13 and len(ring) == 5
+    assert ring.latest() == 12.0
+
+
+@pytest.mark.parametrize("n, expected", [(0, []), (1, [12.0]), (3, [10.0, 11.0, 12.0]),
+                                         (5, [8.0, 9.0, 10.0, 11.0, 12.0]), (99, [8.0, 9.0, 10.0, 11.0, 12.0])])
+def test_last_n_clamped_to_size(n, expected):
+    ring = RingBuffer(5)
+    ring.extend(np.arange(13, dtype=float))
+    assert ring.last(n).tolist() == expected
+
+
+def test_last_before_full():
+    ring = RingBuffer(8, columns=2)
+    assert ring.last().shape == (0, 2) and ring.latest() is None
+    ring.extend([(1, 2), (3, 4), (5, 6)])
+    assert ring.last(2).tolist() == [[3.0, 4.0], [5.0, 6.0]]
+    assert ring.latest() == (5.0, 6.0)
+
+
+def test_extend_across_boundary_matches_appends():
+    a, b = RingBuffer(7, columns=2), RingBuffer(7, columns=2)
+    values = np.arange(46, dtype=float).reshape(-1, 2)
+    for chunk in (values[:4], values[4:9], values[9:10], values[10:]):
+        a.extend(chunk)
+    for row in values:
+        b.append(row)
+    assert a.count == b.count == len(values)
+    assert np.array_equal(a.last(), b.last())
+    assert np.array_equal(a.last(), values[-7:])
+
+
+def test_extend_longer_than_capacity():
+    ring = RingBuffer(4)
+    ring.append(-1.0)
+    ring.extend(np.arange(10, dtype=float))
+    assert ring.count == 11
+    assert ring.last().tolist() == [6.0, 7.0, 8.0, 9.0]
+
+
+def test_views_are_read_only_and_clear_resets():
+    ring = RingBuffer(3)
+    ring.extend([1.0, 2.0])
+    view = ring.last()
+    with pytest.raises(ValueError):
+        view[0] = 5.0
+    ring.clear()
+    assert len(ring) == 0 and ring.last().size == 0
+
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        RingBuffer(0)
@@ -0,0 +1,66 @@
+"""PathPlanner.segments_blocked가 기존 선분별 반복문(포인트마다 수직 투영 거리 비교)과 같은 결과를 내는지."""
+import numpy as np
+import pytest
+from navigation.obstacle.cluster_store import ClusterStore
+from navigation.obstacle.path_planner import PathPlanner
+from navigation.obstacle.spatial_index import FrameSpatialIndex
+
+
+def _loop_blocked(start, end, clusters, obstacle_radius: float) -> bool:
+    """벡터화 이전 is_obstacle_in_path 구현."""
+    path_start = np.asarray(start, dtype=np.float64)
+    path_vec = np.asarray(end, dtype=np.float64) - path_start
+    path_length = np.linalg.norm(path_vec)
+    if path_length == 0:
+        return False
+    for cluster in clusters:
+        for point in cluster:
+            to_point = np.array(point) - path_start
+            projection = np.dot(to_point, path_vec) / path_length
+            if projection < 0 or projection > path_length:
+                continue
+            closest_point = path_start + (projection / path_length) * path_vec
+            if np.linalg.norm(np.array(point) - closest_point) < obstacle_radius:
+                return True
+    return False
+
+
+@pytest.fixture
+def scene():
+    rng = np.random.default_rng(11)
+    centers = rng.uniform(-40, 40, size=(25, 2))
+    clusters = [c + rng.normal(scale=1.5, size=(rng.integers(3, 30), 2)) for c in centers]
+    starts = rng.uniform(-50, 50, size=(400, 2))
+    ends = starts + rng.normal(scale=15.0, size=(400, 2))
+    ends[:5] = starts[:5]  # 길이 0 선분은 막히지 않음
+    return ClusterStore.from_clusters(clusters, version=1), starts, ends
+
+
+@pytest.mark.parametrize("radius", [0.5, 2.0])
+def test_matches_loop_without_index(scene, radius):
+    clusters, starts, ends = scene
+    planner = PathPlanner(radius)
+    expected = [_loop_blocked(s, e, clusters, radius) for s, e in zip(starts, ends)]
+    blocked = planner.segments_blocked(starts, ends, clusters)
+    assert 0 < sum(expected) < len(expected)
+    assert blocked.tolist() == expected
+
+
+@pytest.mark.parametrize("radius", [0.5, 2.0])
+def test_matches_loop_with_index_and_field(scene, radius):
+    clusters, starts, ends = scene
+    planner = PathPlanner(radius, grid_size=200.0)
+    index = FrameSpatialIndex(clusters.points)
+    field = planner.update_map(clusters, (0.0, 0.0))
+    expected = [_loop_blocked(s, e, clusters, radius) for s, e in zip(starts, ends)]
+    assert planner.segments_blocked(starts, ends, clusters, index=index).tolist() == expected
+    assert planner.segments_blocked(starts, ends, clusters, field=field).tolist() == expected
+    assert planner.segments_blocked(starts, ends, clusters, index=index, field=field).tolist() == expected
+
+
+def test_is_obstacle_in_path_single_segment(scene):
+    clusters, starts, ends = scene
+    planner = PathPlanner(1.0)
+    for s, e in zip(starts[:50], ends[:50]):
+        assert planner.is_obstacle_in_path(*map(float, s), *map(float, e), clusters) == \
+            _loop_blocked(s, e, clusters, 1.0)
@@ -0,0 +1,77 @@
+"""세션: 지연 생성과 설정 분리, 세션 수 한도(503), 유휴 정리, /config 값 검사와 중첩 설정 병합."""
+import time
+import pytest
+from config.config_schema import validate_config
+from config.shared_config import SHARED
+from navigation.session_manager import DEFAULT_SESSION, SessionLimitError, SessionManager
+import web.app as flask_app
+
+
+@pytest.fixture
+def sessions():
+    sessions = SessionManager(idle_timeout=60.0, max_sessions=3)
+    yield sessions
+    sessions.stop(timeout=1.0)
+
+
+def test_sessions_are_created_lazily_with_their_own_store(sessions):
+    default_step = SHARED['CONFIG_PARAMS']['MOVE_STEP']
+    a = sessions.get("a", config_overrides={"MOVE_STEP": 0.3})
+    assert sessions.get("a") is a and sessions.get() is sessions.default
+    assert sessions.default.store is SHARED and a.store is not SHARED
+    assert a.store['CONFIG_PARAMS']['MOVE_STEP'] == 0.3
+    assert SHARED['CONFIG_PARAMS']['MOVE_STEP'] == default_step  # 기본 세션 설정은 그대로
+    assert sessions.stats()["created"] == 2
+
+
+def test_limit_and_removal(sessions):
+    sessions.get("a")
+    sessions.get("b")
+    with pytest.raises(SessionLimitError):
+        sessions.get("c")
+    assert sessions.get("a") is not None  # 있는 세션은 한도와 무관
+    assert sessions.remove("b") and not sessions.remove("b") and not sessions.remove(DEFAULT_SESSION)
+    assert sessions.get("c").session_id == "c"
+
+
+def test_idle_sessions_are_evicted(sessions):
+    sessions.get("a")
+    sessions.idle_timeout = 0.01
+    time.sleep(0.05)
+    assert sessions.evict_idle() == 1 and len(sessions) == 1 and sessions.evicted == 1
+
+
+@pytest.fixture
+def client(monkeypatch):
+    sessions = SessionManager(idle_timeout=60.0, max_sessions=2)
+    monkeypatch.setattr(flask_app, "sessions", sessions)
+    yield flask_app.app.test_client()
+    sessions.stop(timeout=1.0)
+
+
+def test_flask_session_limit_is_503(client):
+    assert client.get("/tank/a/get_move").status_code == 200
+    response = client.get("/get_move", headers={"X-Tank-Id": "b"})
+    assert response.status_code == 503 and response.get_json()["status"] == "ERROR"
+    assert client.get("/get_move").status_code == 200  # 기본 세션은 항상 있음
+
+
+def test_flask_config_validation_and_merge(client):
+    params = SHARED['CONFIG_PARAMS']
+    weight = next(iter(params['WEIGHT_FACTORS']))
+    response = client.post("/tank/a/config", json={"WEIGHT_FACTORS": {weight: 2.0}, "MOVE_STEP": 0.25})
+    assert response.status_code == 200
+    config = flask_app.sessions.get("a").store['CONFIG_PARAMS']
+    assert config['WEIGHT_FACTORS'][weight] == 2.0 and config['MOVE_STEP'] == 0.25
+    assert dict(config['WEIGHT_FACTORS'], **{weight: params['WEIGHT_FACTORS'][weight]}) == \
+        dict(params['WEIGHT_FACTORS'])  # 나머지 항목은 그대로
+    for bad in ({"NOPE": 1}, {"MOVE_STEP": "fast"}, {"MOVE_STEP": float("nan")},
+                {"WEIGHT_FACTORS": {"Q": 1.0}}, {"PATH_PLANNER": "teleport"}):
+        assert client.post("/tank/a/config", json=bad).status_code == 400
+
+
+def test_validate_config_clamps_to_range():
+    current = SHARED['CONFIG_PARAMS']
+    assert validate_config(current, {"GRID_SIZE": -5.0})["GRID_SIZE"] == 1.0
+    with pytest.raises(ValueError, match="integer"):
+        validate_config(current, {"ROLLOUT_SAMPLES": 1.5})
@@ -0,0 +1,90 @@
+"""SharedSegment seqlock: 쓰는 중(홀수 seq)이거나 읽는 동안 seq가 바뀐 읽기는 버리고 다시 읽는지."""
+import threading
+import numpy as np
+import pytest
+from config.shared_segment import SharedSegment
+
+
+@pytest.fixture
+def segment():
+    seg = SharedSegment.create(capacity=16, max_points=64, max_clusters=8, state_bytes=256)
+    yield seg
+    seg.close()  # 만든 쪽이라 unlink까지
+
+
+def _write(seg: SharedSegment, k: int):
+    points = np.full((k % 7 + 1, 2), float(k))
+    seg.write(points, [0, len(points)], k, {"k": k})
+
+
+def test_read_returns_latest_and_none_when_unchanged(segment):
+    assert segment.read() is None  # 아직 기록 없음
+    _write(segment, 3)
+    seq, points, offsets, version, state = segment.read()
+    assert seq == 2 and version == 3 and state == {"k": 3}
+    assert offsets.tolist() == [0, 4] and np.all(points == 3.0)
+    assert segment.read(since=seq) is None
+
+
+def test_read_gives_up_while_writer_holds_odd_seq(segment):
+    _write(segment, 1)
+    segment.header[1] += 1  # 쓰는 중 (seq 홀수)
+    assert segment.read(retries=5) is None
+    segment.header[1] += 1
+    assert segment.read()[4] == {"k": 1}
+
+
+class _WriteDuringCopy:
+    """points 영역을 처음 읽을 때 새 기록을 끼워 넣는 래퍼 (읽는 도중 쓰기가 끝난 상황 재현)."""
+    def __init__(self, seg: SharedSegment, array: np.ndarray):
+        self.seg = seg
+        self.array = array
+        self.reads = 0
+
+    def __getitem__(self, key):
+        self.reads += 1
+        if self.reads == 1:
+            _write(self.seg, 9)
+        return self.array[key]
+
+    def __setitem__(self, key, value):
+        self.array[key] = value
+
+
+def test_torn_read_is_retried(segment):
+    _write(segment, 2)
+    wrapper = _WriteDuringCopy(segment, segment._arrays["points"])
+    segment._arrays["points"] = wrapper
+    seq, points, _, version, state = segment.read()
+    assert wrapper.reads == 2  # 첫 읽기는 seq가 바뀌어서 버림
+    assert seq == 4 and version == 9 and state == {"k": 9}
+    assert np.all(points == 9.0) and len(points) == 9 % 7 + 1
+
+
+def test_concurrent_reads_are_consistent(segment):
+    """쓰는 스레드가 계속 기록하는 동안 읽은 결과는 모두 한 기록에서 나온 것."""
+    stop = threading.Event()
+
+    def writer():
+        k = 0
+        while not stop.is_set():
+            k += 1
+            _write(segment, k)
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        seen = 0
+        for _ in range(2000):
+            result = segment.read()
+            if result is None:
+                continue
+            _, points, offsets, version, state = result
+            k = state["k"]
+            assert version == k and len(points) == k % 7 + 1 and offsets.tolist() == [0, len(points)]
+            assert np.all(points == float(k))
+            seen += 1
+        assert seen > 0
+    finally:
+        stop.set()
+        thread.join()
@@ -0,0 +1,34 @@
+"""FrameSpatialIndex: 반경 이웃 그래프와 그것을 재사용하는 DBSCAN 백엔드, 최근접 장애물 조회."""
+import numpy as np
+import pytest
+from sklearn.cluster import DBSCAN
+from navigation.obstacle.cluster_backends import DBSCANBackend
+from navigation.obstacle.spatial_index import FrameSpatialIndex
+
+
+def test_radius_neighbors_graph_distances():
+    coords = np.array([[0.0, 0.0], [0.0, 0.0], [1.0, 0.0], [5.0, 5.0]])
+    graph = FrameSpatialIndex(coords).radius_neighbors_graph(1.5)
+    dense = graph.toarray()
+    assert np.allclose(dense, dense.T)
+    # 자기 자신과 중복 점(거리 0)도 저장된 이웃
+    assert graph.getnnz(axis=1).tolist() == [3, 3, 3, 1]
+    assert dense[0, 2] == pytest.approx(1.0) and dense[3, :3].tolist() == [0.0, 0.0, 0.0]
+
+
+@pytest.mark.parametrize("seed", range(10))
+def test_dbscan_backend_with_index_matches_dbscan(seed):
+    rng = np.random.default_rng(seed)
+    coords = np.round(rng.uniform(0.0, 20.0, (200, 2)) * 2.0) / 2.0
+    eps, min_samples = float(rng.uniform(0.4, 2.0)), int(rng.integers(1, 6))
+    expected = DBSCAN(eps=eps, min_samples=min_samples).fit(coords).labels_
+    labels = DBSCANBackend().labels(coords, eps, min_samples, FrameSpatialIndex(coords))
+    assert np.array_equal(labels, expected)
+
+
+def test_nearest_obstacle_skips_noise():
+    coords = np.array([[0.0, 0.0], [10.0, 0.0], [10.5, 0.0]])
+    index = FrameSpatialIndex(coords)
+    index.set_labels(np.array([-1, 0, 0]))
+    dist, idx = index.nearest_obstacle(np.array([[0.0, 0.0]]), k=1)
+    assert idx.tolist() == [1] and dist[0] == pytest.approx(10.0)
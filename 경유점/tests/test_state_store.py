@@ -0,0 +1,65 @@
+"""StateStore: 복사 후 교체 스냅샷, key_versions, 알림이 version 순서대로 오는지, 기록 버퍼가 읽기 전용 뷰인지."""
+import threading
+import pytest
+from config.ring_buffer import RingBuffer
+from config.state_store import StateStore
+
+
+def test_snapshots_are_isolated_from_later_publishes():
+    store = StateStore({'a': 1, 'cfg': {'x': [1, 2]}})
+    before = store.snapshot()
+    after = store.publish(a=2)
+    assert before['a'] == 1 and after['a'] == 2 and store.version == 1
+    assert after['cfg'] is before['cfg'] and after['cfg']['x'] == (1, 2)
+    with pytest.raises(TypeError):
+        before['cfg']['y'] = 3
+    assert after.changed('a', 0) and not after.changed('cfg', 0)
+
+
+def test_update_skips_empty_changes():
+    store = StateStore({'n': 0})
+    store.update(lambda s: {'n': s['n'] + 1})
+    store.update(lambda s: {})
+    assert store['n'] == 1 and store.version == 1
+
+
+def test_listeners_receive_changes_in_version_order():
+    store = StateStore({'n': 0})
+    seen = []
+    store.subscribe(lambda changes: seen.append(changes['n']))
+
+    def writer():
+        for _ in range(200):
+            store.update(lambda s: {'n': s['n'] + 1})
+    threads = [threading.Thread(target=writer) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert seen == list(range(1, 801))
+
+
+def test_publish_from_listener_is_delivered_after_current_change():
+    store = StateStore({'n': 0})
+    first, second = [], []
+
+    def chain(changes):
+        first.append(changes['n'])
+        if changes['n'] < 3:
+            store.publish(n=changes['n'] + 1)
+    store.subscribe(chain)
+    store.subscribe(lambda changes: second.append(changes['n']))
+    store.publish(n=1)
+    assert first == second == [1, 2, 3]
+
+
+def test_ring_buffers_are_read_only_in_snapshots():
+    ring = RingBuffer(4)
+    store = StateStore({'speed': ring})
+    view = store['speed']
+    assert not hasattr(view, 'append') and store.buffer('speed') is ring
+    ring.append(1.0)
+    assert view.count == 1 and view.latest() == 1.0 and not view.last().flags.writeable
+    replacement = RingBuffer(4)
+    store.publish(speed=replacement)
+    assert store.buffer('speed') is replacement and store['speed'].count == 0
@@ -0,0 +1,106 @@
+"""스트리밍 채널: 길이 접두 프레임 형식, 세션 선택/응답, 명령 푸시가 공유 명령 dict를 바꾸지 않는지."""
+import io
+import json
+import socket
+import struct
+import threading
+import pytest
+from navigation.session_manager import SessionManager
+from web.stream_server import StreamServer, recv_frame, send_frame
+
+INFO = {"playerPos": [0, 0, 0], "enemyPos": [60, 0, 60], "enemyTurretX": 0.0}
+
+
+def _frame(payload: bytes) -> bytes:
+    return struct.pack(">I", len(payload)) + payload
+
+
+def test_frame_round_trip():
+    a, b = socket.socketpair()
+    with a, b:
+        send_frame(a, {"type": "info", "text": "전차", "n": [1, 2]})
+        send_frame(a, {"type": "tick"})
+        rfile = b.makefile("rb")
+        assert recv_frame(rfile) == {"type": "info", "text": "전차", "n": [1, 2]}
+        assert recv_frame(rfile) == {"type": "tick"}
+
+
+@pytest.mark.parametrize("data", [b"", b"\x00\x00", _frame(b'{"a": 1}')[:-1]])
+def test_closed_or_truncated_stream_is_none(data):
+    assert recv_frame(io.BytesIO(data)) is None
+
+
+@pytest.mark.parametrize("data, message", [
+    (_frame(b"[1, 2]"), "JSON object"),
+    (_frame(b"x" * 65), "exceeds 64"),
+])
+def test_bad_frames_raise(data, message):
+    with pytest.raises(ValueError, match=message):
+        recv_frame(io.BytesIO(data), max_frame=64)
+
+
+def test_bad_json_raises():
+    with pytest.raises(ValueError):
+        recv_frame(io.BytesIO(_frame(b"{not json")))
+
+
+@pytest.fixture
+def server():
+    sessions = SessionManager(idle_timeout=60.0, max_sessions=4)
+    server = StreamServer(sessions, host="127.0.0.1", port=0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+    sessions.stop(timeout=1.0)
+
+
+def _connect(server) -> tuple:
+    sock = socket.create_connection(server.server_address, timeout=5.0)
+    return sock, sock.makefile("rb")
+
+
+def _next(rfile, kind: str):
+    """kind 타입 메시지가 올 때까지 읽음 (명령 푸시와 응답이 섞여 옴)."""
+    while True:
+        message = recv_frame(rfile)
+        assert message is not None
+        if message.get("type") == kind:
+            return message
+
+
+def test_hello_binds_session_and_pushes_latest(server):
+    sock, rfile = _connect(server)
+    with sock:
+        send_frame(sock, {"type": "hello", "tank_id": "t1"})
+        assert _next(rfile, "hello") == {"type": "hello", "status": "OK", "session": "t1"}
+        assert _next(rfile, "command")["seq"] == 0
+        send_frame(sock, {"type": "nope"})
+        assert "Unknown message type" in _next(rfile, "error")["message"]
+        send_frame(sock, {"type": "info", "playerPos": [0, 0, 0]})  # 적 정보 없음: 반영 오류 응답
+        assert _next(rfile, "info")["status"] == "ERROR"
+
+
+def test_tick_pushes_command_to_every_subscriber(server):
+    first, first_r = _connect(server)
+    second, second_r = _connect(server)
+    with first, second:
+        for sock, rfile in ((first, first_r), (second, second_r)):
+            send_frame(sock, {"type": "hello", "tank_id": "shared"})
+            _next(rfile, "hello")
+            _next(rfile, "command")
+        send_frame(first, dict(INFO, type="tick"))
+        pushed = [_next(first_r, "command"), _next(second_r, "command")]
+        assert pushed[0]["seq"] == pushed[1]["seq"] == 1
+        assert "type" not in server.sessions.get("shared").control_loop.latest()
+
+
+def test_oversized_frame_closes_connection(server, monkeypatch):
+    from config.shared_config import SERVER_CONFIG
+    monkeypatch.setitem(SERVER_CONFIG, 'stream_max_frame', 128)
+    sock, rfile = _connect(server)
+    with sock:
+        sock.sendall(_frame(json.dumps({"type": "info", "pad": "x" * 200}).encode()))
+        assert "exceeds 128" in _next(rfile, "error")["message"]
+        assert rfile.read(1) == b""
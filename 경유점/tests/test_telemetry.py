@@ -0,0 +1,47 @@
+"""텔레메트리 파싱: 좌표 형식 세 가지, 선택 필드, 형식 오류는 ValueError(필드 이름 포함), 배치 정렬."""
+import pytest
+from navigation.telemetry import TelemetryFrame, Vec3, parse_batch, parse_telemetry, parse_vec3
+
+
+@pytest.mark.parametrize("value", [{"x": 1, "y": 2, "z": 3}, "1,2,3", [1, 2, 3], (1.0, 2.0, 3.0)])
+def test_vec3_formats(value):
+    assert parse_vec3(value) == Vec3(1.0, 2.0, 3.0)
+
+
+def test_vec3_dict_defaults_y():
+    assert parse_vec3({"x": 1, "z": 3}).xz == (1.0, 3.0)
+
+
+@pytest.mark.parametrize("value", [{"x": 1}, "1,2", "a,b,c", [1, 2], None, 5, {"x": "a", "z": 0}])
+def test_vec3_errors_name_the_field(value):
+    with pytest.raises(ValueError, match="Invalid playerPos"):
+        parse_vec3(value, "playerPos")
+
+
+def test_parse_telemetry_fields():
+    frame = parse_telemetry({"timestamp": "1.5", "playerPos": [1, 0, 2], "enemyPos": "3,0,4",
+                             "enemyTurretX": 10, "playerSpeed": 20, "lidarPoints": [{"p": 1}]})
+    assert frame == TelemetryFrame(1.5, Vec3(1, 0, 2), Vec3(3, 0, 4), 10.0, 20.0, [{"p": 1}])
+    assert frame.without_lidar().lidar_points is None and frame.lidar_points == [{"p": 1}]
+    empty = parse_telemetry({"lidarPoints": []})
+    assert empty == TelemetryFrame(None, None, None, None, None, None)
+
+
+@pytest.mark.parametrize("data, field", [
+    ([1, 2], "JSON object"),
+    ({"timestamp": "soon"}, "Invalid timestamp"),
+    ({"enemyTurretX": [1]}, "Invalid enemyTurretX"),
+    ({"playerSpeed": {}}, "Invalid playerSpeed"),
+    ({"enemyPos": "1,2"}, "Invalid enemyPos"),
+])
+def test_parse_telemetry_errors(data, field):
+    with pytest.raises(ValueError, match=field):
+        parse_telemetry(data)
+
+
+def test_parse_batch_sorts_and_requires_timestamps():
+    frames = parse_batch([{"timestamp": 2, "playerPos": [2, 0, 0]}, {"timestamp": 1, "playerPos": [1, 0, 0]}])
+    assert [f.timestamp for f in frames] == [1.0, 2.0]
+    for bad in ([], {"frames": 1}, [{"playerPos": [0, 0, 0]}]):
+        with pytest.raises(ValueError):
+            parse_batch(bad)
@@ -1,78 +1,189 @@
-from flask import Flask, request, jsonify
-from navigation.navigation import Navigation
+from flask import Flask, Response, request, jsonify
+from navigation.session_manager import SessionManager, Session, SessionLimitError
+from navigation.obstacle.lidar_frame import decode_frame
+from navigation.telemetry import parse_telemetry, parse_batch, parse_vec3
 from config.shared_config import SERVER_CONFIG
+from config.config_schema import validate_config
+from config.metrics import METRICS
 
 app = Flask(__name__)
-navigator = Navigation()
+# 전차(세션)별 Navigation/제어 루프/파이프라인. 세션 ID는 /tank/<tank_id>/... 경로 또는 X-Tank-Id 헤더,
+# 둘 다 없으면 기본 세션
+sessions = SessionManager()
 
-@app.route('/init', methods=['GET'])
-def init_simulation():
-    result = navigator.init_simulation()
-    return jsonify(result)
 
+def tank_routes(rule: str, **options):
+    """rule과 /tank/<tank_id>rule 두 경로에 같은 뷰 함수를 등록."""
+    def decorator(view):
+        app.route(rule, **options)(view)
+        app.route(f"/tank/<tank_id>{rule}", **options)(view)
+        return view
+    return decorator
 
-@app.route('/info', methods=['POST'])
-def update_info():
-    """시뮬레이터에서 전송된 LiDAR 및 위치 데이터를 처리."""
-    data = request.get_json()
-    if not data:
-        return jsonify({"status": "ERROR", "message": "데이터 누락"}), 400
-    result = navigator.update_info(data)
 
-    print("=== /info 응답 ===")
-    print(result)
+def read_json():
+    """요청 본문 JSON 디코딩 (시간은 tank_stage_seconds{stage="json_decode"})."""
+    with METRICS.timer("json_decode"):
+        return request.get_json()
 
-    if result["status"] == "ERROR":
-        return jsonify(result), 400
+def current_session(tank_id=None) -> Session:
+    """요청의 세션 (처음 보는 ID면 생성). 세션 수 제한에 걸리면 SessionLimitError (503 응답)."""
+    return sessions.get(tank_id or request.headers.get('X-Tank-Id'))
+
+@app.errorhandler(SessionLimitError)
+def session_limit_exceeded(e):
+    return jsonify({"status": "ERROR", "message": str(e)}), 503
+
+@tank_routes('/init', methods=['GET'])
+def init_simulation(tank_id=None):
+    session = current_session(tank_id)
+    with session.lock:
+        result = session.navigator.init_simulation()
     return jsonify(result)
 
-@app.route('/update_position', methods=['POST'])
-def update_position():
-    data = request.get_json()
+
+@tank_routes('/info', methods=['POST'])
+def update_info(tank_id=None):
+    """시뮬레이터에서 전송된 LiDAR 및 위치 데이터를 파이프라인 수신 단계에 넣고 바로 반환."""
+    data = read_json()
+    if not data:
+        return jsonify({"status": "ERROR", "message": "데이터 누락"}), 400
+    try:
+        frame = parse_telemetry(data)
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+    result = current_session(tank_id).pipeline.submit("info", frame)
+    return jsonify(result), (400 if result["status"] == "ERROR" else 200)
+
+@tank_routes('/update_position', methods=['POST'])
+def update_position(tank_id=None):
+    data = read_json()
     if not data or "position" not in data:
         return jsonify({"status": "ERROR", "message": "위치 데이터 누락"}), 400
 
-    if isinstance(data["position"], str):
-        result = navigator.position_handler.update_position(data["position"])
-    else:
-        position_str = f"{data['position']['x']},{data['position']['y']},{data['position']['z']}"
-        result = navigator.position_handler.update_position(position_str)
+    try:
+        position = parse_vec3(data["position"])
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+    session = current_session(tank_id)
+    with session.lock:
+        result = session.navigator.position_handler.update_vec(position, data.get("timestamp"))
     
     if result["status"] == "ERROR":
         return jsonify(result), 400
     return jsonify(result)
 
-@app.route('/set_destination', methods=['POST'])
-def set_destination():
-    data = request.get_json()
+@tank_routes('/set_destination', methods=['POST'])
+def set_destination(tank_id=None):
+    data = read_json()
     if not data or "destination" not in data:
         return jsonify({"status": "ERROR", "message": "목적지 데이터 누락"}), 400
 
-    result = navigator.set_destination(data["destination"])
+    session = current_session(tank_id)
+    with session.lock:
+        result = session.navigator.set_destination(data["destination"])
     if result["status"] == "ERROR":
         return jsonify(result), 400
     return jsonify(result)
 
-@app.route('/get_move', methods=['GET'])
-def get_move():
-    return jsonify(navigator.get_move())
+@tank_routes('/get_move', methods=['GET'])
+def get_move(tank_id=None):
+    """제어 루프가 마지막으로 게시한 명령 (seq, timestamp 포함)."""
+    return jsonify(current_session(tank_id).control_loop.latest())
 
-@app.route('/get_action', methods=['GET'])
-def get_action():
+@tank_routes('/get_action', methods=['GET'])
+def get_action(tank_id=None):
     """get_move와 동일한 동작을 수행 (호환성 유지)."""
-    return jsonify(navigator.get_move())
+    return jsonify(current_session(tank_id).control_loop.latest())
 
-@app.route('/update_obstacle', methods=['POST'])
-def update_obstacle():
+@tank_routes('/update_obstacle', methods=['POST'])
+def update_obstacle(tank_id=None):
     """정적 장애물 데이터를 Navigation 클래스에 반영."""
-    data = request.get_json()
-    if not data or "obstacles" not in data:
+    data = read_json()
+    if not data or ("lidarPoints" not in data and "obstacles" not in data):
         return jsonify({"status": "ERROR", "message": "장애물 데이터 누락"}), 400
 
-    result = navigator.update_obstacle(data)
+    return jsonify(current_session(tank_id).pipeline.submit("obstacle", data)), 200
+
+@tank_routes('/lidar_frame', methods=['POST'])
+def update_lidar_frame(tank_id=None):
+    """바이너리 LiDAR 프레임(float32 x/y/z[/intensity] + pose 헤더)을 처리."""
+    try:
+        frame = decode_frame(request.get_data(cache=False))
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+
+    result = current_session(tank_id).pipeline.submit("frame", frame)
     if result["status"] == "ERROR":
         return jsonify(result), 400
-    return jsonify(result), 200
+    result.update({"timestamp": frame.timestamp, "points": len(frame.points)})
+    return jsonify(result)
+
+@tank_routes('/info_batch', methods=['POST'])
+def update_info_batch(tank_id=None):
+    """시뮬레이터 시각("timestamp")이 붙은 /info 프레임 묶음({"frames": [...]})을 한 번에 처리."""
+    data = read_json()
+    if not isinstance(data, dict) or not isinstance(data.get("frames"), list):
+        return jsonify({"status": "ERROR", "message": "프레임 목록 누락"}), 400
+    try:
+        frames = parse_batch(data["frames"])
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+    result = current_session(tank_id).ingest_batch(frames)
+    return jsonify(result), (400 if result["status"] == "ERROR" else 200)
+
+@tank_routes('/tick', methods=['POST'])
+def tick(tank_id=None):
+    """한 틱의 위치/적 정보와 LiDAR를 처리하고 새 명령을 같은 응답으로 반환 (/info + /get_action 한 번에)."""
+    data = read_json()
+    if not data:
+        return jsonify({"status": "ERROR", "message": "데이터 누락"}), 400
+    try:
+        frame = parse_telemetry(data)
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+    return jsonify(current_session(tank_id).tick(frame))
+
+@tank_routes('/pipeline_stats', methods=['GET'])
+def pipeline_stats(tank_id=None):
+    """단계별 처리/버림 횟수와 입력 나이."""
+    return jsonify(current_session(tank_id).pipeline.stats())
+
+@tank_routes('/config', methods=['POST'])
+def update_config(tank_id=None):
+    """이 세션의 CONFIG_PARAMS 일부를 덮어씀 (다른 세션에는 영향 없음).
+
+    값은 config_schema.validate_config로 검사한다: 모르는 키나 타입이 다른 값은 400, 범위 밖 값은 경계로 자름.
+    dict 값(WEIGHT_FACTORS)은 준 항목만 바꾼다.
+    """
+    data = read_json()
+    if not data or not isinstance(data, dict):
+        return jsonify({"status": "ERROR", "message": "설정 데이터 누락"}), 400
+
+    session = current_session(tank_id)
+    try:
+        values = validate_config(session.store['CONFIG_PARAMS'], data)
+    except ValueError as e:
+        return jsonify({"status": "ERROR", "message": str(e)}), 400
+    session.store.update_config(**values)
+    return jsonify({"status": "OK", "session": session.session_id, "updated": sorted(values), "values": values})
+
+@app.route('/sessions', methods=['GET'])
+def list_sessions():
+    """현재 세션 목록과 세션별 요청 수, 유휴 시간, 제어 루프 통계."""
+    return jsonify(sessions.stats())
+
+@app.route('/tank/<tank_id>', methods=['DELETE'])
+def remove_session(tank_id):
+    """세션을 바로 정리 (기본 세션은 정리하지 않음)."""
+    removed = sessions.remove(tank_id)
+    return jsonify({"status": "OK" if removed else "ERROR", "session": tank_id, "removed": removed})
+
+@app.route('/metrics', methods=['GET'])
+def metrics():
+    """단계별 처리 시간 히스토그램, 프레임/버림 수, 락 대기 시간 (Prometheus 텍스트 형식)."""
+    return Response(METRICS.render_prometheus(), mimetype="text/plain; version=0.0.4")
 
 def run_flask():
+    sessions.start()
     app.run(host=SERVER_CONFIG['flask_host'], port=SERVER_CONFIG['flask_port'])
\ No newline at end of file
@@ -0,0 +1,254 @@
+import json
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from navigation.session_manager import SessionManager, Session, SessionLimitError
+from navigation.obstacle.lidar_frame import decode_frame
+from navigation.telemetry import parse_telemetry, parse_batch, parse_vec3
+from config.shared_config import SERVER_CONFIG
+from config.config_schema import validate_config
+from config.metrics import METRICS
+
+logger = logging.getLogger(__name__)
+
+
+class Request:
+    """ASGI 요청 하나: 경로의 전차 ID, 헤더(소문자 키), 본문."""
+    __slots__ = ('method', 'path', 'tank_id', 'headers', 'body')
+
+    def __init__(self, method: str, path: str, tank_id: Optional[str], headers: Dict[str, str], body: bytes):
+        self.method = method
+        self.path = path
+        self.tank_id = tank_id
+        self.headers = headers
+        self.body = body
+
+    def json(self) -> Any:
+        if not self.body:
+            return None
+        with METRICS.timer("json_decode"):
+            return json.loads(self.body)
+
+
+Response = Tuple[int, Any]
+Handler = Callable[[Request], Awaitable[Response]]
+
+
+class AsgiApp:
+    """Flask 앱(web/app.py)과 같은 경로를 제공하는 ASGI 앱.
+
+    - JSON/텔레메트리 디코딩과 응답만 이벤트 루프에서 처리한다.
+    - 세션 조회/생성/삭제, 세션 락, 파이프라인 submit, 인지/계획처럼 동기 코드를 부르는 처리는 (/metrics 렌더링 외
+      모든 경로) 작업 스레드 풀(SERVER_CONFIG['asgi_workers'])로 넘겨서 이벤트 루프가 막히지 않게 한다.
+    - /tick: 한 틱의 텔레메트리와 LiDAR를 받아 같은 응답으로 새 명령을 돌려준다 (/info + /get_action 왕복 1번).
+    세션(전차)은 /tank/<tank_id>/... 경로나 X-Tank-Id 헤더로 고르며 SessionManager는 Flask 앱과 같은 것을 쓸 수 있다.
+    """
+    def __init__(self, sessions: SessionManager, workers: Optional[int] = None):
+        self.sessions = sessions
+        self.executor = ThreadPoolExecutor(max_workers=workers or SERVER_CONFIG.get('asgi_workers', 4),
+                                           thread_name_prefix="asgi-worker")
+        self.routes: Dict[Tuple[str, str], Handler] = {
+            ("GET", "/init"): self.init_simulation,
+            ("POST", "/info"): self.update_info,
+            ("POST", "/update_position"): self.update_position,
+            ("POST", "/set_destination"): self.set_destination,
+            ("GET", "/get_move"): self.get_move,
+            ("GET", "/get_action"): self.get_move,
+            ("POST", "/update_obstacle"): self.update_obstacle,
+            ("POST", "/lidar_frame"): self.update_lidar_frame,
+            ("POST", "/info_batch"): self.update_info_batch,
+            ("POST", "/tick"): self.tick,
+            ("GET", "/pipeline_stats"): self.pipeline_stats,
+            ("POST", "/config"): self.update_config,
+            ("GET", "/sessions"): self.list_sessions,
+            ("GET", "/metrics"): self.metrics,
+            ("DELETE", ""): self.remove_session
+        }
+
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable):
+        if scope["type"] == "lifespan":
+            await self._lifespan(receive, send)
+            return
+        if scope["type"] != "http":
+            return
+        method = scope["method"]
+        tank_id, route = self._split_path(scope["path"])
+        handler = self.routes.get((method, route))
+        if handler is None or (route == "" and tank_id is None):
+            await self._send(send, 404, {"status": "ERROR", "message": f"Not found: {method} {scope['path']}"})
+            return
+        headers = {k.decode("latin-1").lower(): v.decode("latin-1") for k, v in scope.get("headers", [])}
+        request = Request(method, route, tank_id, headers, await self._read_body(receive))
+        try:
+            status, payload = await handler(request)
+        except SessionLimitError as e:
+            status, payload = 503, {"status": "ERROR", "message": str(e)}
+        except ValueError as e:  # JSON/텔레메트리 형식 오류 포함
+            status, payload = 400, {"status": "ERROR", "message": str(e)}
+        except Exception as e:
+            logger.error("ASGI handler failed: %s", e, exc_info=True)
+            status, payload = 500, {"status": "ERROR", "message": str(e)}
+        await self._send(send, status, payload)
+
+    @staticmethod
+    def _split_path(path: str) -> Tuple[Optional[str], str]:
+        """/tank/<tank_id>/rest -> (tank_id, /rest), 그 외 -> (None, path)."""
+        if path.startswith("/tank/"):
+            tank_id, _, rest = path[len("/tank/"):].partition("/")
+            return tank_id or None, ("/" + rest) if rest else ""
+        return None, path
+
+    @staticmethod
+    async def _read_body(receive: Callable) -> bytes:
+        chunks: List[bytes] = []
+        while True:
+            message = await receive()
+            chunks.append(message.get("body", b""))
+            if not message.get("more_body", False):
+                return b"".join(chunks)
+
+    @staticmethod
+    async def _send(send: Callable, status: int, payload: Any):
+        """dict/list는 JSON, 문자열은 text/plain(/metrics)으로 응답."""
+        if isinstance(payload, str):
+            body, content_type = payload.encode("utf-8"), b"text/plain; version=0.0.4"
+        else:
+            body, content_type = json.dumps(payload, ensure_ascii=False).encode("utf-8"), b"application/json"
+        await send({"type": "http.response.start", "status": status,
+                    "headers": [(b"content-type", content_type),
+                                (b"content-length", str(len(body)).encode("ascii"))]})
+        await send({"type": "http.response.body", "body": body})
+
+    async def _lifespan(self, receive: Callable, send: Callable):
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self.sessions.start()
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.sessions.stop(timeout=1.0)
+                self.executor.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    def _session(self, request: Request) -> Session:
+        """요청의 세션. 처음 보는 전차면 세션(Navigation, 스레드)을 만드므로 작업 스레드에서 부른다."""
+        return self.sessions.get(request.tank_id or request.headers.get("x-tank-id"))
+
+    async def _offload(self, fn: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, fn, *args)
+
+    @staticmethod
+    def _status(result: Dict) -> Response:
+        return (400 if result.get("status") == "ERROR" else 200), result
+
+    async def init_simulation(self, request: Request) -> Response:
+        def run():
+            session = self._session(request)
+            with session.lock:
+                return session.navigator.init_simulation()
+        return 200, await self._offload(run)
+
+    async def update_info(self, request: Request) -> Response:
+        data = request.json()
+        if not data:
+            return 400, {"status": "ERROR", "message": "데이터 누락"}
+        frame = parse_telemetry(data)
+        return self._status(await self._offload(lambda: self._session(request).pipeline.submit("info", frame)))
+
+    async def update_position(self, request: Request) -> Response:
+        data = request.json()
+        if not data or "position" not in data:
+            return 400, {"status": "ERROR", "message": "위치 데이터 누락"}
+        position = parse_vec3(data["position"])
+
+        def run():
+            session = self._session(request)
+            with session.lock:
+                return session.navigator.position_handler.update_vec(position, data.get("timestamp"))
+        return self._status(await self._offload(run))
+
+    async def set_destination(self, request: Request) -> Response:
+        data = request.json()
+        if not data or "destination" not in data:
+            return 400, {"status": "ERROR", "message": "목적지 데이터 누락"}
+
+        def run():
+            session = self._session(request)
+            with session.lock:
+                return session.navigator.set_destination(data["destination"])
+        return self._status(await self._offload(run))
+
+    async def get_move(self, request: Request) -> Response:
+        return 200, await self._offload(lambda: self._session(request).control_loop.latest())
+
+    async def update_obstacle(self, request: Request) -> Response:
+        data = request.json()
+        if not data or ("lidarPoints" not in data and "obstacles" not in data):
+            return 400, {"status": "ERROR", "message": "장애물 데이터 누락"}
+        return self._status(await self._offload(lambda: self._session(request).pipeline.submit("obstacle", data)))
+
+    async def update_lidar_frame(self, request: Request) -> Response:
+        frame = await self._offload(decode_frame, request.body)
+        result = await self._offload(lambda: self._session(request).pipeline.submit("frame", frame))
+        if result["status"] == "ERROR":
+            return 400, result
+        result.update({"timestamp": frame.timestamp, "points": len(frame.points)})
+        return 200, result
+
+    async def update_info_batch(self, request: Request) -> Response:
+        data = request.json()
+        if not isinstance(data, dict) or not isinstance(data.get("frames"), list):
+            return 400, {"status": "ERROR", "message": "프레임 목록 누락"}
+        frames = parse_batch(data["frames"])
+        return self._status(await self._offload(lambda: self._session(request).ingest_batch(frames)))
+
+    async def tick(self, request: Request) -> Response:
+        data = request.json()
+        if not data:
+            return 400, {"status": "ERROR", "message": "데이터 누락"}
+        frame = parse_telemetry(data)
+        return 200, await self._offload(lambda: self._session(request).tick(frame))
+
+    async def pipeline_stats(self, request: Request) -> Response:
+        return 200, await self._offload(lambda: self._session(request).pipeline.stats())
+
+    async def update_config(self, request: Request) -> Response:
+        data = request.json()
+        if not data or not isinstance(data, dict):
+            return 400, {"status": "ERROR", "message": "설정 데이터 누락"}
+
+        def run():
+            session = self._session(request)
+            values = validate_config(session.store['CONFIG_PARAMS'], data)  # 잘못된 값은 ValueError -> 400
+            session.store.update_config(**values)
+            return {"status": "OK", "session": session.session_id, "updated": sorted(values), "values": values}
+        return 200, await self._offload(run)
+
+    async def list_sessions(self, request: Request) -> Response:
+        return 200, await self._offload(self.sessions.stats)
+
+    async def metrics(self, request: Request) -> Response:
+        return 200, METRICS.render_prometheus()
+
+    async def remove_session(self, request: Request) -> Response:
+        removed = await self._offload(self.sessions.remove, request.tank_id)  # 세션 스레드 종료를 기다림
+        return 200, {"status": "OK" if removed else "ERROR", "session": request.tank_id, "removed": removed}
+
+
+def create_asgi_app(sessions: Optional[SessionManager] = None) -> AsgiApp:
+    """ASGI 앱 생성. sessions를 주지 않으면 Flask 앱(web.app)과 같은 SessionManager를 쓴다."""
+    if sessions is None:
+        from web.app import sessions
+    return AsgiApp(sessions)
+
+
+def run_asgi():
+    """ASGI 서버(uvicorn)로 실행. Flask 서버와 같은 호스트/포트를 쓴다."""
+    try:
+        import uvicorn
+    except ImportError as e:
+        raise RuntimeError("ASGI mode needs uvicorn (pip install uvicorn)") from e
+    uvicorn.run(create_asgi_app(), host=SERVER_CONFIG['flask_host'], port=SERVER_CONFIG['flask_port'],
+                lifespan="on", access_log=False)
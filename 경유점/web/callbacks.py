@@ -2,18 +2,21 @@ from dash.dependencies import Input, Output, State
 from dash import Dash, html, dash
 import plotly.graph_objs as go
 import numpy as np
-from config.shared_config import SHARED, SHARED_LOCK, GRAPH_CONFIG
+from config.shared_config import SHARED, GRAPH_CONFIG
+from config.state_store import thaw
+from config.metrics import METRICS
+from navigation.obstacle.cluster_store import ClusterStore
 from web.layout import html as html_layout
 
 def register_callbacks(app: Dash):
     """Dash 앱에 콜백 등록."""
+    position_cache = {}  # 위치 차트: 마지막으로 그린 스냅샷 키 버전과 결과
     @app.callback(
         Output('speed-chart', 'figure'),
         Input('interval', 'n_intervals')
     )
     def update_speed_chart(n):
-        with SHARED_LOCK:
-            data = SHARED['speed_data'][-GRAPH_CONFIG['max_points']:]
+        data = SHARED['speed_data'].last(GRAPH_CONFIG['max_points'])
         return {
             'data': [go.Scatter(
                 y=data,
@@ -55,9 +58,9 @@ def register_callbacks(app: Dash):
         Input('interval', 'n_intervals')
     )
     def update_delta_chart(n):
-        with SHARED_LOCK:
-            del_x_data = SHARED['del_playerPos_x'][-GRAPH_CONFIG['max_points']:]
-            del_z_data = SHARED['del_playerPos_z'][-GRAPH_CONFIG['max_points']:]
+        delta = SHARED['del_playerPos'].last(GRAPH_CONFIG['max_points'])  # (ΔX, ΔZ) 행
+        del_x_data = delta[:, 0]
+        del_z_data = delta[:, 1]
         return {
             'data': [
                 go.Scatter(
@@ -112,16 +115,22 @@ def register_callbacks(app: Dash):
         Input('interval', 'n_intervals')
     )
     def update_position_chart(n):
-        with SHARED_LOCK:
-            pos_data = SHARED['player_pos'][-GRAPH_CONFIG['max_points']:] if SHARED.get('player_pos') else [[0, 0]]
-            clusters = SHARED.get('obstacle_clusters', [])
-            obstacle_radius = SHARED['CONFIG_PARAMS'].get('OBSTACLE_RADIUS', 1.0)
+        state = SHARED.snapshot()
+        # 위치, 장애물, 설정이 그대로면 지난번 결과를 재사용 (version 비교만 함)
+        key = (state['player_pos'].count, state.key_versions.get('obstacle_clusters'),
+               state.key_versions.get('CONFIG_PARAMS'))
+        if position_cache.get('key') == key:
+            return position_cache['value']
+        pos_data = state['player_pos'].last(GRAPH_CONFIG['max_points'])
+        if not len(pos_data):
+            pos_data = np.zeros((1, 2))
+        clusters = state.get('obstacle_clusters')
+        obstacle_radius = state['CONFIG_PARAMS'].get('OBSTACLE_RADIUS', 1.0)
 
         # 전차 경로
-        x_data = [pos[0] for pos in pos_data]
-        z_data = [pos[1] for pos in pos_data]
-        latest_pos = pos_data[-1] if pos_data else [0, 0]
-        x, z = latest_pos
+        x_data = pos_data[:, 0]
+        z_data = pos_data[:, 1]
+        x, z = float(pos_data[-1, 0]), float(pos_data[-1, 1])
 
         # 전차 스타일
         tank_style = {
@@ -141,12 +150,10 @@ def register_callbacks(app: Dash):
                 line=dict(width=2, color='rgba(39,174,96,0.5)')
             )
         ]
+        if not isinstance(clusters, ClusterStore):
+            clusters = ClusterStore.empty()
         obstacle_elements = []
-        for i, cluster in enumerate(clusters):
-            if not isinstance(cluster, (list, np.ndarray)) or len(cluster) == 0:
-                continue
-            centroid = np.mean(np.array(cluster), axis=0)
-            ox, oz = centroid
+        for i, (ox, oz) in enumerate(clusters.centroids):
             # 장애물 중심점
             data.append(
                 go.Scatter(
@@ -188,13 +195,10 @@ def register_callbacks(app: Dash):
         num_obstacles = len(clusters)
         avg_distance = 0.0
         if clusters:
-            distances = [
-                np.linalg.norm(np.mean(np.array(cluster), axis=0) - np.array([x, z]))
-                for cluster in clusters if isinstance(cluster, (list, np.ndarray)) and len(cluster) > 0
-            ]
-            avg_distance = np.mean(distances) if distances else 0.0
+            avg_distance = float(clusters.centroid_distances([x, z]).mean())
 
-        return (
+        position_cache['key'] = key
+        position_cache['value'] = (
             {
                 'data': data,
                 'layout': go.Layout(
@@ -232,6 +236,7 @@ def register_callbacks(app: Dash):
             str(num_obstacles),
             f'{avg_distance:.2f}'
         )
+        return position_cache['value']
 
     @app.callback(
         [Output('target-speed-display', 'children'),
@@ -239,8 +244,7 @@ def register_callbacks(app: Dash):
         Input('target-speed-slider', 'value')
     )
     def update_target_speed(val):
-        with SHARED_LOCK:
-            SHARED['tank_tar_val_kh'] = val
+        SHARED.publish(tank_tar_val_kh=val)
         return f'현재: {val} km/h', str(val)
 
     @app.callback(
@@ -254,12 +258,15 @@ def register_callbacks(app: Dash):
     def update_pid_values(kp, ki, kd, n_clicks):
         if n_clicks is None:
             return dash.no_update
-        with SHARED_LOCK:
-            SHARED['pid']['kp'] = max(0, float(kp)) if kp is not None else SHARED['pid']['kp']
-            SHARED['pid']['ki'] = max(0, float(ki)) if ki is not None else SHARED['pid']['ki']
-            SHARED['pid']['kd'] = max(0, float(kd)) if kd is not None else SHARED['pid']['kd']
+        def apply(state):
+            pid = thaw(state['pid'])
+            pid['kp'] = max(0, float(kp)) if kp is not None else pid['kp']
+            pid['ki'] = max(0, float(ki)) if ki is not None else pid['ki']
+            pid['kd'] = max(0, float(kd)) if kd is not None else pid['kd']
+            return {'pid': pid}
+        pid = SHARED.update(apply)['pid']
         return html_layout.Div([
-            html_layout.Div(f'[INFO] PID Updated: Kp={SHARED["pid"]["kp"]:.4f}, Ki={SHARED["pid"]["ki"]:.4f}, Kd={SHARED["pid"]["kd"]:.4f}', className='terminal-line')
+            html_layout.Div(f'[INFO] PID Updated: Kp={pid["kp"]:.4f}, Ki={pid["ki"]:.4f}, Kd={pid["kd"]:.4f}', className='terminal-line')
         ])
 
     @app.callback(
@@ -284,99 +291,119 @@ def register_callbacks(app: Dash):
          Input('update-config', 'n_clicks'),
          Input('input-dbscan-eps', 'value'),
          Input('input-dbscan-min-samples', 'value'),
+         Input('input-cluster-backend', 'value'),
          Input('reset-config', 'n_clicks')],
         prevent_initial_call=True
     )
     def update_config_values(move_step, tolerance, obstacle_radius, lookahead_min, lookahead_max, goal_weight,
                             speed_factor, steering_smoothing, heading_smoothing, weight_d, weight_a, weight_w,
-                            weight_s, update_n, dbscan_eps, dbscan_min_samples, reset_n):
+                            weight_s, update_n, dbscan_eps, dbscan_min_samples, cluster_backend, reset_n):
         ctx = dash.callback_context
         if not ctx.triggered:
             return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
         triggered_id = ctx.triggered[0]['prop_id'].split('.')[0]
         if triggered_id == 'reset-config':
-            with SHARED_LOCK:
-                SHARED['CONFIG_PARAMS'] = {
-                    'MOVE_STEP': 0.1,
-                    'TOLERANCE': 1.0,
-                    'OBSTACLE_RADIUS': 1.0,
-                    'LOOKAHEAD_MIN': 2.0,
-                    'LOOKAHEAD_MAX': 10.0,
-                    'GOAL_WEIGHT': 1.0,
-                    'SPEED_FACTOR': 0.5,
-                    'STEERING_SMOOTHING': 0.7,
-                    'HEADING_SMOOTHING': 0.7,
-                    'DBSCAN_EPS': 2.0,
-                    'DBSCAN_MIN_SAMPLES': 2,
-                    'WEIGHT_FACTORS': {'D': 1.0, 'A': 1.0, 'W': 1.0, 'S': 1.0}
-                }
+            config = SHARED.publish(CONFIG_PARAMS={
+                'MOVE_STEP': 0.1,
+                'TOLERANCE': 1.0,
+                'OBSTACLE_RADIUS': 1.0,
+                'LOOKAHEAD_MIN': 2.0,
+                'LOOKAHEAD_MAX': 10.0,
+                'GOAL_WEIGHT': 1.0,
+                'SPEED_FACTOR': 0.5,
+                'STEERING_SMOOTHING': 0.7,
+                'HEADING_SMOOTHING': 0.7,
+                'DBSCAN_EPS': 2.0,
+                'DBSCAN_MIN_SAMPLES': 2,
+                'CLUSTER_BACKEND': 'dbscan',
+                'GRID_RESOLUTION': 0.5,
+                'GRID_INFLATION': 1.0,
+                'GRID_SIZE': 500.0,
+                'FIELD_MAX_DISTANCE': 5.0,
+                'PATH_PLANNER': 'jps',
+                'PATH_CACHE_SIZE': 64,
+                'TURN_RADIUS': 5.0,
+                'LATTICE_HEADINGS': 16,
+                'HYBRID_TIME_BUDGET': 0.05,
+                'ROLLOUT_SAMPLES': 2048,
+                'ROLLOUT_HORIZON': 8,
+                'ROLLOUT_SEED': 0,
+                'CONTROL_RATE_HZ': 20.0,
+                'WEIGHT_FACTORS': {'D': 1.0, 'A': 1.0, 'W': 1.0, 'S': 1.0}
+            })['CONFIG_PARAMS']
             return (
                 html_layout.Ul([
-                    html_layout.Li(f"MOVE_STEP: {SHARED['CONFIG_PARAMS']['MOVE_STEP']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"TOLERANCE: {SHARED['CONFIG_PARAMS']['TOLERANCE']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"OBSTACLE_RADIUS: {SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"LOOKAHEAD_MIN: {SHARED['CONFIG_PARAMS']['LOOKAHEAD_MIN']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"LOOKAHEAD_MAX: {SHARED['CONFIG_PARAMS']['LOOKAHEAD_MAX']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"GOAL_WEIGHT: {SHARED['CONFIG_PARAMS']['GOAL_WEIGHT']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"SPEED_FACTOR: {SHARED['CONFIG_PARAMS']['SPEED_FACTOR']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"STEERING_SMOOTHING: {SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"HEADING_SMOOTHING: {SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"DBSCAN_EPS: {SHARED['CONFIG_PARAMS']['DBSCAN_EPS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"DBSCAN_MIN_SAMPLES: {SHARED['CONFIG_PARAMS']['DBSCAN_MIN_SAMPLES']}", className='py-1 border-b border-gray-800 flex justify-between'),
-                    html_layout.Li(f"WEIGHT_FACTORS: D={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['D']:.2f}, "
-                                   f"A={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['A']:.2f}, "
-                                   f"W={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['W']:.2f}, "
-                                   f"S={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['S']:.2f}", className='py-1 border-b border-gray-800 flex justify-between')
+                    html_layout.Li(f"MOVE_STEP: {config['MOVE_STEP']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"TOLERANCE: {config['TOLERANCE']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"OBSTACLE_RADIUS: {config['OBSTACLE_RADIUS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"LOOKAHEAD_MIN: {config['LOOKAHEAD_MIN']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"LOOKAHEAD_MAX: {config['LOOKAHEAD_MAX']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"GOAL_WEIGHT: {config['GOAL_WEIGHT']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"SPEED_FACTOR: {config['SPEED_FACTOR']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"STEERING_SMOOTHING: {config['STEERING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"HEADING_SMOOTHING: {config['HEADING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"DBSCAN_EPS: {config['DBSCAN_EPS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"DBSCAN_MIN_SAMPLES: {config['DBSCAN_MIN_SAMPLES']}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"CLUSTER_BACKEND: {config['CLUSTER_BACKEND']}", className='py-1 border-b border-gray-800 flex justify-between'),
+                    html_layout.Li(f"WEIGHT_FACTORS: D={config['WEIGHT_FACTORS']['D']:.2f}, "
+                                   f"A={config['WEIGHT_FACTORS']['A']:.2f}, "
+                                   f"W={config['WEIGHT_FACTORS']['W']:.2f}, "
+                                   f"S={config['WEIGHT_FACTORS']['S']:.2f}", className='py-1 border-b border-gray-800 flex justify-between')
                 ], className='list-none'),
                 html_layout.Div([html_layout.Div('[INFO] Configuration Reset', className='terminal-line')]),
-                f'현재: {SHARED["CONFIG_PARAMS"]["MOVE_STEP"]} m',
-                f'현재: {SHARED["CONFIG_PARAMS"]["TOLERANCE"]} m',
-                f'현재: {SHARED["CONFIG_PARAMS"]["OBSTACLE_RADIUS"]} m'
+                f'현재: {config["MOVE_STEP"]} m',
+                f'현재: {config["TOLERANCE"]} m',
+                f'현재: {config["OBSTACLE_RADIUS"]} m'
             )
 
         if triggered_id == 'update-config' and update_n is None:
             return dash.no_update, dash.no_update, dash.no_update, dash.no_update, dash.no_update
 
-        with SHARED_LOCK:
-            SHARED['CONFIG_PARAMS']['MOVE_STEP'] = max(0.01, float(move_step)) if move_step is not None else SHARED['CONFIG_PARAMS']['MOVE_STEP']
-            SHARED['CONFIG_PARAMS']['TOLERANCE'] = max(0.1, float(tolerance)) if tolerance is not None else SHARED['CONFIG_PARAMS']['TOLERANCE']
-            SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS'] = max(0.1, float(obstacle_radius)) if obstacle_radius is not None else SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS']
-            SHARED['CONFIG_PARAMS']['LOOKAHEAD_MIN'] = max(0.1, float(lookahead_min)) if lookahead_min is not None else SHARED['CONFIG_PARAMS']['LOOKAHEAD_MIN']
-            SHARED['CONFIG_PARAMS']['LOOKAHEAD_MAX'] = max(1.0, float(lookahead_max)) if lookahead_max is not None else SHARED['CONFIG_PARAMS']['LOOKAHEAD_MAX']
-            SHARED['CONFIG_PARAMS']['GOAL_WEIGHT'] = max(0.0, float(goal_weight)) if goal_weight is not None else SHARED['CONFIG_PARAMS']['GOAL_WEIGHT']
-            SHARED['CONFIG_PARAMS']['SPEED_FACTOR'] = max(0.0, float(speed_factor)) if speed_factor is not None else SHARED['CONFIG_PARAMS']['SPEED_FACTOR']
-            SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING'] = min(max(0.0, float(steering_smoothing)), 1.0) if steering_smoothing is not None else SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING']
-            SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING'] = min(max(0.0, float(heading_smoothing)), 1.0) if heading_smoothing is not None else SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING']
-            SHARED['CONFIG_PARAMS']['DBSCAN_EPS'] = max(0.1, float(dbscan_eps)) if dbscan_eps is not None else SHARED['CONFIG_PARAMS']['DBSCAN_EPS']
-            SHARED['CONFIG_PARAMS']['DBSCAN_MIN_SAMPLES'] = max(1, int(dbscan_min_samples)) if dbscan_min_samples is not None else SHARED['CONFIG_PARAMS']['DBSCAN_MIN_SAMPLES']
-            SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['D'] = max(0.0, float(weight_d)) if weight_d is not None else SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['D']
-            SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['A'] = max(0.0, float(weight_a)) if weight_a is not None else SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['A']
-            SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['W'] = max(0.0, float(weight_w)) if weight_w is not None else SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['W']
-            SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['S'] = max(0.0, float(weight_s)) if weight_s is not None else SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['S']
+        def apply(state):
+            params = thaw(state['CONFIG_PARAMS'])
+            params['MOVE_STEP'] = max(0.01, float(move_step)) if move_step is not None else params['MOVE_STEP']
+            params['TOLERANCE'] = max(0.1, float(tolerance)) if tolerance is not None else params['TOLERANCE']
+            params['OBSTACLE_RADIUS'] = max(0.1, float(obstacle_radius)) if obstacle_radius is not None else params['OBSTACLE_RADIUS']
+            params['LOOKAHEAD_MIN'] = max(0.1, float(lookahead_min)) if lookahead_min is not None else params['LOOKAHEAD_MIN']
+            params['LOOKAHEAD_MAX'] = max(1.0, float(lookahead_max)) if lookahead_max is not None else params['LOOKAHEAD_MAX']
+            params['GOAL_WEIGHT'] = max(0.0, float(goal_weight)) if goal_weight is not None else params['GOAL_WEIGHT']
+            params['SPEED_FACTOR'] = max(0.0, float(speed_factor)) if speed_factor is not None else params['SPEED_FACTOR']
+            params['STEERING_SMOOTHING'] = min(max(0.0, float(steering_smoothing)), 1.0) if steering_smoothing is not None else params['STEERING_SMOOTHING']
+            params['HEADING_SMOOTHING'] = min(max(0.0, float(heading_smoothing)), 1.0) if heading_smoothing is not None else params['HEADING_SMOOTHING']
+            params['DBSCAN_EPS'] = max(0.1, float(dbscan_eps)) if dbscan_eps is not None else params['DBSCAN_EPS']
+            params['DBSCAN_MIN_SAMPLES'] = max(1, int(dbscan_min_samples)) if dbscan_min_samples is not None else params['DBSCAN_MIN_SAMPLES']
+            params['CLUSTER_BACKEND'] = cluster_backend if cluster_backend else params['CLUSTER_BACKEND']
+            params['WEIGHT_FACTORS']['D'] = max(0.0, float(weight_d)) if weight_d is not None else params['WEIGHT_FACTORS']['D']
+            params['WEIGHT_FACTORS']['A'] = max(0.0, float(weight_a)) if weight_a is not None else params['WEIGHT_FACTORS']['A']
+            params['WEIGHT_FACTORS']['W'] = max(0.0, float(weight_w)) if weight_w is not None else params['WEIGHT_FACTORS']['W']
+            params['WEIGHT_FACTORS']['S'] = max(0.0, float(weight_s)) if weight_s is not None else params['WEIGHT_FACTORS']['S']
+            return {'CONFIG_PARAMS': params}
+        config = SHARED.update(apply)['CONFIG_PARAMS']
 
         return (
             html_layout.Ul([
-                html_layout.Li(f"MOVE_STEP: {SHARED['CONFIG_PARAMS']['MOVE_STEP']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"TOLERANCE: {SHARED['CONFIG_PARAMS']['TOLERANCE']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"OBSTACLE_RADIUS: {SHARED['CONFIG_PARAMS']['OBSTACLE_RADIUS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"LOOKAHEAD_MIN: {SHARED['CONFIG_PARAMS']['LOOKAHEAD_MIN']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"LOOKAHEAD_MAX: {SHARED['CONFIG_PARAMS']['LOOKAHEAD_MAX']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"GOAL_WEIGHT: {SHARED['CONFIG_PARAMS']['GOAL_WEIGHT']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"SPEED_FACTOR: {SHARED['CONFIG_PARAMS']['SPEED_FACTOR']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"STEERING_SMOOTHING: {SHARED['CONFIG_PARAMS']['STEERING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"HEADING_SMOOTHING: {SHARED['CONFIG_PARAMS']['HEADING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"DBSCAN_EPS: {SHARED['CONFIG_PARAMS']['DBSCAN_EPS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"DBSCAN_MIN_SAMPLES: {SHARED['CONFIG_PARAMS']['DBSCAN_MIN_SAMPLES']}", className='py-1 border-b border-gray-800 flex justify-between'),
-                html_layout.Li(f"WEIGHT_FACTORS: D={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['D']:.2f}, "
-                               f"A={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['A']:.2f}, "
-                               f"W={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['W']:.2f}, "
-                               f"S={SHARED['CONFIG_PARAMS']['WEIGHT_FACTORS']['S']:.2f}", className='py-1 border-b border-gray-800 flex justify-between')
+                html_layout.Li(f"MOVE_STEP: {config['MOVE_STEP']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"TOLERANCE: {config['TOLERANCE']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"OBSTACLE_RADIUS: {config['OBSTACLE_RADIUS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"LOOKAHEAD_MIN: {config['LOOKAHEAD_MIN']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"LOOKAHEAD_MAX: {config['LOOKAHEAD_MAX']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"GOAL_WEIGHT: {config['GOAL_WEIGHT']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"SPEED_FACTOR: {config['SPEED_FACTOR']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"STEERING_SMOOTHING: {config['STEERING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"HEADING_SMOOTHING: {config['HEADING_SMOOTHING']:.2f}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"DBSCAN_EPS: {config['DBSCAN_EPS']:.2f} m", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"DBSCAN_MIN_SAMPLES: {config['DBSCAN_MIN_SAMPLES']}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"CLUSTER_BACKEND: {config['CLUSTER_BACKEND']}", className='py-1 border-b border-gray-800 flex justify-between'),
+                html_layout.Li(f"WEIGHT_FACTORS: D={config['WEIGHT_FACTORS']['D']:.2f}, "
+                               f"A={config['WEIGHT_FACTORS']['A']:.2f}, "
+                               f"W={config['WEIGHT_FACTORS']['W']:.2f}, "
+                               f"S={config['WEIGHT_FACTORS']['S']:.2f}", className='py-1 border-b border-gray-800 flex justify-between')
             ], className='list-none'),
             html_layout.Div([html_layout.Div('[INFO] Configuration Updated', className='terminal-line')]),
-            f'현재: {SHARED["CONFIG_PARAMS"]["MOVE_STEP"]:.2f} m',
-            f'현재: {SHARED["CONFIG_PARAMS"]["TOLERANCE"]:.2f} m',
-            f'현재: {SHARED["CONFIG_PARAMS"]["OBSTACLE_RADIUS"]:.2f} m'
+            f'현재: {config["MOVE_STEP"]:.2f} m',
+            f'현재: {config["TOLERANCE"]:.2f} m',
+            f'현재: {config["OBSTACLE_RADIUS"]:.2f} m'
         )
 
     @app.callback(
@@ -384,5 +411,29 @@ def register_callbacks(app: Dash):
         Input('interval', 'n_intervals')
     )
     def update_current_speed(n):
-        with SHARED_LOCK:
-            return str(SHARED['speed_data'][-1] if SHARED['speed_data'] else 0)
\ No newline at end of file
+        return str(SHARED['speed_data'].latest(0))
+
+    @app.callback(
+        [Output('metrics-table', 'children'),
+         Output('metrics-counters', 'children')],
+        Input('interval', 'n_intervals')
+    )
+    def update_metrics(n):
+        # 대시보드가 별도 프로세스면 내비게이션 프로세스가 공유 구역으로 보낸 요약, 아니면 이 프로세스 지표
+        summary = SHARED.get('metrics_summary') or METRICS.summary()
+        cell = 'px-2 py-1 text-right'
+        header = html.Tr([html.Th('단계', className='px-2 py-1 text-left')] +
+                         [html.Th(name, className=cell) for name in ('count', 'p50', 'p95', 'p99')])
+        rows = [
+            html.Tr([html.Td(stage, className='px-2 py-1 text-left')] +
+                    [html.Td('-' if stats[k] is None else str(stats[k]), className=cell)
+                     for k in ('count', 'p50', 'p95', 'p99')])
+            for stage, stats in summary['stages'].items()
+        ]
+        table = html.Table([html.Thead(header), html.Tbody(rows)], className='w-full text-xs text-gray-300')
+        counters = summary['counters']
+        frames = sum(counters.get('tank_frames_total', {}).values())
+        dropped = sum(counters.get('tank_frames_dropped_total', {}).values())
+        lock_wait = counters.get('tank_lock_wait_seconds_total', {})
+        lock_text = ', '.join(f'{name} {seconds * 1000.0:.1f} ms' for name, seconds in lock_wait.items()) or '-'
+        return table, f'프레임 {int(frames)} / 버림 {int(dropped)} / 락 대기 {lock_text}'
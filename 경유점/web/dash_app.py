@@ -2,9 +2,6 @@ from dash import Dash
 from config.shared_config import SERVER_CONFIG
 from web.layout import create_layout
 from web.callbacks import register_callbacks
-import logging
-
-logging.basicConfig(level=logging.DEBUG, filename='logs/dash.log')
 
 def create_dash_app():
     app = Dash(
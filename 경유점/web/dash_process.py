@@ -0,0 +1,185 @@
+import time
+import logging
+import threading
+import multiprocessing
+from multiprocessing.connection import Connection
+from typing import Any, Dict, Mapping, Optional, Tuple
+from config.shared_config import SHARED
+from config.shared_segment import SharedSegment, RINGS
+from config.state_store import StateStore, thaw
+from config.config import TELEMETRY_CAPACITY
+from config.log_config import setup_logging
+from config.metrics import METRICS
+from navigation.obstacle.cluster_store import ClusterStore
+
+logger = logging.getLogger(__name__)
+
+# 대시보드에서 바꿀 수 있고 공유 구역 상태 JSON으로 넘기는 키
+STATE_KEYS = ('CONFIG_PARAMS', 'pid', 'tank_tar_val_kh')
+
+
+def attach_rings(store: StateStore, segment: SharedSegment, copy_history: bool = True):
+    """store의 텔레메트리 링 버퍼를 공유 구역 안의 링 버퍼로 교체 (기존 기록은 복사)."""
+    rings = {}
+    for name, _ in RINGS:
+        ring = segment.ring(name)
+        old = store.get(name)
+        if copy_history and old is not None and len(old):
+            ring.extend(old.last())
+        rings[name] = ring
+    store.publish(**rings)
+
+
+class SegmentPublisher:
+    """내비게이션 프로세스 쪽: 상태 스냅샷을 공유 구역에 옮기고, 대시보드가 보낸 설정 변경을 반영하는 스레드.
+
+    링 버퍼는 공유 구역 안에 있으므로 옮길 필요가 없고, 클러스터와 STATE_KEYS 값만 해당 키의
+    version이 바뀌었을 때 seqlock으로 기록한다 (지표 요약 METRICS.summary()는 metrics_period마다 같이 기록).
+    대시보드 쪽 변경은 Pipe로 받아 store.publish()한다.
+    """
+    def __init__(self, store: StateStore, segment: SharedSegment, conn: Connection, period: float = 0.1,
+                 metrics_period: float = 1.0):
+        self.store = store
+        self.segment = segment
+        self.conn = conn
+        self.period = period
+        self.metrics_period = metrics_period
+        self._synced: Optional[Tuple] = None
+        self._synced_at = 0.0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.writes = 0
+        self.applied = 0
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="segment-publisher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self.conn.poll(self.period):
+                    self.apply(self.conn.recv())
+            except (EOFError, OSError):
+                # 대시보드 프로세스가 끝남: 설정 채널 없이 기록만 계속
+                self._stop.wait(self.period)
+            self.sync()
+
+    def apply(self, changes: Mapping[str, Any]):
+        """대시보드에서 온 변경 반영 (STATE_KEYS 외의 키는 무시)."""
+        changes = {k: v for k, v in changes.items() if k in STATE_KEYS}
+        if changes:
+            self.store.publish(**changes)
+            self.applied += 1
+
+    def sync(self, force: bool = False):
+        """클러스터/설정이 바뀌었으면 공유 구역에 기록."""
+        state = self.store.snapshot()
+        key = tuple(state.key_versions.get(k) for k in ('obstacle_clusters',) + STATE_KEYS)
+        now = time.monotonic()
+        if key == self._synced and not force and now - self._synced_at < self.metrics_period:
+            return
+        clusters = state.get('obstacle_clusters')
+        if not isinstance(clusters, ClusterStore):
+            clusters = ClusterStore.empty()
+        payload = {k: thaw(state[k]) for k in STATE_KEYS}
+        payload['metrics_summary'] = METRICS.summary()
+        self.segment.write(clusters.points, clusters.offsets, clusters.version, payload)
+        self._synced = key
+        self._synced_at = now
+        self.writes += 1
+
+
+class DashBridge:
+    """대시보드 프로세스 쪽: 공유 구역을 로컬 store(SHARED)에 반영하고, 로컬 설정 변경을 Pipe로 보낸다.
+
+    콜백은 기존처럼 SHARED만 읽고 쓰면 된다. 링 버퍼는 공유 구역을 직접 보고, 클러스터/설정은
+    seq가 바뀔 때만 읽어서 게시한다. 공유 구역에서 가져온 값을 게시할 때는 다시 보내지 않는다.
+    """
+    def __init__(self, store: StateStore, segment: SharedSegment, conn: Connection, period: Optional[float] = None):
+        self.store = store
+        self.segment = segment
+        self.conn = conn
+        self.period = period if period is not None else 0.1
+        self._seq = -1
+        self._local = threading.local()
+        self._send_lock = threading.Lock()  # 콜백 스레드 여러 개가 같은 Pipe로 보냄
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        attach_rings(store, segment, copy_history=False)
+        store.subscribe(self._forward)
+
+    def _forward(self, changes: Mapping[str, Any]):
+        if getattr(self._local, "applying", False):
+            return
+        outgoing = {k: thaw(v) for k, v in changes.items() if k in STATE_KEYS}
+        if outgoing:
+            with self._send_lock:
+                self.conn.send(outgoing)
+
+    def poll(self) -> bool:
+        """공유 구역에 새 기록이 있으면 로컬 store에 게시."""
+        result = self.segment.read(self._seq)
+        if result is None:
+            return False
+        self._seq, points, offsets, cluster_version, state = result
+        changes: Dict[str, Any] = {k: v for k, v in state.items() if k in STATE_KEYS}
+        if 'metrics_summary' in state:
+            changes['metrics_summary'] = state['metrics_summary']
+        current = self.store.get('obstacle_clusters')
+        if not isinstance(current, ClusterStore) or current.version != cluster_version:
+            changes['obstacle_clusters'] = ClusterStore(points, offsets, cluster_version)
+        self._local.applying = True
+        try:
+            self.store.publish(**changes)
+        finally:
+            self._local.applying = False
+        return True
+
+    def start(self):
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="dash-bridge", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _run(self):
+        while not self._stop.wait(self.period):
+            try:
+                self.poll()
+            except Exception as e:
+                logger.error("Dash bridge poll failed: %s", e)
+
+
+def run_dash_process(segment_name: str, conn: Connection):
+    """대시보드 프로세스 진입점: 공유 구역에 붙고 Dash 서버 실행."""
+    from web.dash_app import run_dash
+    setup_logging()
+    segment = SharedSegment.attach(segment_name)
+    bridge = DashBridge(SHARED, segment, conn)
+    bridge.poll()
+    bridge.start()
+    run_dash()
+
+
+def start_dash_process(store: StateStore = SHARED) -> Tuple[multiprocessing.Process, SegmentPublisher]:
+    """공유 구역을 만들고 store 기록을 옮긴 뒤, Dash를 별도 프로세스로 시작."""
+    segment = SharedSegment.create(TELEMETRY_CAPACITY)
+    attach_rings(store, segment)
+    parent_conn, child_conn = multiprocessing.Pipe()
+    publisher = SegmentPublisher(store, segment, parent_conn)
+    publisher.sync(force=True)
+    publisher.start()
+    process = multiprocessing.get_context("spawn").Process(
+        target=run_dash_process, args=(segment.name, child_conn), name="dash", daemon=True)
+    process.start()
+    return process, publisher
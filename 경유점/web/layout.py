@@ -81,7 +81,11 @@ def create_layout():
                 ], html.Div([
                     html.Div(className='status-dot status-online blink w-2.5 h-2.5 rounded-full mr-1 bg-green-600'),
                     html.Span('실시간', id='update-status', className='text-xs text-gray-300')
-                ], className='status-indicator flex items-center'))
+                ], className='status-indicator flex items-center')),
+                create_card('단계별 처리 시간 (ms)', 'fa-stopwatch', [
+                    html.Div(id='metrics-table', className='overflow-auto'),
+                    html.Div(id='metrics-counters', className='text-gray-400 text-xs mt-2')
+                ])
             ], className='main-content'),
 
             html.Div([
@@ -148,6 +152,13 @@ def create_layout():
                         dcc.Slider(id='input-dbscan-min-samples', min=1, max=10, step=1, value=config_params.get('DBSCAN_MIN_SAMPLES', 3), marks={i: str(i) for i in range(1, 11, 2)}, className='w-full'),
                         'dbscan-min-samples-display'
                     ),
+                    create_form_group(
+                        'CLUSTER BACKEND (클러스터링 방식)',
+                        dcc.Dropdown(id='input-cluster-backend', options=[
+                            {'label': 'DBSCAN (scikit-learn)', 'value': 'dbscan'},
+                            {'label': 'Grid hash (O(n) 근사)', 'value': 'grid'}
+                        ], value=config_params.get('CLUSTER_BACKEND', 'dbscan'), clearable=False, className='w-full text-gray-900')
+                    ),
                     html.Div('고급 설정', className='section-title text-gray-400 text-sm font-bold mt-5 mb-2.5 pb-1 border-b border-gray-700'),
                     create_form_group(
                         'LOOKAHEAD_MIN (최소 주시 거리, m)',
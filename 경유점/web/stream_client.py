@@ -0,0 +1,101 @@
+import sys
+import math
+import time
+import socket
+import threading
+from typing import Any, Callable, Dict, Optional
+from web.stream_server import send_frame, recv_frame
+from config.shared_config import SERVER_CONFIG
+
+
+class StreamClient:
+    """스트리밍 제어 채널 클라이언트 (시뮬레이터 대역, 부하/지연 측정용).
+
+    연결 하나를 유지하면서 send()로 텔레메트리를 보내고, 받는 스레드가 서버가 밀어 준 명령을
+    latest_command에 두고 on_command를 호출한다.
+    """
+    def __init__(self, host: str = "127.0.0.1", port: Optional[int] = None, tank_id: Optional[str] = None,
+                 on_command: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.sock = socket.create_connection((host, port or SERVER_CONFIG.get('stream_port', 5060)))
+        self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.rfile = self.sock.makefile("rb")
+        self.on_command = on_command
+        self.latest_command: Optional[Dict[str, Any]] = None
+        self.replies: Dict[str, Dict[str, Any]] = {}
+        self._reply_event = threading.Event()
+        self.commands = 0
+        self._reader = threading.Thread(target=self._read, name="stream-client", daemon=True)
+        self._reader.start()
+        if tank_id is not None:
+            self.request({"type": "hello", "tank_id": tank_id})
+
+    def _read(self):
+        while True:
+            try:
+                message = recv_frame(self.rfile)
+            except (OSError, ValueError):
+                break
+            if message is None:
+                break
+            if message.get("type") == "command":
+                self.latest_command = message
+                self.commands += 1
+                if self.on_command is not None:
+                    self.on_command(message)
+            else:
+                self.replies[message.get("type")] = message
+                self._reply_event.set()
+
+    def send(self, message: Dict[str, Any]):
+        send_frame(self.sock, message)
+
+    def request(self, message: Dict[str, Any], timeout: float = 2.0) -> Optional[Dict[str, Any]]:
+        """응답이 있는 메시지(hello, set_destination)를 보내고 응답을 기다림."""
+        kind = message["type"]
+        self.replies.pop(kind, None)
+        self._reply_event.clear()
+        self.send(message)
+        deadline = time.monotonic() + timeout
+        while kind not in self.replies and "error" not in self.replies:
+            if not self._reply_event.wait(max(0.0, deadline - time.monotonic())):
+                return None
+            self._reply_event.clear()
+        return self.replies.get(kind, self.replies.get("error"))
+
+    def close(self):
+        try:
+            self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self.sock.close()
+
+
+def drive(rate_hz: float = 20.0, duration: float = 10.0, tank_id: Optional[str] = None, host: str = "127.0.0.1"):
+    """원을 그리며 움직이는 가짜 텔레메트리를 rate_hz로 보내고, 명령 수신 간격을 출력."""
+    arrivals = []
+    client = StreamClient(host, tank_id=tank_id, on_command=lambda c: arrivals.append(time.perf_counter()))
+    print(client.request({"type": "set_destination", "destination": "150,0,150"}))
+    period = 1.0 / rate_hz
+    started = time.monotonic()
+    next_send = started
+    sent = 0
+    while time.monotonic() - started < duration:
+        t = time.monotonic() - started
+        client.send({"type": "info", "playerPos": {"x": 100 + 20 * math.cos(t), "y": 0, "z": 100 + 20 * math.sin(t)},
+                     "playerSpeed": 10.0, "playerBodyX": math.degrees(t) % 360})
+        sent += 1
+        next_send += period
+        time.sleep(max(0.0, next_send - time.monotonic()))
+    gaps = sorted(b - a for a, b in zip(arrivals, arrivals[1:]))
+    if gaps:
+        print(f"sent={sent} commands={client.commands} gap p50={gaps[len(gaps) // 2] * 1000:.2f} ms "
+              f"p99={gaps[int(len(gaps) * 0.99)] * 1000:.2f} ms last={client.latest_command}")
+    client.close()
+
+
+if __name__ == "__main__":
+    # python -m web.stream_client [rate_hz] [duration_s] [tank_id]
+    args = sys.argv[1:]
+    drive(float(args[0]) if len(args) > 0 else 20.0,
+          float(args[1]) if len(args) > 1 else 10.0,
+          args[2] if len(args) > 2 else None)
@@ -0,0 +1,180 @@
+import json
+import socket
+import struct
+import logging
+import threading
+import socketserver
+from typing import Any, BinaryIO, Dict, Optional
+from navigation.session_manager import SessionManager, Session
+from navigation.pipeline import Mailbox
+from navigation.telemetry import parse_telemetry, parse_batch
+from config.metrics import METRICS
+from config.shared_config import SERVER_CONFIG
+
+logger = logging.getLogger(__name__)
+
+# 메시지 = 4바이트 빅엔디언 길이 + UTF-8 JSON 객체
+_LENGTH = struct.Struct(">I")
+
+
+def send_frame(sock: socket.socket, message: Dict[str, Any]):
+    """JSON 메시지 하나를 길이 접두 형식으로 보냄."""
+    payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+    sock.sendall(_LENGTH.pack(len(payload)) + payload)
+
+
+def recv_frame(rfile: BinaryIO, max_frame: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    """길이 접두 메시지 하나를 읽음. 연결이 닫혔으면 None, 형식 오류는 ValueError."""
+    header = rfile.read(_LENGTH.size)
+    if len(header) < _LENGTH.size:
+        return None
+    (length,) = _LENGTH.unpack(header)
+    max_frame = max_frame or SERVER_CONFIG.get('stream_max_frame', 16 * 1024 * 1024)
+    if length > max_frame:
+        raise ValueError(f"Frame of {length} bytes exceeds {max_frame}")
+    payload = rfile.read(length)
+    if len(payload) < length:
+        return None
+    with METRICS.timer("json_decode"):
+        message = json.loads(payload.decode("utf-8"))
+    if not isinstance(message, dict):
+        raise ValueError("Frame must be a JSON object")
+    return message
+
+
+class StreamConnection(socketserver.StreamRequestHandler):
+    """스트리밍 제어 채널 연결 하나 (시뮬레이터 한 대).
+
+    연결을 유지한 채로 텔레메트리를 계속 받고, 세션의 제어 루프가 새 명령을 게시할 때마다
+    {"type": "command", ...}를 밀어 준다. HTTP처럼 틱마다 연결/헤더 처리를 하지 않고
+    /get_action 폴링도 필요 없다.
+
+    받는 메시지 (type):
+    - hello: {"tank_id": ...}로 세션 선택 (보내지 않으면 기본 세션)
+    - info: /info와 같은 텔레메트리, 파이프라인 수신 단계에 넣음 (반영 오류일 때만 응답)
+    - obstacle: /update_obstacle과 같은 LiDAR 데이터, 파이프라인 수신 단계에 넣음
+    - tick: /tick과 같이 바로 처리하고 명령 계산 (명령은 푸시로 나감)
+    - batch: /info_batch와 같은 {"frames": [...]}, 결과를 응답
+    - set_destination: {"destination": "x,y,z"}, 결과를 응답
+    명령 푸시는 연결마다 단일 칸 우편함을 거쳐 보내는 스레드가 따로 보내므로, 클라이언트가 느려도
+    제어 루프는 막히지 않고 밀린 명령은 최신 것만 남는다.
+    """
+    disable_nagle_algorithm = True
+
+    def setup(self):
+        super().setup()
+        self.session: Optional[Session] = None
+        self.outbox = Mailbox(f"stream-{self.client_address}",
+                              METRICS.counter("tank_frames_dropped_total", stage="stream_push"))
+        self._send_lock = threading.Lock()  # 응답(읽는 스레드)과 푸시(보내는 스레드)가 같은 소켓을 씀
+        self._closed = threading.Event()
+        self._writer = threading.Thread(target=self._write_commands, name="stream-writer", daemon=True)
+        self._writer.start()
+
+    @property
+    def sessions(self) -> SessionManager:
+        return self.server.sessions
+
+    def _bind(self, tank_id: Optional[str]):
+        if self.session is not None:
+            self.session.control_loop.unsubscribe(self.outbox.put)
+        self.session = self.sessions.get(tank_id)
+        self.session.control_loop.subscribe(self.outbox.put)
+        self.outbox.put(self.session.control_loop.latest())
+
+    def _send(self, message: Dict[str, Any]):
+        with self._send_lock:
+            send_frame(self.connection, message)
+
+    def _write_commands(self):
+        while not self._closed.is_set():
+            command = self.outbox.get(timeout=0.5)
+            if command is None:
+                continue
+            try:
+                # 우편함의 명령 dict(구독 콜백/latest()로 받은 것)는 그대로 두고 보낼 메시지를 새로 만듦
+                self._send(dict(command, type="command"))
+            except OSError:
+                break
+
+    def handle(self):
+        logger.info("Stream client connected: %s", self.client_address)
+        while True:
+            try:
+                message = recv_frame(self.rfile)
+            except (ValueError, UnicodeDecodeError) as e:
+                self._send({"type": "error", "message": str(e)})
+                break
+            except OSError:
+                break
+            if message is None:
+                break
+            try:
+                reply = self.dispatch(message)
+            except Exception as e:
+                logger.error("Stream message failed: %s", e)
+                reply = {"type": "error", "message": str(e)}
+            if reply is not None:
+                try:
+                    self._send(reply)
+                except OSError:
+                    break
+
+    def dispatch(self, message: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """메시지 하나 처리. 응답이 필요한 메시지만 응답 dict 반환."""
+        kind = message.pop("type", "info")
+        if kind == "hello":
+            self._bind(message.get("tank_id"))
+            return {"type": "hello", "status": "OK", "session": self.session.session_id}
+        if self.session is None:
+            self._bind(None)
+        else:
+            self.session.touch()
+        if kind == "info":
+            result = self.session.pipeline.submit("info", parse_telemetry(message))
+            return dict(result, type="info") if result["status"] == "ERROR" else None
+        if kind == "obstacle":
+            self.session.pipeline.submit("obstacle", message)
+            return None
+        if kind == "tick":
+            self.session.tick(parse_telemetry(message))
+            return None
+        if kind == "batch":
+            return dict(self.session.ingest_batch(parse_batch(message.get("frames"))), type="batch")
+        if kind == "set_destination":
+            if "destination" not in message:
+                return {"type": "set_destination", "status": "ERROR", "message": "목적지 데이터 누락"}
+            with self.session.lock:
+                result = self.session.navigator.set_destination(message["destination"])
+            return dict(result, type="set_destination")
+        return {"type": "error", "message": f"Unknown message type: {kind}"}
+
+    def finish(self):
+        self._closed.set()
+        if self.session is not None:
+            self.session.control_loop.unsubscribe(self.outbox.put)
+        self.outbox.close()
+        logger.info("Stream client disconnected: %s", self.client_address)
+        super().finish()
+
+
+class StreamServer(socketserver.ThreadingTCPServer):
+    """길이 접두 TCP 스트리밍 제어 서버. 세션은 HTTP 서버와 같은 SessionManager를 쓴다."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, sessions: SessionManager, host: Optional[str] = None, port: Optional[int] = None):
+        self.sessions = sessions
+        address = (host or SERVER_CONFIG['flask_host'],
+                   port if port is not None else SERVER_CONFIG.get('stream_port', 5060))
+        super().__init__(address, StreamConnection)
+
+
+def start_stream_server(sessions: Optional[SessionManager] = None) -> StreamServer:
+    """스트리밍 서버를 백그라운드 스레드로 시작. sessions를 주지 않으면 Flask 앱(web.app)과 같은 것을 쓴다."""
+    if sessions is None:
+        from web.app import sessions
+    server = StreamServer(sessions)
+    threading.Thread(target=server.serve_forever, name="stream-server", daemon=True).start()
+    logger.info("Stream server listening on %s", server.server_address)
+    return server